@@ -83,11 +83,12 @@ from .helpers import (
     label_registry,
     recorder,
     restore_state,
+    startup_cache,
     template,
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
 from .setup import (
@@ -132,6 +133,14 @@ STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
+# Setup times of the previous startups, used to start the
+# integrations on the longest dependency chains first.
+SETUP_TIMINGS_STORAGE_KEY = "core.setup_timings"
+SETUP_TIMINGS_STORAGE_VERSION = 1
+SETUP_TIMINGS_SAVE_DELAY = 10
+# Weight of the latest startup in the stored setup times
+SETUP_TIMINGS_SMOOTHING = 0.5
+
 
 DEBUGGER_INTEGRATIONS = {"debugpy"}
 
@@ -263,6 +272,7 @@ async def async_setup_hass(
         """Create the hass object and do basic setup."""
         hass = core.HomeAssistant(runtime_config.config_dir)
         loader.async_setup(hass)
+        startup_cache.async_setup(hass)
 
         await async_enable_logging(
             hass,
@@ -773,22 +783,39 @@ async def async_setup_multi_components(
     hass: core.HomeAssistant,
     domains: set[str],
     config: dict[str, Any],
+    priorities: dict[str, float] | None = None,
 ) -> None:
-    """Set up multiple domains. Log on failure."""
+    """Set up multiple domains. Log on failure.
+
+    Every domain waits for its dependencies in async_setup_component, so
+    a domain starts as soon as its dependencies are set up. When priorities
+    are given, domains with a higher priority are started first.
+    """
     # Avoid creating tasks for domains that were setup in a previous stage
     domains_not_yet_setup = domains - hass.config.components
     # Create setup tasks for base platforms first since everything will have
     # to wait to be imported, and the sooner we can get the base platforms
     # loaded the sooner we can start loading the rest of the integrations.
+    if priorities:
+        ordered_domains = sorted(
+            domains_not_yet_setup,
+            key=lambda domain: (
+                SETUP_ORDER_SORT_KEY(domain),
+                priorities.get(domain, 0.0),
+            ),
+            reverse=True,
+        )
+    else:
+        ordered_domains = sorted(
+            domains_not_yet_setup, key=SETUP_ORDER_SORT_KEY, reverse=True
+        )
     futures = {
         domain: hass.async_create_task_internal(
             async_setup_component(hass, domain, config),
             f"setup component {domain}",
             eager_start=True,
         )
-        for domain in sorted(
-            domains_not_yet_setup, key=SETUP_ORDER_SORT_KEY, reverse=True
-        )
+        for domain in ordered_domains
     }
     results = await asyncio.gather(*futures.values(), return_exceptions=True)
     for idx, domain in enumerate(futures):
@@ -965,6 +992,49 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+def _setup_priorities(
+    domains: set[str],
+    integration_cache: dict[str, loader.Integration],
+    setup_timings: dict[str, float],
+) -> dict[str, float]:
+    """Return the critical path length of the setup of each domain.
+
+    The critical path length of a domain is its own setup time plus the
+    longest critical path of the domains that wait for it, so starting
+    the domains with the longest critical path first shortens the startup.
+    """
+    dependents: defaultdict[str, list[str]] = defaultdict(list)
+    for domain in domains:
+        if (integration := integration_cache.get(domain)) is None:
+            continue
+        for dependency in chain(
+            integration.dependencies, integration.after_dependencies
+        ):
+            if dependency in domains:
+                dependents[dependency].append(domain)
+
+    priorities: dict[str, float] = {}
+    visiting: set[str] = set()
+
+    def _priority(domain: str) -> float:
+        if (priority := priorities.get(domain)) is not None:
+            return priority
+        if domain in visiting:
+            # after_dependencies may form a cycle
+            return 0.0
+        visiting.add(domain)
+        priority = setup_timings.get(domain, 0.0) + max(
+            (_priority(dependent) for dependent in dependents[domain]), default=0.0
+        )
+        visiting.discard(domain)
+        priorities[domain] = priority
+        return priority
+
+    for domain in domains:
+        _priority(domain)
+    return priorities
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -972,9 +1042,14 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
+    setup_timings_store: Store[dict[str, float]] = Store(
+        hass, SETUP_TIMINGS_STORAGE_VERSION, SETUP_TIMINGS_STORAGE_KEY
+    )
     domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
         hass, config
     )
+    setup_timings = await setup_timings_store.async_load() or {}
+    priorities = _setup_priorities(domains_to_setup, integration_cache, setup_timings)
 
     # Initialize recorder
     if "recorder" in domains_to_setup:
@@ -1020,7 +1095,7 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            await async_setup_multi_components(hass, domain_group, config, priorities)
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -1032,7 +1107,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_1_domains, config, priorities
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -1048,7 +1125,9 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                await async_setup_multi_components(
+                    hass, stage_2_domains, config, priorities
+                )
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -1068,6 +1147,16 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    for domain, domain_setup_time in async_get_setup_timings(hass).items():
+        if (previous := setup_timings.get(domain)) is not None:
+            domain_setup_time = previous + SETUP_TIMINGS_SMOOTHING * (
+                domain_setup_time - previous
+            )
+        setup_timings[domain] = round(domain_setup_time, 3)
+    setup_timings_store.async_delay_save(
+        lambda: setup_timings, SETUP_TIMINGS_SAVE_DELAY
+    )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
@@ -0,0 +1,369 @@
+"""Parallel and incremental generation of backup archives."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+import hashlib
+import io
+import os
+from pathlib import Path
+import tarfile
+import time
+from typing import IO, Any
+import zlib
+
+from securetar import SecureTarFile, atomic_contents_add
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.file import WriteError, write_utf8_file
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
+
+from .const import LOGGER
+
+BUF_SIZE = 2**20 * 4  # 4MB
+
+# Uncompressed size of the chunks of the inner archive, every
+# chunk is compressed to a separate gzip member
+CHUNK_SIZE = 2**22  # 4MB
+# Small members are grouped into chunks of at least this size
+# since every gzip member is compressed on its own
+MIN_CHUNK_SIZE = 2**18  # 256KB
+COMPRESS_LEVEL = 6
+MAX_WORKERS = 8
+# Digits of the size record of the compressed tar member, any size fits
+PAX_SIZE_DIGITS = 20
+
+CHUNK_INDEX_VERSION = 1
+
+
+@dataclass(slots=True)
+class BackupStats:
+    """Statistics of a generated backup."""
+
+    duration: float
+    size: int
+    source_size: int
+    chunks: int
+    reused_chunks: int
+    reused_size: int
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the statistics."""
+        return {
+            **asdict(self),
+            # Uncompressed bytes archived per second
+            "throughput": round(self.source_size / self.duration)
+            if self.duration
+            else 0,
+        }
+
+
+class ChunkIndex:
+    """Locations of the compressed chunks of the most recent backup.
+
+    Chunks are addressed by the SHA-256 of their uncompressed content.
+    A chunk of a new backup that is in the index is copied from the
+    previous backup instead of being compressed again. The index is
+    only used while the previous backup is unchanged.
+    """
+
+    def __init__(
+        self,
+        backup_path: Path | None = None,
+        chunks: dict[str, list[int]] | None = None,
+    ) -> None:
+        """Initialize the index."""
+        self.backup_path = backup_path
+        self.chunks = chunks or {}
+
+    @classmethod
+    def load(cls, index_path: Path) -> ChunkIndex:
+        """Load the index, return an empty index if it can not be used."""
+        try:
+            data = json_loads(index_path.read_bytes())
+            backup_path = index_path.parent / data["backup"]
+            stat = backup_path.stat()
+        except FileNotFoundError:
+            return cls()
+        except (OSError, KeyError, TypeError, *JSON_DECODE_EXCEPTIONS) as err:
+            LOGGER.debug("Ignoring backup chunk index %s: %s", index_path, err)
+            return cls()
+        if (
+            data.get("version") != CHUNK_INDEX_VERSION
+            or data.get("size") != stat.st_size
+            or data.get("mtime_ns") != stat.st_mtime_ns
+        ):
+            LOGGER.debug("Ignoring outdated backup chunk index %s", index_path)
+            return cls()
+        return cls(backup_path, data["chunks"])
+
+    def save(self, index_path: Path) -> None:
+        """Save the index."""
+        assert self.backup_path is not None
+        stat = self.backup_path.stat()
+        try:
+            write_utf8_file(
+                index_path,
+                json_bytes(
+                    {
+                        "version": CHUNK_INDEX_VERSION,
+                        "backup": self.backup_path.name,
+                        "size": stat.st_size,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "chunks": self.chunks,
+                    }
+                ),
+                mode="wb",
+            )
+        except (OSError, WriteError) as err:
+            LOGGER.warning("Could not write backup chunk index %s: %s", index_path, err)
+
+
+class _ChunkWriter:
+    """File object splitting the written data into chunks."""
+
+    def __init__(self, emit: Callable[[bytes], None]) -> None:
+        """Initialize the writer."""
+        self._emit = emit
+        self._buffer = bytearray()
+        self._offset = 0
+
+    def write(self, data: bytes) -> int:
+        """Write data, emitting every full chunk."""
+        buffer = self._buffer
+        buffer += data
+        self._offset += len(data)
+        while len(buffer) >= CHUNK_SIZE:
+            self._emit(bytes(buffer[:CHUNK_SIZE]))
+            del buffer[:CHUNK_SIZE]
+        return len(data)
+
+    def tell(self) -> int:
+        """Return the number of bytes written."""
+        return self._offset
+
+    @property
+    def buffered(self) -> int:
+        """Return the size of the data written since the last chunk."""
+        return len(self._buffer)
+
+    def end_chunk(self) -> None:
+        """Emit the data written since the last chunk."""
+        if self._buffer:
+            self._emit(bytes(self._buffer))
+            self._buffer.clear()
+
+
+class _ChunkedTarFile(tarfile.TarFile):
+    """Tar file aligning chunks to its members.
+
+    Large members start a new chunk so a large file that did not
+    change results in the same chunks regardless of the files before
+    it. Small members are added to the current chunk until it has
+    reached the minimum size.
+    """
+
+    fileobj: _ChunkWriter
+
+    def addfile(
+        self, tarinfo: tarfile.TarInfo, fileobj: IO[bytes] | None = None
+    ) -> None:
+        """Add a member, starting a new chunk if needed."""
+        if self.fileobj.buffered >= MIN_CHUNK_SIZE or tarinfo.size >= MIN_CHUNK_SIZE:
+            self.fileobj.end_chunk()
+        super().addfile(tarinfo, fileobj)
+
+
+class _ParallelGzipWriter:
+    """Compress chunks to gzip members in parallel and write them in order.
+
+    Concatenated gzip members are a valid gzip stream. The number of
+    chunks in flight is bounded so memory use does not depend on the
+    size of the archive.
+    """
+
+    def __init__(
+        self, output: IO[bytes], previous_index: ChunkIndex, workers: int
+    ) -> None:
+        """Initialize the writer."""
+        self._output = output
+        self._previous_chunks = previous_index.chunks
+        self._previous_fd: int | None = None
+        if previous_index.backup_path is not None and self._previous_chunks:
+            try:
+                self._previous_fd = os.open(previous_index.backup_path, os.O_RDONLY)
+            except OSError as err:
+                LOGGER.debug("Not reusing chunks of the previous backup: %s", err)
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix="BackupCompress")
+        self._pending: deque[Future[tuple[str, int, bytes, bool]]] = deque()
+        self._max_pending = workers * 2
+        self.chunks: dict[str, list[int]] = {}
+        self.source_size = 0
+        self.chunk_count = 0
+        self.reused_chunks = 0
+        self.reused_size = 0
+
+    def _process_chunk(self, data: bytes) -> tuple[str, int, bytes, bool]:
+        """Return the digest, size and gzip member of a chunk."""
+        digest = hashlib.sha256(data).hexdigest()
+        if self._previous_fd is not None and (
+            location := self._previous_chunks.get(digest)
+        ):
+            offset, length = location
+            member = os.pread(self._previous_fd, length, offset)
+            if len(member) == length:
+                return digest, len(data), member, True
+        compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, 31)
+        return digest, len(data), compressor.compress(data) + compressor.flush(), False
+
+    def add_chunk(self, data: bytes) -> None:
+        """Queue a chunk to be compressed and written."""
+        self._pending.append(self._pool.submit(self._process_chunk, data))
+        while len(self._pending) > self._max_pending:
+            self._write_next()
+
+    def _write_next(self) -> None:
+        """Write the oldest chunk once it has been compressed."""
+        digest, size, member, reused = self._pending.popleft().result()
+        self.chunks.setdefault(digest, [self._output.tell(), len(member)])
+        self._output.write(member)
+        self.source_size += size
+        self.chunk_count += 1
+        if reused:
+            self.reused_chunks += 1
+            self.reused_size += size
+
+    def flush(self) -> None:
+        """Write all queued chunks."""
+        while self._pending:
+            self._write_next()
+
+    def close(self) -> None:
+        """Release the workers and the previous backup."""
+        for future in self._pending:
+            future.cancel()
+        self._pool.shutdown()
+        if self._previous_fd is not None:
+            os.close(self._previous_fd)
+
+
+def _gzip_stream_header(
+    outer_tar: tarfile.TarFile, tar_info: tarfile.TarInfo, size: int
+) -> bytes:
+    """Return the header of the compressed tar member with a size.
+
+    In the PAX format the size is also written as a zero-padded PAX
+    record, which has priority over the size in the ustar header, so the
+    header has the same length for every size. Without it, sizes that do
+    not fit in the ustar header would add a PAX record.
+    """
+    tar_info.size = size
+    if outer_tar.format == tarfile.PAX_FORMAT:
+        tar_info.pax_headers["size"] = f"{size:0{PAX_SIZE_DIGITS}d}"
+    return tar_info.tobuf(outer_tar.format, outer_tar.encoding, outer_tar.errors)
+
+
+def _add_gzip_stream(
+    outer_tar: tarfile.TarFile,
+    name: str,
+    origin_path: Path,
+    excludes: list[str],
+    writer: _ParallelGzipWriter,
+) -> None:
+    """Add the contents of a directory as a compressed tar to the outer tar.
+
+    The size of the compressed tar is only known after it has been
+    written, so the header of the member is written again afterwards.
+    """
+    tar_info = tarfile.TarInfo(name=name)
+    # Write a PAX header so the header does not change in size
+    # when the size of the member is set.
+    tar_info.mtime = (
+        time.time() if outer_tar.format == tarfile.PAX_FORMAT else int(time.time())
+    )
+    fileobj = outer_tar.fileobj
+    assert fileobj is not None
+    header_offset = fileobj.tell()
+    header = _gzip_stream_header(outer_tar, tar_info, 0)
+    fileobj.write(header)
+
+    chunk_writer = _ChunkWriter(writer.add_chunk)
+    with _ChunkedTarFile(
+        fileobj=chunk_writer,  # type: ignore[arg-type]
+        mode="w",
+        dereference=False,
+        copybufsize=BUF_SIZE,
+    ) as inner_tar:
+        atomic_contents_add(
+            tar_file=inner_tar,
+            origin_path=origin_path,
+            excludes=excludes,
+            arcname="data",
+        )
+    chunk_writer.end_chunk()
+    writer.flush()
+
+    end_offset = fileobj.tell()
+    size = end_offset - header_offset - len(header)
+    if remainder := size % tarfile.BLOCKSIZE:
+        fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+    outer_tar.offset = fileobj.tell()
+    final_header = _gzip_stream_header(outer_tar, tar_info, size)
+    if len(final_header) != len(header):
+        raise OSError(
+            f"Header of {name} changed from {len(header)} to"
+            f" {len(final_header)} bytes"
+        )
+    fileobj.seek(header_offset)
+    fileobj.write(final_header)
+    fileobj.seek(outer_tar.offset)
+
+
+def write_backup_archive(
+    tar_file_path: Path,
+    backup_json: bytes,
+    origin_path: Path,
+    excludes: list[str],
+    index_path: Path,
+) -> BackupStats:
+    """Write a backup of a directory and return its statistics.
+
+    The contents are compressed on all cores in chunks that are written
+    to the archive as soon as they are compressed. Chunks that are the
+    same as in the previous backup are copied from it.
+    """
+    start = time.monotonic()
+    previous_index = ChunkIndex.load(index_path)
+    outer_secure_tarfile = SecureTarFile(
+        tar_file_path, "w", gzip=False, bufsize=BUF_SIZE
+    )
+    with outer_secure_tarfile as outer_tar:
+        tar_info = tarfile.TarInfo(name="./backup.json")
+        tar_info.size = len(backup_json)
+        tar_info.mtime = int(time.time())
+        outer_tar.addfile(tar_info, fileobj=io.BytesIO(backup_json))
+        assert outer_tar.fileobj is not None
+        writer = _ParallelGzipWriter(
+            outer_tar.fileobj, previous_index, min(os.cpu_count() or 1, MAX_WORKERS)
+        )
+        try:
+            _add_gzip_stream(
+                outer_tar, "./homeassistant.tar.gz", origin_path, excludes, writer
+            )
+        finally:
+            writer.close()
+
+    ChunkIndex(tar_file_path, writer.chunks).save(index_path)
+    stats = BackupStats(
+        duration=round(time.monotonic() - start, 3),
+        size=tar_file_path.stat().st_size,
+        source_size=writer.source_size,
+        chunks=writer.chunk_count,
+        reused_chunks=writer.reused_chunks,
+        reused_size=writer.reused_size,
+    )
+    LOGGER.debug("Backup statistics: %s", stats)
+    return stats
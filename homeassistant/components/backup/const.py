@@ -5,6 +5,9 @@ from logging import getLogger
 DOMAIN = "backup"
 LOGGER = getLogger(__package__)
 
+# Index of the chunks of the most recent backup in the backup directory
+CHUNK_INDEX_FILE = ".chunk_index.json"
+
 EXCLUDE_FROM_BACKUP = [
     "__pycache__/*",
     ".DS_Store",
@@ -12,5 +15,6 @@ EXCLUDE_FROM_BACKUP = [
     "*.log.*",
     "*.log",
     "backups/*.tar",
+    f"backups/{CHUNK_INDEX_FILE}",
     "OZW_Log.txt",
 ]
@@ -5,16 +5,12 @@ from __future__ import annotations
 import asyncio
 from dataclasses import asdict, dataclass
 import hashlib
-import io
 import json
 from pathlib import Path
 import tarfile
 from tarfile import TarError
-import time
 from typing import Any, Protocol, cast
 
-from securetar import SecureTarFile, atomic_contents_add
-
 from homeassistant.const import __version__ as HAVERSION
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
@@ -23,9 +19,8 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads_object
 
-from .const import DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER
-
-BUF_SIZE = 2**20 * 4  # 4MB
+from .archive import BUF_SIZE, BackupStats, write_backup_archive
+from .const import CHUNK_INDEX_FILE, DOMAIN, EXCLUDE_FROM_BACKUP, LOGGER
 
 
 @dataclass(slots=True)
@@ -65,6 +60,7 @@ class BackupManager:
         self.platforms: dict[str, BackupPlatformProtocol] = {}
         self.loaded_backups = False
         self.loaded_platforms = False
+        self.last_backup_stats: BackupStats | None = None
 
     @callback
     def _add_platform(
@@ -211,17 +207,18 @@ class BackupManager:
                 "compressed": True,
             }
             tar_file_path = Path(self.backup_dir, f"{backup_data['slug']}.tar")
-            size_in_bytes = await self.hass.async_add_executor_job(
+            stats = await self.hass.async_add_executor_job(
                 self._mkdir_and_generate_backup_contents,
                 tar_file_path,
                 backup_data,
             )
+            self.last_backup_stats = stats
             backup = Backup(
                 slug=slug,
                 name=backup_name,
                 date=date_str,
                 path=tar_file_path,
-                size=round(size_in_bytes / 1_048_576, 2),
+                size=round(stats.size / 1_048_576, 2),
             )
             if self.loaded_backups:
                 self.backups[slug] = backup
@@ -235,33 +232,19 @@ class BackupManager:
         self,
         tar_file_path: Path,
         backup_data: dict[str, Any],
-    ) -> int:
-        """Generate backup contents and return the size."""
+    ) -> BackupStats:
+        """Generate backup contents and return the statistics."""
         if not self.backup_dir.exists():
             LOGGER.debug("Creating backup directory")
             self.backup_dir.mkdir()
 
-        outer_secure_tarfile = SecureTarFile(
-            tar_file_path, "w", gzip=False, bufsize=BUF_SIZE
+        return write_backup_archive(
+            tar_file_path,
+            json_bytes(backup_data),
+            Path(self.hass.config.path()),
+            EXCLUDE_FROM_BACKUP,
+            self.backup_dir / CHUNK_INDEX_FILE,
         )
-        with outer_secure_tarfile as outer_secure_tarfile_tarfile:
-            raw_bytes = json_bytes(backup_data)
-            fileobj = io.BytesIO(raw_bytes)
-            tar_info = tarfile.TarInfo(name="./backup.json")
-            tar_info.size = len(raw_bytes)
-            tar_info.mtime = int(time.time())
-            outer_secure_tarfile_tarfile.addfile(tar_info, fileobj=fileobj)
-            with outer_secure_tarfile.create_inner_tar(
-                "./homeassistant.tar.gz", gzip=True
-            ) as core_tar:
-                atomic_contents_add(
-                    tar_file=core_tar,
-                    origin_path=Path(self.hass.config.path()),
-                    excludes=EXCLUDE_FROM_BACKUP,
-                    arcname="data",
-                )
-
-        return tar_file_path.stat().st_size
 
 
 def _generate_slug(date: str, name: str) -> str:
@@ -35,11 +35,13 @@ async def handle_info(
     """List all stored backups."""
     manager: BackupManager = hass.data[DOMAIN]
     backups = await manager.get_backups()
+    stats = manager.last_backup_stats
     connection.send_result(
         msg["id"],
         {
             "backups": list(backups.values()),
             "backing_up": manager.backing_up,
+            "last_backup_stats": stats.as_dict() if stats else None,
         },
     )
 
@@ -6,11 +6,7 @@ import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import timedelta
-from fnmatch import translate
-from functools import lru_cache
-import itertools
 import logging
-import re
 from typing import Any, Final
 
 import aiodhcpwatcher
@@ -52,6 +48,7 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, format_mac
 from homeassistant.helpers.discovery_flow import DiscoveryKey
+from homeassistant.helpers.discovery_matcher import MatcherIndex
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     async_track_state_added_domain,
@@ -88,8 +85,8 @@ class DhcpMatchers:
     """Prepared info from dhcp entries."""
 
     registered_devices_domains: set[str]
-    no_oui_matchers: dict[str, list[DHCPMatcher]]
-    oui_matchers: dict[str, list[DHCPMatcher]]
+    no_oui_matchers: dict[str, MatcherIndex[str, DHCPMatcher]]
+    oui_matchers: dict[str, MatcherIndex[str, DHCPMatcher]]
 
 
 def async_index_integration_matchers(
@@ -102,23 +99,30 @@ def async_index_integration_matchers(
     1. Registered devices
     2. Devices with no OUI - index by first char of lower() hostname
     3. Devices with OUI - index by OUI
+
+    The hostname patterns of every index are compiled into a matcher index.
     """
     registered_devices_domains: set[str] = set()
-    no_oui_matchers: dict[str, list[DHCPMatcher]] = {}
-    oui_matchers: dict[str, list[DHCPMatcher]] = {}
+    no_oui_matchers: dict[str, MatcherIndex[str, DHCPMatcher]] = {}
+    oui_matchers: dict[str, MatcherIndex[str, DHCPMatcher]] = {}
     for matcher in integration_matchers:
         domain = matcher["domain"]
         if REGISTERED_DEVICES in matcher:
             registered_devices_domains.add(domain)
             continue
 
+        patterns = {HOSTNAME: hostname} if (hostname := matcher.get(HOSTNAME)) else {}
         if mac_address := matcher.get(MAC_ADDRESS):
-            oui_matchers.setdefault(mac_address[:6], []).append(matcher)
+            oui_matchers.setdefault(mac_address[:6], MatcherIndex()).add(
+                patterns, matcher
+            )
             continue
 
-        if hostname := matcher.get(HOSTNAME):
+        if hostname:
             first_char = hostname[0].lower()
-            no_oui_matchers.setdefault(first_char, []).append(matcher)
+            no_oui_matchers.setdefault(first_char, MatcherIndex()).add(
+                patterns, matcher
+            )
 
     return DhcpMatchers(
         registered_devices_domains=registered_devices_domains,
@@ -268,20 +272,16 @@ class WatcherBase:
         lowercase_hostname_first_char = (
             lowercase_hostname[0] if len(lowercase_hostname) else ""
         )
-        for matcher in itertools.chain(
-            matchers.no_oui_matchers.get(lowercase_hostname_first_char, ()),
-            matchers.oui_matchers.get(oui, ()),
+        match_values = {HOSTNAME: lowercase_hostname}
+        for matcher_index in (
+            matchers.no_oui_matchers.get(lowercase_hostname_first_char),
+            matchers.oui_matchers.get(oui),
         ):
-            domain = matcher["domain"]
-            if (
-                matcher_hostname := matcher.get(HOSTNAME)
-            ) is not None and not _memorized_fnmatch(
-                lowercase_hostname, matcher_hostname
-            ):
+            if matcher_index is None:
                 continue
-
-            _LOGGER.debug("Matched %s against %s", data, matcher)
-            matched_domains.add(domain)
+            for matcher in matcher_index.match(match_values):
+                _LOGGER.debug("Matched %s against %s", data, matcher)
+                matched_domains.add(matcher["domain"])
 
         if not matched_domains:
             return  # avoid creating DiscoveryKey if there are no matches
@@ -466,23 +466,3 @@ class RediscoveryWatcher(WatcherBase):
             self._handle_config_entry_removed,
         )
 
-
-@lru_cache(maxsize=4096, typed=True)
-def _compile_fnmatch(pattern: str) -> re.Pattern:
-    """Compile a fnmatch pattern."""
-    return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    DHCP has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
@@ -74,7 +74,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up Diagnostics from a config entry."""
     hass.data[DOMAIN] = DiagnosticsData()
 
-    await integration_platform.async_process_integration_platforms(
+    # Diagnostics are only requested on demand, so the platforms
+    # are imported the first time diagnostics are listed or downloaded.
+    integration_platform.async_register_lazy_integration_platforms(
         hass, DOMAIN, _register_diagnostics_platform
     )
 
@@ -113,11 +115,12 @@ def _register_diagnostics_platform(
 
 @websocket_api.require_admin
 @websocket_api.websocket_command({vol.Required("type"): "diagnostics/list"})
-@callback
-def handle_info(
+@websocket_api.async_response
+async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all possible diagnostic handlers."""
+    await integration_platform.async_load_lazy_integration_platforms(hass, DOMAIN)
     diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
     result = [
         {
@@ -139,12 +142,13 @@ def handle_info(
         vol.Required("domain"): str,
     }
 )
-@callback
-def handle_get(
+@websocket_api.async_response
+async def handle_get(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """List all diagnostic handlers for a domain."""
     domain = msg["domain"]
+    await integration_platform.async_load_lazy_integration_platforms(hass, DOMAIN)
     diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
 
     if (info := diagnostics_data.platforms.get(domain)) is None:
@@ -267,6 +271,7 @@ class DownloadDiagnosticsView(http.HomeAssistantView):
         if (config_entry := hass.config_entries.async_get_entry(d_id)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
 
+        await integration_platform.async_load_lazy_integration_platforms(hass, DOMAIN)
         diagnostics_data: DiagnosticsData = hass.data[DOMAIN]
         if (info := diagnostics_data.platforms.get(config_entry.domain)) is None:
             return web.Response(status=HTTPStatus.NOT_FOUND)
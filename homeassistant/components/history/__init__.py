@@ -21,10 +21,12 @@ from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
 from . import websocket_api
+from .cache import DATA_HISTORY_CACHE, RecentHistoryCache
 from .const import DOMAIN
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 CONF_ORDER = "use_include_order"
+CONF_CACHE_HOURS = "cache_hours"
 
 _ONE_DAY = timedelta(days=1)
 
@@ -35,7 +37,12 @@ CONFIG_SCHEMA = vol.Schema(
             cv.deprecated(CONF_EXCLUDE),
             cv.deprecated(CONF_ORDER),
             INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
-                {vol.Optional(CONF_ORDER, default=False): cv.boolean}
+                {
+                    vol.Optional(CONF_ORDER, default=False): cv.boolean,
+                    vol.Optional(CONF_CACHE_HOURS, default=0): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=48)
+                    ),
+                }
             ),
         )
     },
@@ -48,6 +55,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.http.register_view(HistoryPeriodView())
     frontend.async_register_built_in_panel(hass, "history", "history", "hass:chart-box")
     websocket_api.async_setup(hass)
+    if (conf := config.get(DOMAIN)) and (cache_hours := conf[CONF_CACHE_HOURS]):
+        cache = RecentHistoryCache(hass, timedelta(hours=cache_hours))
+        cache.async_setup()
+        hass.data[DATA_HISTORY_CACHE] = cache
     return True
 
 
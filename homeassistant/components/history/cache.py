@@ -0,0 +1,444 @@
+"""In-memory cache of recent history for the history websocket API."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime as dt, timedelta
+import sys
+from typing import Any
+
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.db_schema import (
+    MAX_STATE_ATTRS_BYTES,
+    StateAttributes,
+)
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+DATA_HISTORY_CACHE: HassKey[RecentHistoryCache] = HassKey(f"{DOMAIN}_cache")
+
+# Upper bound of states kept per entity
+MAX_CACHED_STATES_PER_ENTITY = 4096
+
+# How often states older than the horizon are dropped
+TRIM_INTERVAL = timedelta(minutes=5)
+
+_EMPTY_ATTRIBUTES: dict[str, Any] = {}
+
+
+class _EntityHistory:
+    """Recent states of a single entity stored in compact columns.
+
+    The history is complete from the first stored state onward, which
+    means the state at any point in time after it is known.
+    """
+
+    __slots__ = (
+        "last_updated",
+        "last_changed",
+        "states",
+        "attributes",
+        "last_source_attributes",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the entity history."""
+        self.last_updated = array("d")
+        # 0.0 when last_changed is the same as last_updated
+        self.last_changed = array("d")
+        self.states: list[str | None] = []
+        # Consecutive states with the same attributes share one dict
+        self.attributes: list[dict[str, Any]] = []
+        self.last_source_attributes: Any = None
+
+    def append(self, state: State) -> None:
+        """Append a state to the history."""
+        if state.attributes is self.last_source_attributes:
+            attributes = self.attributes[-1]
+        else:
+            attributes = StateAttributes.recorded_attributes(state)
+            if self.attributes and self.attributes[-1] == attributes:
+                attributes = self.attributes[-1]
+            self.last_source_attributes = state.attributes
+        self._append(
+            sys.intern(state.state),
+            state.last_updated_timestamp,
+            0.0
+            if state.last_changed == state.last_updated
+            else state.last_changed_timestamp,
+            attributes,
+        )
+
+    def append_removed(self, time_fired_ts: float) -> None:
+        """Append the removal of the entity to the history."""
+        self.last_source_attributes = None
+        # The recorder stores the removal without a state
+        self._append(None, time_fired_ts, 0.0, _EMPTY_ATTRIBUTES)
+
+    def _append(
+        self,
+        state: str | None,
+        last_updated_ts: float,
+        last_changed_ts: float,
+        attributes: dict[str, Any],
+    ) -> None:
+        """Append a row to the columns."""
+        self.last_updated.append(last_updated_ts)
+        self.last_changed.append(last_changed_ts)
+        self.states.append(state)
+        self.attributes.append(attributes)
+        if len(self.states) > MAX_CACHED_STATES_PER_ENTITY + (
+            MAX_CACHED_STATES_PER_ENTITY >> 2
+        ):
+            self._drop(len(self.states) - MAX_CACHED_STATES_PER_ENTITY)
+
+    def trim(self, horizon_ts: float) -> None:
+        """Drop the states that are not needed to answer queries after the horizon.
+
+        The last state before the horizon is kept since it
+        is the state at the start of the window.
+        """
+        if (drop := bisect_right(self.last_updated, horizon_ts) - 1) > 0:
+            self._drop(drop)
+
+    def _drop(self, count: int) -> None:
+        """Drop the oldest rows."""
+        del self.last_updated[:count]
+        del self.last_changed[:count]
+        del self.states[:count]
+        del self.attributes[:count]
+
+    def covers(self, start_time_ts: float) -> bool:
+        """Return if the history is complete for a window starting at start_time."""
+        return bool(self.last_updated) and self.last_updated[0] < start_time_ts
+
+    def window(
+        self,
+        domain: str,
+        start_time_ts: float,
+        end_time_ts: float | None,
+        include_start_time_state: bool,
+    ) -> _HistoryWindow:
+        """Return a copy of the rows in a window."""
+        last_updated = self.last_updated
+        first = bisect_right(last_updated, start_time_ts)
+        end = (
+            len(last_updated)
+            if end_time_ts is None
+            else bisect_left(last_updated, end_time_ts, first)
+        )
+        skip = 0
+        if include_start_time_state:
+            start = bisect_left(last_updated, start_time_ts) - 1
+            # Rows at the start time are neither the start time
+            # state nor in the window
+            skip = first - start - 1
+            first = start
+        return _HistoryWindow(
+            domain,
+            start_time_ts,
+            include_start_time_state,
+            skip,
+            last_updated[first:end],
+            self.last_changed[first:end],
+            self.states[first:end],
+            self.attributes[first:end],
+        )
+
+
+class _HistoryWindow:
+    """Rows of an entity history copied for a window.
+
+    The copy is not changed by later states so it can be converted to
+    the compressed state format outside the event loop.
+    """
+
+    __slots__ = (
+        "domain",
+        "start_time_ts",
+        "has_start_time_state",
+        "skip",
+        "last_updated",
+        "last_changed",
+        "states",
+        "attributes",
+    )
+
+    def __init__(
+        self,
+        domain: str,
+        start_time_ts: float,
+        has_start_time_state: bool,
+        skip: int,
+        last_updated: array[float],
+        last_changed: array[float],
+        states: list[str | None],
+        attributes: list[dict[str, Any]],
+    ) -> None:
+        """Initialize the window."""
+        self.domain = domain
+        self.start_time_ts = start_time_ts
+        # The first row is the start time state
+        self.has_start_time_state = has_start_time_state
+        # Number of rows after the start time state not in the window
+        self.skip = skip
+        self.last_updated = last_updated
+        self.last_changed = last_changed
+        self.states = states
+        self.attributes = attributes
+
+    def significant_states(
+        self,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> list[dict[str, Any]]:
+        """Return the states in the window in the compressed state format.
+
+        Matches the output of the recorder history queries.
+        """
+        domain = self.domain
+        start_time_ts = self.start_time_ts
+        include_start_time_state = self.has_start_time_state
+        last_updated = self.last_updated
+        last_changed = self.last_changed
+        states = self.states
+        attributes = self.attributes
+        include_last_changed = not significant_changes_only
+        rows: list[int] = []
+        first = 0
+        if include_start_time_state and states:
+            rows.append(0)
+            first = 1 + self.skip
+        end = len(states)
+        if not significant_changes_only or domain in history.SIGNIFICANT_DOMAINS:
+            rows.extend(range(first, end))
+        else:
+            rows.extend(idx for idx in range(first, end) if not last_changed[idx])
+
+        # Rows with the same attributes share the dict, so the size
+        # is only checked once for each of them.
+        recorded_attributes: dict[int, dict[str, Any]] = {}
+
+        def _recorded_attributes(idx: int) -> dict[str, Any]:
+            row_attributes = attributes[idx]
+            if (recorded := recorded_attributes.get(id(row_attributes))) is None:
+                recorded = recorded_attributes[id(row_attributes)] = (
+                    # The recorder does not store oversized attributes
+                    _EMPTY_ATTRIBUTES
+                    if len(json_bytes(row_attributes)) > MAX_STATE_ATTRS_BYTES
+                    else row_attributes
+                )
+            return recorded
+
+        def _compressed_state(idx: int, with_attributes: bool) -> dict[str, Any]:
+            comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: states[idx]}
+            if with_attributes:
+                comp_state[COMPRESSED_STATE_ATTRIBUTES] = (
+                    _EMPTY_ATTRIBUTES if no_attributes else _recorded_attributes(idx)
+                )
+            if include_start_time_state and idx == 0:
+                # The start time state is reported at the start time
+                comp_state[COMPRESSED_STATE_LAST_UPDATED] = start_time_ts
+                return comp_state
+            comp_state[COMPRESSED_STATE_LAST_UPDATED] = last_updated[idx]
+            if include_last_changed and (last_changed_ts := last_changed[idx]):
+                comp_state[COMPRESSED_STATE_LAST_CHANGED] = last_changed_ts
+            return comp_state
+
+        if not minimal_response or domain in history.NEED_ATTRIBUTE_DOMAINS:
+            return [_compressed_state(idx, True) for idx in rows]
+
+        if not rows:
+            return []
+        # With minimal response only the first state is complete, the
+        # following states only provide changes of the state value.
+        result = [_compressed_state(rows[0], not no_attributes)]
+        prev_state = states[rows[0]]
+        for idx in rows[1:]:
+            if (state := states[idx]) != prev_state:
+                result.append(
+                    {
+                        COMPRESSED_STATE_STATE: state,
+                        COMPRESSED_STATE_LAST_UPDATED: last_updated[idx],
+                    }
+                )
+                prev_state = state
+        return result
+
+
+class CachedHistory:
+    """History of entities in a window copied from the cache."""
+
+    __slots__ = (
+        "_windows",
+        "_significant_changes_only",
+        "_minimal_response",
+        "_no_attributes",
+    )
+
+    def __init__(
+        self,
+        windows: dict[str, _HistoryWindow],
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> None:
+        """Initialize the cached history."""
+        self._windows = windows
+        self._significant_changes_only = significant_changes_only
+        self._minimal_response = minimal_response
+        self._no_attributes = no_attributes
+
+    def significant_states(self) -> dict[str, list[dict[str, Any]]]:
+        """Return significant states in the compressed state format.
+
+        This method may be called from any thread.
+        """
+        result: dict[str, list[dict[str, Any]]] = {}
+        for entity_id, window in self._windows.items():
+            if states := window.significant_states(
+                self._significant_changes_only,
+                self._minimal_response,
+                self._no_attributes,
+            ):
+                result[entity_id] = states
+        return result
+
+
+class RecentHistoryCache:
+    """Cache the recent states of recorded entities.
+
+    States are fed from state_changed events so recent-window history
+    queries can be answered without the database. Queries that start
+    before the history kept for any requested entity are not answered
+    and fall back to the database.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_age: timedelta) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.max_age = max_age
+        self._entities: dict[str, _EntityHistory] = {}
+        self._not_recorded: set[str] = set()
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_setup(self) -> None:
+        """Start filling the cache with the current and future states."""
+        for state in self.hass.states.async_all():
+            if entity_history := self._async_get_entity_history(state.entity_id):
+                entity_history.append(state)
+        self._unsubs = [
+            self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed),
+            async_track_time_interval(
+                self.hass, self._async_trim, TRIM_INTERVAL, name="History cache trim"
+            ),
+        ]
+        self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self._async_stop)
+
+    @callback
+    def _async_stop(self, event: Event) -> None:
+        """Stop filling the cache."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        self._entities.clear()
+
+    @callback
+    def _async_get_entity_history(self, entity_id: str) -> _EntityHistory | None:
+        """Return the history of an entity that is recorded."""
+        if (entity_history := self._entities.get(entity_id)) is not None:
+            return entity_history
+        if entity_id in self._not_recorded:
+            return None
+        instance = get_instance(self.hass)
+        if instance.entity_filter is not None and not instance.entity_filter(entity_id):
+            self._not_recorded.add(entity_id)
+            return None
+        entity_history = self._entities[entity_id] = _EntityHistory()
+        return entity_history
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change to the cache."""
+        if not get_instance(self.hass).enabled:
+            # The recorder does not write states while disabled
+            # so the cached history would have gaps the database
+            # does not have.
+            self._entities.clear()
+            return
+        if not (
+            entity_history := self._async_get_entity_history(event.data["entity_id"])
+        ):
+            return
+        if (new_state := event.data["new_state"]) is None:
+            entity_history.append_removed(event.time_fired_timestamp)
+        else:
+            entity_history.append(new_state)
+
+    @callback
+    def _async_trim(self, now: dt) -> None:
+        """Drop states older than the maximum age."""
+        horizon_ts = (now - self.max_age).timestamp()
+        for entity_history in self._entities.values():
+            entity_history.trim(horizon_ts)
+
+    @callback
+    def async_get_history(
+        self,
+        start_time: dt,
+        end_time: dt | None,
+        entity_ids: list[str],
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> CachedHistory | None:
+        """Return the history of entities in a window.
+
+        Returns None if the cache does not hold the complete
+        history of all entities in the window.
+        """
+        start_time_ts = start_time.timestamp()
+        for entity_id in entity_ids:
+            if (
+                entity_history := self._entities.get(entity_id)
+            ) is None or not entity_history.covers(start_time_ts):
+                return None
+        end_time_ts = end_time.timestamp() if end_time else None
+        return CachedHistory(
+            {
+                entity_id: self._entities[entity_id].window(
+                    split_entity_id(entity_id)[0],
+                    start_time_ts,
+                    end_time_ts,
+                    include_start_time_state,
+                )
+                for entity_id in entity_ids
+            },
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
@@ -5,3 +5,10 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Chunked history responses wait for the client to read
+# the queued messages before the next message is queued
+CHUNKED_MAX_PENDING_MESSAGES = 64
+# Maximum number of states of an entity in a message of a chunked
+# history response, longer histories continue in the next message
+CHUNKED_MAX_STATES = 5000
@@ -0,0 +1,168 @@
+"""Reduce the number of states of numeric history series."""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+
+# Smallest max_points accepted, the first and last state of a
+# series are always kept
+MIN_POINTS = 3
+
+
+def _largest_triangle_three_buckets(
+    xs: array[float], ys: array[float], start: int, end: int, points: int
+) -> list[int]:
+    """Return the indexes of the points kept from xs[start:end].
+
+    The points between the first and the last point are split into
+    points - 2 buckets and the point forming the largest triangle with
+    the previously kept point and the average of the next bucket is
+    kept from each bucket, which preserves the visual shape including
+    the extremes of the series.
+    """
+    count = end - start
+    if points >= count:
+        return list(range(start, end))
+    kept = [start]
+    bucket_size = (count - 2) / (points - 2)
+    prev = start
+    for bucket in range(points - 2):
+        bucket_start = start + 1 + int(bucket * bucket_size)
+        bucket_end = start + 1 + int((bucket + 1) * bucket_size)
+        next_start = bucket_end
+        next_end = min(start + 1 + int((bucket + 2) * bucket_size), end)
+        if next_start >= next_end:
+            next_start, next_end = end - 1, end
+        next_count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / next_count
+        avg_y = sum(ys[next_start:next_end]) / next_count
+        prev_x = xs[prev]
+        prev_y = ys[prev]
+        max_area = -1.0
+        max_idx = bucket_start
+        for idx in range(bucket_start, bucket_end):
+            area = abs(
+                (prev_x - avg_x) * (ys[idx] - prev_y)
+                - (prev_x - xs[idx]) * (avg_y - prev_y)
+            )
+            if area > max_area:
+                max_area = area
+                max_idx = idx
+        kept.append(max_idx)
+        prev = max_idx
+    kept.append(end - 1)
+    return kept
+
+
+def _share_points(lengths: list[int], points: int) -> list[int]:
+    """Share points between runs by their length.
+
+    Every run gets at least one point and at most its length, the
+    total is never more than points. Points left by rounding down go
+    to the runs with the largest remainders.
+    """
+    shares = [1] * len(lengths)
+    spare = points - len(lengths)
+    extra_total = sum(lengths) - len(lengths)
+    if spare <= 0 or not extra_total:
+        return shares
+    if spare >= extra_total:
+        return list(lengths)
+    remainders: list[tuple[int, int]] = []
+    for run_idx, length in enumerate(lengths):
+        extra, remainder = divmod((length - 1) * spare, extra_total)
+        shares[run_idx] += extra
+        remainders.append((remainder, run_idx))
+    left = points - sum(shares)
+    for _, run_idx in sorted(remainders, reverse=True)[:left]:
+        shares[run_idx] += 1
+    return shares
+
+
+def _reduce_run(
+    xs: array[float], ys: array[float], start: int, end: int, points: int
+) -> list[int]:
+    """Return the indexes of at most points points kept from a numeric run."""
+    if points >= MIN_POINTS or points >= end - start:
+        return _largest_triangle_three_buckets(xs, ys, start, end, points)
+    if points == 2:
+        return [start, end - 1]
+    return [start]
+
+
+def downsample_states(
+    states: list[dict[str, Any]], max_points: int
+) -> list[dict[str, Any]]:
+    """Reduce the compressed states of a numeric series to at most max_points states.
+
+    The states and timestamps are read into columns once and the runs
+    of consecutive numeric states are reduced with the largest triangle
+    three buckets algorithm, sharing max_points between the runs by
+    their length. States that are not numeric, for example unavailable,
+    are kept so gaps in the series stay visible. When there are too many
+    of them, every gap is reduced to its first state. Series without any
+    numeric state are returned unchanged.
+    """
+    count = len(states)
+    if count <= max_points:
+        return states
+    xs = array("d", bytes(8 * count))
+    ys = array("d", bytes(8 * count))
+    numeric = bytearray(count)
+    numeric_count = 0
+    for idx, comp_state in enumerate(states):
+        try:
+            ys[idx] = float(comp_state[COMPRESSED_STATE_STATE])
+        except (ValueError, TypeError):
+            continue
+        xs[idx] = comp_state[COMPRESSED_STATE_LAST_UPDATED]
+        numeric[idx] = 1
+        numeric_count += 1
+    if not numeric_count:
+        return states
+
+    # Runs of consecutive numeric and consecutive other states
+    runs: list[tuple[int, int]] = []
+    run_start = 0
+    for idx in range(1, count + 1):
+        if idx == count or numeric[idx] != numeric[run_start]:
+            runs.append((run_start, idx))
+            run_start = idx
+    numeric_runs = [(start, end) for start, end in runs if numeric[start]]
+    gap_runs = len(runs) - len(numeric_runs)
+
+    budget = max_points - (count - numeric_count)
+    keep_gaps = budget >= len(numeric_runs)
+    if not keep_gaps:
+        # Only the first state of every gap is kept
+        budget = max_points - gap_runs
+    if budget < len(numeric_runs):
+        # Not even a point per run fits, keep evenly spaced runs
+        # with the first state of each
+        step = (len(runs) - 1) / (max_points - 1)
+        return [states[runs[round(idx * step)][0]] for idx in range(max_points)]
+
+    shares = iter(_share_points([end - start for start, end in numeric_runs], budget))
+    result: list[dict[str, Any]] = []
+    for start, end in runs:
+        if not numeric[start]:
+            result.extend(states[start:end] if keep_gaps else (states[start],))
+            continue
+        result.extend(
+            states[kept_idx]
+            for kept_idx in _reduce_run(xs, ys, start, end, next(shares))
+        )
+    return result
+
+
+def downsample_history(
+    history: dict[str, list[dict[str, Any]]], max_points: int | None
+) -> dict[str, list[dict[str, Any]]]:
+    """Reduce every series of a history response in place."""
+    if max_points is not None:
+        for entity_id, states in history.items():
+            history[entity_id] = downsample_states(states, max_points)
+    return history
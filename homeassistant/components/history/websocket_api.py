@@ -38,7 +38,14 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .cache import DATA_HISTORY_CACHE, CachedHistory
+from .const import (
+    CHUNKED_MAX_PENDING_MESSAGES,
+    CHUNKED_MAX_STATES,
+    EVENT_COALESCE_TIME,
+    MAX_PENDING_HISTORY_STATES,
+)
+from .downsample import MIN_POINTS, downsample_history
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,27 +79,239 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
+            downsample_history(
+                cast(
+                    dict[str, list[dict[str, Any]]],
+                    history.get_significant_states(
+                        hass,
+                        start_time,
+                        end_time,
+                        entity_ids,
+                        None,
+                        include_start_time_state,
+                        significant_changes_only,
+                        minimal_response,
+                        no_attributes,
+                        True,
+                    ),
+                ),
+                max_points,
             ),
         )
     )
 
 
+def _ws_get_cached_significant_states(
+    msg_id: int, cached: CachedHistory, max_points: int | None
+) -> bytes:
+    """Convert cached history significant_states to json in the executor."""
+    return json_bytes(
+        messages.result_message(
+            msg_id, downsample_history(cached.significant_states(), max_points)
+        )
+    )
+
+
+def _generate_chunk_message(
+    msg_id: int, states: dict[str, list[dict[str, Any]]], partial: bool
+) -> bytes:
+    """Generate a message of a chunked history response."""
+    message: dict[str, Any] = {"states": states}
+    if partial:
+        message["partial"] = True
+    return json_bytes(messages.event_message(msg_id, message))
+
+
+def _ws_get_significant_states_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_id: str,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    max_points: int | None,
+    partial: bool,
+) -> list[bytes]:
+    """Fetch the history of an entity and convert it to json in the executor."""
+    states = cast(
+        dict[str, list[dict[str, Any]]],
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            [entity_id],
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
+    )
+    return _generate_states_chunk_messages(msg_id, states, max_points, partial)
+
+
+def _ws_get_cached_significant_states_chunk(
+    msg_id: int, cached: CachedHistory, max_points: int | None, partial: bool
+) -> list[bytes]:
+    """Convert the cached history of an entity to json in the executor."""
+    return _generate_states_chunk_messages(
+        msg_id, cached.significant_states(), max_points, partial
+    )
+
+
+def _generate_states_chunk_messages(
+    msg_id: int,
+    states: dict[str, list[dict[str, Any]]],
+    max_points: int | None,
+    partial: bool,
+) -> list[bytes]:
+    """Generate the chunk messages of the history of an entity.
+
+    The states are split in messages of at most CHUNKED_MAX_STATES
+    states. Returns no messages if the entity has no history and
+    the chunk is partial.
+    """
+    chunks = [
+        {entity_id: entity_states[idx : idx + CHUNKED_MAX_STATES]}
+        for entity_id, entity_states in downsample_history(states, max_points).items()
+        for idx in range(0, len(entity_states), CHUNKED_MAX_STATES)
+    ]
+    if not chunks:
+        return [] if partial else [_generate_chunk_message(msg_id, {}, False)]
+    last_idx = len(chunks) - 1
+    return [
+        _generate_chunk_message(msg_id, chunk, partial or idx != last_idx)
+        for idx, chunk in enumerate(chunks)
+    ]
+
+
+async def _async_send_chunked_states(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    max_points: int | None,
+) -> None:
+    """Send the history of every entity in separate messages.
+
+    The history of each entity is fetched in its own executor job so
+    the recorder executor is released between entities and only the
+    history of a single entity is held in memory. Long histories are
+    split in several messages. No message is queued while the client
+    is more than CHUNKED_MAX_PENDING_MESSAGES messages behind. All
+    messages except the last are marked partial.
+    """
+    instance = get_instance(hass)
+    cache = hass.data.get(DATA_HISTORY_CACHE)
+    cancelled = False
+
+    @callback
+    def _unsub() -> None:
+        """Stop sending the history."""
+        nonlocal cancelled
+        cancelled = True
+
+    async def _async_get_chunk_messages(entity_id: str, partial: bool) -> list[bytes]:
+        """Fetch the history of an entity as chunk messages."""
+        if (
+            cache is not None
+            and (
+                cached := cache.async_get_history(
+                    start_time,
+                    end_time,
+                    [entity_id],
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                )
+            )
+            is not None
+        ):
+            return await hass.async_add_executor_job(
+                _ws_get_cached_significant_states_chunk,
+                msg_id,
+                cached,
+                max_points,
+                partial,
+            )
+        return await instance.async_add_executor_job(
+            _ws_get_significant_states_chunk,
+            hass,
+            msg_id,
+            start_time,
+            end_time,
+            entity_id,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            max_points,
+            partial,
+        )
+
+    last_idx = len(entity_ids) - 1
+    # The first entity is fetched before the result is sent so
+    # an error is still sent as the response to the request
+    chunk_messages = await _async_get_chunk_messages(entity_ids[0], last_idx != 0)
+    connection.subscriptions[msg_id] = _unsub
+    connection.send_result(msg_id)
+    try:
+        for idx, entity_id in enumerate(entity_ids):
+            if cancelled:
+                return
+            partial = idx != last_idx
+            if idx:
+                try:
+                    chunk_messages = await _async_get_chunk_messages(
+                        entity_id, partial
+                    )
+                except Exception:
+                    # The result has been sent, the client can only
+                    # be told the history has ended
+                    _LOGGER.exception("Error fetching the history of %s", entity_id)
+                    chunk_messages = (
+                        [] if partial else [_generate_chunk_message(msg_id, {}, False)]
+                    )
+            for message in chunk_messages:
+                await connection.async_wait_for_drain(CHUNKED_MAX_PENDING_MESSAGES)
+                if cancelled:
+                    return
+                connection.send_message(message)
+    finally:
+        if not cancelled:
+            # The subscription ends with the last chunk
+            connection.subscriptions.pop(msg_id, None)
+
+
+@callback
+def _async_send_empty_result(
+    connection: ActiveConnection, msg_id: int, chunked: bool
+) -> None:
+    """Send the response to a history_during_period request without history."""
+    if not chunked:
+        connection.send_result(msg_id, {})
+        return
+    connection.send_result(msg_id)
+    connection.send_message(_generate_chunk_message(msg_id, {}, False))
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,15 +322,23 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=MIN_POINTS)),
     }
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle history during period websocket command."""
+    """Handle history during period websocket command.
+
+    In chunked mode the result is sent first and the history of every
+    entity follows in separate event messages, the states of an entity
+    with a long history continue in the next message.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
+    chunked = msg["chunked"]
 
     if start_time := dt_util.parse_datetime(start_time_str):
         start_time = dt_util.as_utc(start_time)
@@ -129,7 +356,7 @@ async def ws_get_history_during_period(
         end_time = None
 
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_result(connection, msg["id"], chunked)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -149,11 +376,49 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_result(connection, msg["id"], chunked)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
+    max_points: int | None = msg.get("max_points")
+
+    if chunked:
+        if not entity_ids:
+            _async_send_empty_result(connection, msg["id"], chunked)
+            return
+        await _async_send_chunked_states(
+            hass,
+            connection,
+            msg["id"],
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            max_points,
+        )
+        return
+
+    if (cache := hass.data.get(DATA_HISTORY_CACHE)) is not None and (
+        cached := cache.async_get_history(
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    ) is not None:
+        connection.send_message(
+            await hass.async_add_executor_job(
+                _ws_get_cached_significant_states, msg["id"], cached, max_points
+            )
+        )
+        return
 
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
@@ -167,6 +432,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            max_points,
         )
     )
 
@@ -220,24 +486,33 @@ def _generate_historical_response(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
     send_empty: bool,
+    cached: CachedHistory | None,
 ) -> tuple[float, dt | None, bytes | None]:
-    """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
-    )
+    """Generate a historical response.
+
+    The states are taken from the cached history if there is one.
+    """
+    if cached is not None:
+        states = cached.significant_states()
+    else:
+        states = cast(
+            dict[str, list[dict[str, Any]]],
+            history.get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                True,
+            ),
+        )
+    downsample_history(states, max_points)
     last_time_ts = 0.0
     for state_list in states.values():
         if (
@@ -275,11 +550,28 @@ async def _async_send_historical_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
     send_empty: bool,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
-    instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    cached: CachedHistory | None = None
+    if entity_ids and (cache := hass.data.get(DATA_HISTORY_CACHE)) is not None:
+        cached = cache.async_get_history(
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    # The cached history does not need the recorder executor
+    add_executor_job = (
+        get_instance(hass).async_add_executor_job
+        if cached is None
+        else hass.async_add_executor_job
+    )
+    last_time_ts, last_time_dt, payload = await add_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
@@ -290,7 +582,9 @@ async def _async_send_historical_states(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        max_points,
         send_empty,
+        cached,
     )
     if payload:
         connection.send_message(payload)
@@ -404,6 +698,7 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=MIN_POINTS)),
     }
 )
 @websocket_api.async_response
@@ -443,6 +738,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    max_points: int | None = msg.get("max_points")
 
     if end_time and end_time <= utc_now:
         if (
@@ -468,6 +764,7 @@ async def ws_stream(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            max_points,
             True,
         )
         return
@@ -532,6 +829,7 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        max_points,
         True,
     )
 
@@ -576,5 +874,6 @@ async def ws_stream(
         significant_changes_only,
         minimal_response,
         no_attributes,
+        max_points,
         send_empty=not last_event_time,
     )
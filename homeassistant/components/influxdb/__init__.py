@@ -7,12 +7,14 @@ from contextlib import suppress
 from dataclasses import dataclass
 import logging
 import math
+from pathlib import Path
 import queue
 import threading
 import time
 from typing import Any
+import zlib
 
-from influxdb import InfluxDBClient, exceptions
+from influxdb import InfluxDBClient, exceptions, line_protocol
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
 from influxdb_client.client.write_api import ASYNCHRONOUS, SYNCHRONOUS
 from influxdb_client.rest import ApiException
@@ -71,6 +73,7 @@ from .const import (
     CONF_OVERRIDE_MEASUREMENT,
     CONF_PRECISION,
     CONF_RETRY_COUNT,
+    CONF_SPOOL_MAX_SIZE,
     CONF_SSL_CA_CERT,
     CONF_TAGS,
     CONF_TAGS_ATTRIBUTES,
@@ -88,20 +91,26 @@ from .const import (
     INFLUX_CONF_TAGS,
     INFLUX_CONF_TIME,
     INFLUX_CONF_VALUE,
+    LINE_PROTOCOL_PRECISION,
     QUERY_ERROR,
     QUEUE_BACKLOG_SECONDS,
     RE_DECIMAL,
     RE_DIGIT_TAIL,
+    REPLAYED_MESSAGE,
     RESUMED_MESSAGE,
     RETRY_DELAY,
     RETRY_INTERVAL,
     RETRY_MESSAGE,
+    SPOOL_DIRECTORY,
+    SPOOL_FULL_MESSAGE,
+    SPOOLED_MESSAGE,
     TEST_QUERY_V1,
     TEST_QUERY_V2,
     TIMEOUT,
     WRITE_ERROR,
     WROTE_MESSAGE,
 )
+from .spool import InfluxSpool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -165,6 +174,8 @@ _CUSTOMIZE_ENTITY_SCHEMA = vol.Schema(
 _INFLUX_BASE_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {
         vol.Optional(CONF_RETRY_COUNT, default=0): cv.positive_int,
+        # Maximum size of the on-disk spool in MB, 0 disables spooling
+        vol.Optional(CONF_SPOOL_MAX_SIZE, default=0): cv.positive_int,
         vol.Optional(CONF_DEFAULT_MEASUREMENT): cv.string,
         vol.Optional(CONF_MEASUREMENT_ATTR, default=DEFAULT_MEASUREMENT_ATTR): vol.In(
             ["unit_of_measurement", "domain__device_class", "entity_id"]
@@ -329,6 +340,7 @@ class InfluxClient:
     write: Callable[[str], None]
     query: Callable[[str, str], list[Any]]
     close: Callable[[], None]
+    write_lines: Callable[[bytes], None]
 
 
 def get_influx_connection(  # noqa: C901
@@ -400,7 +412,8 @@ def get_influx_connection(  # noqa: C901
             else:
                 buckets = []
 
-        return InfluxClient(buckets, write_v2, query_v2, close_v2)
+        # The write API accepts line protocol as the record
+        return InfluxClient(buckets, write_v2, query_v2, close_v2, write_v2)
 
     # Else it's a V1 client
     if CONF_SSL_CA_CERT in conf and conf[CONF_VERIFY_SSL]:
@@ -431,10 +444,10 @@ def get_influx_connection(  # noqa: C901
 
     influx = InfluxDBClient(**kwargs)
 
-    def write_v1(json):
+    def write_v1(json, **kwargs):
         """Write data to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            influx.write_points(json, time_precision=precision, **kwargs)
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -446,6 +459,10 @@ def get_influx_connection(  # noqa: C901
                 raise ValueError(WRITE_ERROR % (json, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
+    def write_lines_v1(lines):
+        """Write line protocol to V1 influx."""
+        write_v1(lines.decode().splitlines(), protocol="line")
+
     def query_v1(query, database=None):
         """Query V1 influx."""
         try:
@@ -472,7 +489,7 @@ def get_influx_connection(  # noqa: C901
     if test_read:
         databases = [db["name"] for db in query_v1(TEST_QUERY_V1)]
 
-    return InfluxClient(databases, write_v1, query_v1, close_v1)
+    return InfluxClient(databases, write_v1, query_v1, close_v1, write_lines_v1)
 
 
 def _retry_setup(hass: HomeAssistant, config: ConfigType) -> None:
@@ -493,7 +510,15 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    spool = None
+    if spool_max_size := conf[CONF_SPOOL_MAX_SIZE]:
+        spool = InfluxSpool(
+            Path(hass.config.path(SPOOL_DIRECTORY)), spool_max_size * 1024 * 1024
+        )
+        spool.load()
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_json, max_tries, spool, conf.get(CONF_PRECISION)
+    )
     instance.start()
 
     def shutdown(event):
@@ -510,7 +535,9 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
 class InfluxThread(threading.Thread):
     """A threaded event handler class."""
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(
+        self, hass, influx, event_to_json, max_tries, spool=None, precision=None
+    ):
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue: queue.SimpleQueue[threading.Event | tuple[float, Event] | None] = (
@@ -520,6 +547,11 @@ class InfluxThread(threading.Thread):
         self.event_to_json = event_to_json
         self.max_tries = max_tries
         self.write_errors = 0
+        self.spool: InfluxSpool | None = spool
+        self.precision = precision
+        self.spooled_events = 0
+        # Batches are spooled without trying to write them until then
+        self.spool_until = 0.0
         self.shutdown = False
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
@@ -540,6 +572,7 @@ class InfluxThread(threading.Thread):
 
         count = 0
         json = []
+        backlog = []
 
         dropped = 0
 
@@ -558,6 +591,9 @@ class InfluxThread(threading.Thread):
                     if age < queue_seconds:
                         if event_json := self.event_to_json(event):
                             json.append(event_json)
+                    elif self.spool is not None:
+                        if event_json := self.event_to_json(event):
+                            backlog.append(event_json)
                     else:
                         dropped += 1
                 elif isinstance(item, threading.Event):
@@ -565,11 +601,18 @@ class InfluxThread(threading.Thread):
 
         if dropped:
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
+        if backlog:
+            # Old events are spooled instead of dropped to catch up
+            self.spool_events(backlog)
 
         return count, json
 
     def write_to_influxdb(self, json):
         """Write preprocessed events to influxdb, with retry."""
+        if self.spool is not None and time.monotonic() < self.spool_until:
+            self.spool_events(json)
+            return
+
         for retry in range(self.max_tries + 1):
             try:
                 self.influx.write(json)
@@ -579,6 +622,8 @@ class InfluxThread(threading.Thread):
                     self.write_errors = 0
 
                 _LOGGER.debug(WROTE_MESSAGE, len(json))
+                if self.spool:
+                    self.replay_spool()
                 break
             except ValueError as err:
                 _LOGGER.error(err)
@@ -586,11 +631,58 @@ class InfluxThread(threading.Thread):
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
+                elif self.spool is not None:
+                    if not self.spooled_events:
+                        _LOGGER.error(SPOOLED_MESSAGE, err)
+                    self.spool_events(json)
+                    self.spool_until = time.monotonic() + RETRY_DELAY
                 else:
                     if not self.write_errors:
                         _LOGGER.error(err)
                     self.write_errors += len(json)
 
+    def spool_events(self, json):
+        """Spool events as line protocol to be written later."""
+        assert self.spool is not None
+        lines = line_protocol.make_lines(
+            {"points": json}, LINE_PROTOCOL_PRECISION.get(self.precision)
+        )
+        try:
+            dropped = self.spool.append(lines.encode())
+        except OSError as err:
+            _LOGGER.error("Could not spool %d events: %s", len(json), err)
+            return
+        self.spooled_events += len(json)
+        if dropped:
+            _LOGGER.warning(SPOOL_FULL_MESSAGE, dropped)
+
+    def replay_spool(self):
+        """Write the spooled events, oldest first."""
+        assert self.spool is not None
+        replayed = 0
+        for segment in self.spool.segments:
+            if self.shutdown:
+                break
+            try:
+                lines = self.spool.read(segment)
+            except (OSError, EOFError, zlib.error) as err:
+                _LOGGER.error("Could not read spooled events %s: %s", segment, err)
+                self.spool.remove(segment)
+                continue
+            try:
+                self.influx.write_lines(lines)
+            except ValueError as err:
+                _LOGGER.error(err)
+            except ConnectionError:
+                self.spool_until = time.monotonic() + RETRY_DELAY
+                return
+            self.spool.remove(segment)
+            replayed += lines.count(b"\n")
+
+        if replayed:
+            _LOGGER.warning(REPLAYED_MESSAGE, replayed)
+        self.spooled_events = 0
+
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
@@ -33,6 +33,7 @@ CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
 CONF_SSL_CA_CERT = "ssl_ca_cert"
+CONF_SPOOL_MAX_SIZE = "spool_max_size"
 
 CONF_QUERIES = "queries"
 CONF_QUERIES_FLUX = "queries_flux"
@@ -78,6 +79,10 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+SPOOL_DIRECTORY = ".influxdb_spool"
+SPOOL_SEGMENT_SUFFIX = ".lp.gz"
+# Precision names of the line protocol encoder by configured precision
+LINE_PROTOCOL_PRECISION = {"ms": "ms", "s": "s", "us": "u", "ns": "n"}
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -119,6 +124,9 @@ QUERY_ERROR = (
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
+SPOOLED_MESSAGE = "InfluxDB is not available, spooling events to disk: %s"
+SPOOL_FULL_MESSAGE = "InfluxDB spool is full, dropped %d bytes of old events."
+REPLAYED_MESSAGE = "Resumed, replayed %d spooled events."
 WROTE_MESSAGE = "Wrote %d events."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
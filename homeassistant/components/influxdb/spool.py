@@ -0,0 +1,84 @@
+"""Write-ahead spool for events that could not be written to InfluxDB."""
+
+from __future__ import annotations
+
+import gzip
+import itertools
+import logging
+import os
+from pathlib import Path
+import time
+
+from .const import SPOOL_SEGMENT_SUFFIX
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class InfluxSpool:
+    """Bounded on-disk spool of line protocol batches.
+
+    Every batch is stored gzip compressed in its own segment file. The
+    segments are named by the time they were spooled so they are replayed
+    in order. When the spool exceeds its maximum size the oldest
+    segments are dropped. The spool is only used from the InfluxDB
+    thread.
+    """
+
+    def __init__(self, path: Path, max_size: int) -> None:
+        """Initialize the spool."""
+        self.path = path
+        self.max_size = max_size
+        self._counter = itertools.count()
+        self._segments: dict[Path, int] = {}
+        self.size = 0
+
+    def load(self) -> None:
+        """Load the segments left by a previous run."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        for segment in sorted(self.path.glob(f"*{SPOOL_SEGMENT_SUFFIX}")):
+            size = segment.stat().st_size
+            self._segments[segment] = size
+            self.size += size
+        if self._segments:
+            _LOGGER.debug(
+                "Found %d spooled InfluxDB segments (%d bytes)",
+                len(self._segments),
+                self.size,
+            )
+
+    def __bool__(self) -> bool:
+        """Return if there are spooled segments."""
+        return bool(self._segments)
+
+    @property
+    def segments(self) -> list[Path]:
+        """Return the segments, oldest first."""
+        return list(self._segments)
+
+    def append(self, lines: bytes) -> int:
+        """Spool a batch and return the number of dropped bytes."""
+        data = gzip.compress(lines)
+        segment = self.path / (
+            f"{time.time_ns():020d}-{next(self._counter):06d}{SPOOL_SEGMENT_SUFFIX}"
+        )
+        tmp_segment = segment.with_suffix(".tmp")
+        tmp_segment.write_bytes(data)
+        os.replace(tmp_segment, segment)
+        self._segments[segment] = len(data)
+        self.size += len(data)
+
+        dropped = 0
+        while self.size > self.max_size and len(self._segments) > 1:
+            oldest = next(iter(self._segments))
+            dropped += self._segments[oldest]
+            self.remove(oldest)
+        return dropped
+
+    def read(self, segment: Path) -> bytes:
+        """Return the line protocol of a segment."""
+        return gzip.decompress(segment.read_bytes())
+
+    def remove(self, segment: Path) -> None:
+        """Remove a segment after it has been written."""
+        self.size -= self._segments.pop(segment)
+        segment.unlink(missing_ok=True)
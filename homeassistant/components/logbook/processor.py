@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Callable, Generator, Sequence
 from dataclasses import dataclass
 from datetime import datetime as dt
+from itertools import islice
 import logging
 import time
 from typing import TYPE_CHECKING, Any
@@ -84,6 +85,10 @@ from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum number of logbook events humanified at once
+# when the events are consumed in pages
+EVENTS_PAGE_SIZE = 1000
+
 
 @dataclass(slots=True)
 class LogbookRun:
@@ -156,6 +161,23 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        return [
+            event
+            for page in self.iter_event_pages(start_day, end_day)
+            for event in page
+        ]
+
+    def iter_event_pages(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> Generator[list[dict[str, Any]]]:
+        """Get events for a period of time in pages of EVENTS_PAGE_SIZE events.
+
+        Rows are fetched from the database as the pages are consumed so
+        the session stays open until the generator is exhausted or closed.
+        All pages share the caches of the logbook run.
+        """
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -180,9 +202,17 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            events = _humanify(
+                self.hass,
+                execute_stmt_lambda_element(
+                    session, stmt, start_day, end_day, orm_rows=False
+                ),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
             )
+            while page := list(islice(events, EVENTS_PAGE_SIZE)):
+                yield page
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
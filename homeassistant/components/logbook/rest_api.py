@@ -82,10 +82,10 @@ class LogbookView(HomeAssistantView):
             start_day = dt_util.as_utc(datetime_dt) - timedelta(days=period - 1)
             end_day = start_day + timedelta(days=period)
         else:
-            start_day = datetime_dt
+            start_day = dt_util.as_utc(datetime_dt)
             if (end_day_dt := dt_util.parse_datetime(end_time_str)) is None:
                 return self.json_message("Invalid end_time", HTTPStatus.BAD_REQUEST)
-            end_day = end_day_dt
+            end_day = dt_util.as_utc(end_day_dt)
 
         hass = request.app[KEY_HASS]
 
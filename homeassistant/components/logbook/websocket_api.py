@@ -30,6 +30,9 @@ from .models import LogbookConfig, async_event_to_row
 from .processor import EventProcessor
 
 MAX_PENDING_LOGBOOK_EVENTS = 2048
+# Number of messages the client can be behind before
+# the next page of historical events is sent
+MAX_PENDING_HISTORICAL_MESSAGES = 4
 EVENT_COALESCE_TIME = 0.35
 # minimum size that we will split the query
 BIG_QUERY_HOURS = 25
@@ -102,67 +105,73 @@ async def _async_send_historical_events(
     )
 
     if not is_big_query:
-        message, last_event_time = await _async_get_ws_stream_events(
+        return await _async_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
             event_processor,
             partial,
+            force_send,
         )
-        # If there is no last_event_time, there are no historical
-        # results, but we still send an empty message
-        # if its the last one (not partial) so
-        # consumers of the api know their request was
-        # answered but there were no results
-        if last_event_time or not partial or force_send:
-            connection.send_message(message)
-        return last_event_time
 
     # This is a big query so we deliver
     # the first three hours and then
     # we fetch the old data
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
-    recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
+    recent_query_last_event_time = await _async_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
         event_processor,
         partial=True,
+        force_send=False,
     )
-    if recent_query_last_event_time:
-        connection.send_message(recent_message)
-
-    older_message, older_query_last_event_time = await _async_get_ws_stream_events(
+    older_query_last_event_time = await _async_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
         event_processor,
         partial,
+        force_send,
     )
-    # If there is no last_event_time, there are no historical
-    # results, but we still send an empty message
-    # if its the last one (not partial) so
-    # consumers of the api know their request was
-    # answered but there were no results
-    if older_query_last_event_time or not partial or force_send:
-        connection.send_message(older_message)
 
     # Returns the time of the newest event
     return recent_query_last_event_time or older_query_last_event_time
 
 
-async def _async_get_ws_stream_events(
+async def _async_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
     event_processor: EventProcessor,
     partial: bool,
-) -> tuple[bytes, dt | None]:
-    """Async wrapper around _ws_formatted_get_events."""
+    force_send: bool,
+) -> dt | None:
+    """Async wrapper around _ws_stream_get_events."""
+
+    async def _async_send_message(message: bytes) -> None:
+        """Send a message once the client has read the previous pages."""
+        await connection.async_wait_for_drain(MAX_PENDING_HISTORICAL_MESSAGES)
+        connection.send_message(message)
+
+    def _send_message(message: bytes) -> None:
+        """Send a message from the executor.
+
+        Blocks the executor while the client is behind so the
+        pages are not queued faster than they are written.
+        """
+        asyncio.run_coroutine_threadsafe(
+            _async_send_message(message), hass.loop
+        ).result()
+
     return await get_instance(hass).async_add_executor_job(
         _ws_stream_get_events,
         msg_id,
@@ -170,6 +179,8 @@ async def _async_get_ws_stream_events(
         end_time,
         event_processor,
         partial,
+        force_send,
+        _send_message,
     )
 
 
@@ -190,20 +201,40 @@ def _ws_stream_get_events(
     end_day: dt,
     event_processor: EventProcessor,
     partial: bool,
-) -> tuple[bytes, dt | None]:
-    """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
-    last_time = None
-    if events:
-        last_time = dt_util.utc_from_timestamp(events[-1]["when"])
-    message = _generate_stream_message(events, start_day, end_day)
+    force_send: bool,
+    send_message: Callable[[bytes], None],
+) -> dt | None:
+    """Fetch events and send them as json in pages from the executor.
+
+    Every page is sent as soon as it has been converted so the
+    events of a long period are never held in memory at once.
+    Returns the time of the most recent event.
+    """
+    last_time: dt | None = None
+    page: list[dict[str, Any]] = []
+    for next_page in event_processor.iter_event_pages(start_day, end_day):
+        if page:
+            # This is a hint to consumers of the api that
+            # we are about to send a another block of historical
+            # data in case the UI needs to show that historical
+            # data is still loading in the future
+            message = _generate_stream_message(page, start_day, end_day)
+            message["partial"] = True
+            send_message(json_bytes(messages.event_message(msg_id, message)))
+        page = next_page
+    if page:
+        last_time = dt_util.utc_from_timestamp(page[-1]["when"])
+    elif partial and not force_send:
+        # There are no historical results, but we still send an
+        # empty message if its the last one (not partial) so
+        # consumers of the api know their request was
+        # answered but there were no results
+        return None
+    message = _generate_stream_message(page, start_day, end_day)
     if partial:
-        # This is a hint to consumers of the api that
-        # we are about to send a another block of historical
-        # data in case the UI needs to show that historical
-        # data is still loading in the future
         message["partial"] = True
-    return json_bytes(messages.event_message(msg_id, message)), last_time
+    send_message(json_bytes(messages.event_message(msg_id, message)))
+    return last_time
 
 
 async def _async_events_consumer(
@@ -433,11 +464,24 @@ def _ws_formatted_get_events(
     end_time: dt,
     event_processor: EventProcessor,
 ) -> bytes:
-    """Fetch events and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id, event_processor.get_events(start_time, end_time)
-        )
+    """Fetch events and convert them to json in the executor.
+
+    The events are converted in pages so only the json
+    of the previous pages is held in memory.
+    """
+    return messages.construct_result_message(
+        msg_id,
+        b"".join(
+            (
+                b"[",
+                b",".join(
+                    # Strip the brackets of the json array of the page
+                    json_bytes(page)[1:-1]
+                    for page in event_processor.iter_event_pages(start_time, end_time)
+                ),
+                b"]",
+            )
+        ),
     )
 
 
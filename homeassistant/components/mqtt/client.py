@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
-from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
+from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable, Iterator
 import contextlib
 from dataclasses import dataclass
-from functools import lru_cache, partial
+from functools import partial
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -267,12 +267,119 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _TopicTrieNode:
+    """Node of the wildcard subscription trie, one per topic level."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode] = {}
+        self.subscriptions: set[Subscription] = set()
+
+
+class WildcardSubscriptionTrie:
+    """Index wildcard subscriptions by topic level.
+
+    Subscriptions are stored in a trie keyed by the levels of their topic
+    filter, where `+` and `#` are regular keys. Matching a topic only visits
+    the branches that can match, so the cost depends on the number of levels
+    and matching filters instead of the total number of subscriptions.
+    The index is updated incrementally when subscriptions are added or removed.
+    """
+
+    __slots__ = ("_root", "_topics", "_size")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicTrieNode()
+        self._topics: defaultdict[str, int] = defaultdict(int)
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions in the trie."""
+        return self._size
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over all subscriptions in the trie."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if a subscription with the exact topic filter exists."""
+        return topic in self._topics
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the trie."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        if subscription in node.subscriptions:
+            return
+        node.subscriptions.add(subscription)
+        self._topics[subscription.topic] += 1
+        self._size += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription from the trie.
+
+        Raises KeyError if the subscription is not in the trie.
+        """
+        topic = subscription.topic
+        path: list[tuple[_TopicTrieNode, str]] = []
+        node = self._root
+        for level in topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        self._size -= 1
+        if (count := self._topics[topic] - 1) == 0:
+            del self._topics[topic]
+        else:
+            self._topics[topic] = count
+        # Prune the branch up to the first node that is still in use
+        for parent, level in reversed(path):
+            if node.children or node.subscriptions:
+                break
+            del parent.children[level]
+            node = parent
+
+    def iter_match(self, topic: str) -> Iterator[Subscription]:
+        """Iterate over the subscriptions with a filter matching the topic.
+
+        Follows the MQTT specification: `+` matches exactly one level, `#`
+        matches the parent level and any number of child levels, and
+        wildcards at the first level do not match topics starting with `$`.
+        """
+        levels = topic.split("/")
+        num_levels = len(levels)
+        wildcards_at_root = not topic.startswith("$")
+        stack = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+            wildcards_allowed = index > 0 or wildcards_at_root
+            if wildcards_allowed and (multi_level := children.get("#")) is not None:
+                yield from multi_level.subscriptions
+            if index == num_levels:
+                yield from node.subscriptions
+                continue
+            if (child := children.get(levels[index])) is not None:
+                stack.append((child, index + 1))
+            if wildcards_allowed and (single_level := children.get("+")) is not None:
+                stack.append((single_level, index + 1))
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -376,7 +483,7 @@ class MQTT:
         self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
             set
         )
-        self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscriptions = WildcardSubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -624,8 +731,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions.has_topic(topic)
         )
 
     async def async_publish(
@@ -741,15 +848,12 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
@@ -761,8 +865,6 @@ class MQTT:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -835,11 +937,9 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -851,7 +951,6 @@ class MQTT:
     def _async_remove(self, subscription: Subscription) -> None:
         """Remove subscription."""
         self._async_untrack_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
         # Only unsubscribe if currently connected
@@ -1044,18 +1143,12 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscriptions.iter_match(topic))
         return subscriptions
 
     @callback
@@ -1247,13 +1340,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
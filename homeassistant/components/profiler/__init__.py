@@ -24,7 +24,15 @@ from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
-from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.integration_platform import (
+    async_get_lazy_integration_platforms_report,
+)
+from homeassistant.helpers.json import save_json
+from homeassistant.helpers.service import (
+    async_get_entity_service_call_latency,
+    async_register_admin_service,
+)
+from homeassistant.setup import async_get_setup_spans
 
 from .const import DOMAIN
 
@@ -40,6 +48,9 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_DUMP_STARTUP_TRACE = "dump_startup_trace"
+SERVICE_LOG_LAZY_PLATFORM_IMPORTS = "log_lazy_platform_imports"
+SERVICE_LOG_ENTITY_SERVICE_CALL_LATENCY = "log_entity_service_call_latency"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +74,9 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_DUMP_STARTUP_TRACE,
+    SERVICE_LOG_LAZY_PLATFORM_IMPORTS,
+    SERVICE_LOG_ENTITY_SERVICE_CALL_LATENCY,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -260,6 +274,63 @@ async def async_setup_entry(  # noqa: C901
                 if not handle.cancelled():
                     _LOGGER.critical("Scheduled: %s", handle)
 
+    async def _async_dump_startup_trace(call: ServiceCall) -> None:
+        """Write the setup of the integrations during startup to a trace file."""
+        trace_path = hass.config.path(
+            f"startup_trace.{int(time.time() * 1000000)}.json"
+        )
+        trace = _startup_trace(async_get_setup_spans(hass))
+        await hass.async_add_executor_job(save_json, trace_path, trace)
+        persistent_notification.async_create(
+            hass,
+            (
+                f"Wrote the startup trace to {trace_path}, it can be opened"
+                " in https://ui.perfetto.dev or chrome://tracing"
+            ),
+            title="Startup trace",
+            notification_id="profile_startup_trace",
+        )
+
+    async def _async_dump_lazy_platform_imports(call: ServiceCall) -> None:
+        """Log the platforms imported on demand and how long it took."""
+        for platform_name, report in async_get_lazy_integration_platforms_report(
+            hass
+        ).items():
+            _LOGGER.critical(
+                "Imported %s of %s %s platforms in %.3fs: %s",
+                report["imported"],
+                report["providers"],
+                platform_name,
+                report["import_time"],
+                ", ".join(
+                    f"{domain} ({import_time:.3f}s)"
+                    for domain, import_time in sorted(
+                        report["import_times"].items(),
+                        key=lambda item: item[1],
+                        reverse=True,
+                    )
+                ),
+            )
+
+    async def _async_dump_entity_service_call_latency(call: ServiceCall) -> None:
+        """Log the latency of the entity service calls, slowest first."""
+        for (domain, service, platform_name), latency in sorted(
+            async_get_entity_service_call_latency(hass).items(),
+            key=lambda item: item[1].maximum,
+            reverse=True,
+        ):
+            _LOGGER.critical(
+                "Latency of %s.%s for %s entities: %s calls, mean %.3fs,"
+                " max %.3fs, buckets %s",
+                domain,
+                service,
+                platform_name,
+                latency.count,
+                latency.total / latency.count,
+                latency.maximum,
+                latency.as_dict()["buckets"],
+            )
+
     async def _async_asyncio_debug(call: ServiceCall) -> None:
         """Enable or disable asyncio debug."""
         enabled = call.data[CONF_ENABLED]
@@ -382,6 +453,27 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DUMP_STARTUP_TRACE,
+        _async_dump_startup_trace,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_LAZY_PLATFORM_IMPORTS,
+        _async_dump_lazy_platform_imports,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_ENTITY_SERVICE_CALL_LATENCY,
+        _async_dump_entity_service_call_latency,
+    )
+
     return True
 
 
@@ -395,6 +487,34 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+def _startup_trace(spans: dict[str, tuple[float, float]]) -> dict[str, Any]:
+    """Return the setup of the integrations in the Trace Event Format."""
+    first = min((start for start, _ in spans.values()), default=0.0)
+    # Setups that overlap are shown on separate lanes
+    lane_ends: list[float] = []
+    events: list[dict[str, Any]] = []
+    for domain, (start, end) in sorted(spans.items(), key=lambda item: item[1]):
+        lane = next(
+            (idx for idx, lane_end in enumerate(lane_ends) if lane_end <= start),
+            len(lane_ends),
+        )
+        if lane == len(lane_ends):
+            lane_ends.append(end)
+        lane_ends[lane] = end
+        events.append(
+            {
+                "name": domain,
+                "cat": "setup",
+                "ph": "X",
+                "ts": round((start - first) * 1000000),
+                "dur": round((end - start) * 1000000),
+                "pid": 1,
+                "tid": lane,
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
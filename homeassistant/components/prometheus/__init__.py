@@ -6,9 +6,10 @@ from collections.abc import Callable
 from contextlib import suppress
 import logging
 import string
-from typing import Any, cast
+from typing import Any
 
 from aiohttp import web
+from aiohttp.hdrs import ACCEPT, ACCEPT_ENCODING, CONTENT_ENCODING, CONTENT_TYPE
 import prometheus_client
 from prometheus_client.metrics import MetricWrapperBase
 import voluptuous as vol
@@ -82,6 +83,13 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.dt import as_timestamp
 from homeassistant.util.unit_conversion import TemperatureConverter
 
+from .exposition import (
+    CONTENT_TYPE_OPENMETRICS,
+    ExposedMetric,
+    MetricsExposition,
+    accepts_openmetrics,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 API_ENDPOINT = "/api/prometheus"
@@ -128,7 +136,10 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
+    exposition = MetricsExposition()
+    hass.http.register_view(
+        PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH], exposition)
+    )
 
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
@@ -149,6 +160,7 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         component_config,
         override_metric,
         default_metric,
+        exposition,
     )
 
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)
@@ -175,8 +187,10 @@ class PrometheusMetrics:
         component_config: EntityValues,
         override_metric: str | None,
         default_metric: str | None,
+        exposition: MetricsExposition,
     ) -> None:
         """Initialize Prometheus Metrics."""
+        self._exposition = exposition
         self._component_config = component_config
         self._override_metric = override_metric
         self._default_metric = default_metric
@@ -196,7 +210,7 @@ class PrometheusMetrics:
             self.metrics_prefix = f"{namespace}_"
         else:
             self.metrics_prefix = ""
-        self._metrics: dict[str, MetricWrapperBase] = {}
+        self._metrics: dict[str, ExposedMetric[Any]] = {}
         self._climate_units = climate_units
 
     def handle_state_changed_event(self, event: Event[EventStateChangedData]) -> None:
@@ -248,6 +262,8 @@ class PrometheusMetrics:
         )
         last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
 
+        self._exposition.flush()
+
     def handle_entity_registry_updated(
         self, event: Event[EventEntityRegistryUpdatedData]
     ) -> None:
@@ -277,20 +293,8 @@ class PrometheusMetrics:
         self, entity_id: str, friendly_name: str | None = None
     ) -> None:
         """Remove labelsets matching the given entity id from all metrics."""
-        for metric in list(self._metrics.values()):
-            for sample in cast(list[prometheus_client.Metric], metric.collect())[
-                0
-            ].samples:
-                if sample.labels["entity"] == entity_id and (
-                    not friendly_name or sample.labels["friendly_name"] == friendly_name
-                ):
-                    _LOGGER.debug(
-                        "Removing labelset from %s for entity_id: %s",
-                        sample.name,
-                        entity_id,
-                    )
-                    with suppress(KeyError):
-                        metric.remove(*sample.labels.values())
+        _LOGGER.debug("Removing labelsets for entity_id: %s", entity_id)
+        self._exposition.remove_entity(entity_id, friendly_name)
 
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
@@ -312,24 +316,25 @@ class PrometheusMetrics:
         factory: type[_MetricBaseT],
         documentation: str,
         extra_labels: list[str] | None = None,
-    ) -> _MetricBaseT:
+    ) -> ExposedMetric[_MetricBaseT]:
         labels = ["entity", "friendly_name", "domain"]
         if extra_labels is not None:
             labels.extend(extra_labels)
 
         try:
-            return cast(_MetricBaseT, self._metrics[metric])
+            return self._metrics[metric]
         except KeyError:
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
-            self._metrics[metric] = factory(
+            # The metrics are exposed by the exposition instead of the registry
+            self._metrics[metric] = self._exposition.add_metric(
+                factory(full_metric_name, documentation, labels, registry=None),
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
             )
-            return cast(_MetricBaseT, self._metrics[metric])
+            return self._metrics[metric]
 
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
@@ -853,19 +858,32 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, exposition: MetricsExposition) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self._exposition = exposition
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
         hass = request.app[KEY_HASS]
+        openmetrics_format = accepts_openmetrics(request.headers.get(ACCEPT, ""))
+        gzip = "gzip" in request.headers.get(ACCEPT_ENCODING, "")
         body = await hass.async_add_executor_job(
-            prometheus_client.generate_latest, prometheus_client.REGISTRY
-        )
-        return web.Response(
-            body=body,
-            content_type=CONTENT_TYPE_TEXT_PLAIN,
+            self._exposition.generate,
+            prometheus_client.REGISTRY,
+            openmetrics_format,
+            gzip,
         )
+        if openmetrics_format:
+            # The content type has a charset, which aiohttp
+            # does not accept as content_type
+            response = web.Response(
+                body=body, headers={CONTENT_TYPE: CONTENT_TYPE_OPENMETRICS}
+            )
+        else:
+            response = web.Response(body=body, content_type=CONTENT_TYPE_TEXT_PLAIN)
+        if gzip:
+            response.headers[CONTENT_ENCODING] = "gzip"
+        return response
@@ -0,0 +1,327 @@
+"""Pre-rendered exposition of the Prometheus metrics."""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from dataclasses import dataclass
+import threading
+from typing import Any
+import zlib
+
+import prometheus_client
+from prometheus_client.metrics import MetricWrapperBase
+from prometheus_client.openmetrics import exposition as openmetrics_exposition
+from prometheus_client.utils import floatToGoString
+
+MEDIA_TYPE_OPENMETRICS = "application/openmetrics-text"
+CONTENT_TYPE_OPENMETRICS = f"{MEDIA_TYPE_OPENMETRICS}; version=1.0.0; charset=utf-8"
+
+# Level 6 is the zlib default, scrapes are compressed once per change
+GZIP_LEVEL = 6
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _escape_help(documentation: str, openmetrics_format: bool) -> str:
+    """Escape the documentation of a metric."""
+    documentation = documentation.replace("\\", r"\\").replace("\n", r"\n")
+    if openmetrics_format:
+        documentation = documentation.replace('"', r"\"")
+    return documentation
+
+
+def accepts_openmetrics(accept_header: str) -> bool:
+    """Return if the client accepts the OpenMetrics format."""
+    return any(
+        accepted.split(";")[0].strip() == MEDIA_TYPE_OPENMETRICS
+        for accepted in accept_header.split(",")
+    )
+
+
+class _MetricFamily:
+    """The rendered samples of one metric.
+
+    The samples of every labelset are kept as rendered lines so a
+    change only renders the lines of the changed labelset.
+    """
+
+    __slots__ = (
+        "metric",
+        "name",
+        "documentation",
+        "counter",
+        "labelnames",
+        "samples",
+        "_text",
+    )
+
+    def __init__(
+        self,
+        metric: MetricWrapperBase,
+        name: str,
+        documentation: str,
+        counter: bool,
+        labelnames: list[str],
+    ) -> None:
+        """Initialize the family."""
+        self.metric = metric
+        # Counters are exposed without the _total suffix in their family name
+        self.name = name.removesuffix("_total") if counter else name
+        self.documentation = documentation
+        self.counter = counter
+        self.labelnames = labelnames
+        # Rendered value and _created lines by label values
+        self.samples: dict[tuple[str, ...], tuple[str, str | None]] = {}
+        self._text: dict[bool, str] = {}
+
+    def render_samples(self, labelvalues: tuple[str, ...], child: Any) -> None:
+        """Render the samples of a labelset."""
+        labelstr = ",".join(
+            f'{name}="{_escape_label_value(value)}"'
+            for name, value in sorted(zip(self.labelnames, labelvalues, strict=True))
+        )
+        value_line: str | None = None
+        created_line: str | None = None
+        for metric in child.collect():
+            for sample in metric.samples:
+                line = f"{sample.name}{{{labelstr}}} {floatToGoString(sample.value)}\n"
+                if sample.name == f"{self.name}_created":
+                    created_line = line
+                else:
+                    value_line = line
+        if value_line is None:
+            return
+        self.samples[labelvalues] = (value_line, created_line)
+        self._text.clear()
+
+    def remove_samples(self, labelvalues: tuple[str, ...]) -> None:
+        """Remove the samples of a labelset."""
+        with suppress(KeyError):
+            self.metric.remove(*labelvalues)
+        if self.samples.pop(labelvalues, None) is not None:
+            self._text.clear()
+
+    def text(self, openmetrics_format: bool) -> str:
+        """Return the exposition of the family."""
+        if (text := self._text.get(openmetrics_format)) is not None:
+            return text
+        if openmetrics_format:
+            text = self._render_openmetrics()
+        else:
+            text = self._render_text()
+        self._text[openmetrics_format] = text
+        return text
+
+    def _render_text(self) -> str:
+        """Render the family in the Prometheus text format."""
+        name = f"{self.name}_total" if self.counter else self.name
+        documentation = _escape_help(self.documentation, False)
+        lines = [
+            f"# HELP {name} {documentation}\n",
+            f"# TYPE {name} {'counter' if self.counter else 'gauge'}\n",
+        ]
+        lines.extend(value_line for value_line, _ in self.samples.values())
+        created_lines = [
+            created_line
+            for _, created_line in self.samples.values()
+            if created_line is not None
+        ]
+        if created_lines:
+            lines.append(f"# HELP {self.name}_created {documentation}\n")
+            lines.append(f"# TYPE {self.name}_created gauge\n")
+            lines.extend(created_lines)
+        return "".join(lines)
+
+    def _render_openmetrics(self) -> str:
+        """Render the family in the OpenMetrics format."""
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.documentation, True)}\n",
+            f"# TYPE {self.name} {'counter' if self.counter else 'gauge'}\n",
+        ]
+        for value_line, created_line in self.samples.values():
+            lines.append(value_line)
+            if created_line is not None:
+                lines.append(created_line)
+        return "".join(lines)
+
+
+class ExposedMetric[_MetricBaseT: MetricWrapperBase]:
+    """A metric that keeps its exposition up to date."""
+
+    __slots__ = ("_exposition", "_family")
+
+    def __init__(self, exposition: MetricsExposition, family: _MetricFamily) -> None:
+        """Initialize the metric."""
+        self._exposition = exposition
+        self._family = family
+
+    def labels(self, **labels: Any) -> ExposedChild:
+        """Return the child of a labelset."""
+        family = self._family
+        return ExposedChild(
+            self._exposition,
+            family,
+            tuple(str(labels[name]) for name in family.labelnames),
+            family.metric.labels(**labels),
+        )
+
+
+class ExposedChild:
+    """The child of a labelset that marks it as changed when it is written.
+
+    The labelset is marked after the value is written, so a flush in
+    between can not render the previous value and drop the change.
+    """
+
+    __slots__ = ("_exposition", "_family", "_labelvalues", "_child")
+
+    def __init__(
+        self,
+        exposition: MetricsExposition,
+        family: _MetricFamily,
+        labelvalues: tuple[str, ...],
+        child: Any,
+    ) -> None:
+        """Initialize the child."""
+        self._exposition = exposition
+        self._family = family
+        self._labelvalues = labelvalues
+        self._child = child
+
+    def set(self, value: float) -> None:
+        """Set the value of a gauge."""
+        self._child.set(value)
+        self._exposition.mark_changed(self._family, self._labelvalues, self._child)
+
+    def inc(self, amount: float = 1) -> None:
+        """Increment the value of a counter or gauge."""
+        self._child.inc(amount)
+        self._exposition.mark_changed(self._family, self._labelvalues, self._child)
+
+
+@dataclass(slots=True)
+class _Buffer:
+    """An assembled exposition of the metrics."""
+
+    body: bytes
+    gzip_body: bytes | None = None
+    gzip_compressor: Any = None
+
+
+class MetricsExposition:
+    """Pre-rendered exposition of the metrics of the integration.
+
+    The metrics are not registered in the prometheus_client registry,
+    walking every labelset on each scrape is slow with many entities.
+    Instead the changed labelsets are rendered when states change and
+    scrapes are served from one assembled buffer until the next change.
+    The other collectors of the registry, like the process metrics,
+    are small and appended on every scrape.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the exposition."""
+        self._lock = threading.Lock()
+        self._families: list[_MetricFamily] = []
+        # Labelsets of every entity, to remove them without a walk
+        self._entities: dict[str, set[tuple[_MetricFamily, tuple[str, ...]]]] = {}
+        self._changed: dict[tuple[_MetricFamily, tuple[str, ...]], Any] = {}
+        self._buffers: dict[bool, _Buffer] = {}
+
+    def add_metric[_MetricBaseT: MetricWrapperBase](
+        self,
+        metric: _MetricBaseT,
+        name: str,
+        documentation: str,
+        labelnames: list[str],
+    ) -> ExposedMetric[_MetricBaseT]:
+        """Add a metric to the exposition."""
+        family = _MetricFamily(
+            metric,
+            name,
+            documentation,
+            isinstance(metric, prometheus_client.Counter),
+            labelnames,
+        )
+        with self._lock:
+            self._families.append(family)
+            self._buffers.clear()
+        return ExposedMetric(self, family)
+
+    def mark_changed(
+        self, family: _MetricFamily, labelvalues: tuple[str, ...], child: Any
+    ) -> None:
+        """Mark a labelset as changed, it is rendered on the next flush."""
+        with self._lock:
+            self._changed[(family, labelvalues)] = child
+
+    def flush(self) -> None:
+        """Render the changed labelsets."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Render the changed labelsets while holding the lock."""
+        if not self._changed:
+            return
+        for (family, labelvalues), child in self._changed.items():
+            family.render_samples(labelvalues, child)
+            self._entities.setdefault(labelvalues[0], set()).add((family, labelvalues))
+        self._changed.clear()
+        self._buffers.clear()
+
+    def remove_entity(self, entity_id: str, friendly_name: str | None = None) -> None:
+        """Remove the labelsets of an entity from all metrics."""
+        with self._lock:
+            self._flush()
+            if not (labelsets := self._entities.get(entity_id)):
+                return
+            for family, labelvalues in list(labelsets):
+                # The friendly name is the second label of all metrics
+                if friendly_name and labelvalues[1] != friendly_name:
+                    continue
+                family.remove_samples(labelvalues)
+                labelsets.discard((family, labelvalues))
+            if not labelsets:
+                del self._entities[entity_id]
+            self._buffers.clear()
+
+    def _buffer(self, openmetrics_format: bool) -> _Buffer:
+        """Return the assembled buffer while holding the lock."""
+        self._flush()
+        if (buffer := self._buffers.get(openmetrics_format)) is None:
+            body = "".join(
+                family.text(openmetrics_format) for family in self._families
+            ).encode()
+            buffer = self._buffers[openmetrics_format] = _Buffer(body)
+        return buffer
+
+    def generate(
+        self,
+        registry: prometheus_client.CollectorRegistry,
+        openmetrics_format: bool,
+        gzip: bool,
+    ) -> bytes:
+        """Generate the exposition of the metrics and the other collectors.
+
+        When compressing, the compressed buffer is kept and only the
+        collectors of the registry are compressed on every scrape.
+        """
+        if openmetrics_format:
+            tail = openmetrics_exposition.generate_latest(registry)
+        else:
+            tail = prometheus_client.generate_latest(registry)
+        with self._lock:
+            buffer = self._buffer(openmetrics_format)
+            if not gzip:
+                return buffer.body + tail
+            if buffer.gzip_compressor is None:
+                compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+                buffer.gzip_body = compressor.compress(buffer.body)
+                buffer.gzip_compressor = compressor
+            assert buffer.gzip_body is not None
+            compressor = buffer.gzip_compressor.copy()
+            return buffer.gzip_body + compressor.compress(tail) + compressor.flush()
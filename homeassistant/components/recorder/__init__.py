@@ -34,6 +34,7 @@ from .const import (  # noqa: F401
     DOMAIN,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_METHODS,
+    INTEGRATION_PLATFORM_SETUP_STATE_CHANGED_PROCESSOR,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
@@ -61,6 +62,7 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT = "bulk_insert"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -110,6 +112,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_RETRY_WAIT, default=DEFAULT_DB_RETRY_WAIT
                     ): cv.positive_int,
+                    vol.Optional(CONF_BULK_INSERT, default=False): cv.boolean,
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
@@ -142,6 +145,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
+    bulk_insert = conf[CONF_BULK_INSERT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
@@ -163,6 +167,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        bulk_insert=bulk_insert,
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -190,6 +195,15 @@ async def _async_setup_integration_platform(
         # If the platform has a compile_statistics method, we need to
         # add it to the recorder queue to be processed.
         if any(hasattr(platform, _attr) for _attr in INTEGRATION_PLATFORM_METHODS):
-            instance.queue_task(AddRecorderPlatformTask(domain, platform))
+            # State changed processors are set up in the event loop
+            # and only called from the recorder thread after that.
+            state_changed_processor = None
+            if setup_processor := getattr(
+                platform, INTEGRATION_PLATFORM_SETUP_STATE_CHANGED_PROCESSOR, None
+            ):
+                state_changed_processor = setup_processor(hass)
+            instance.queue_task(
+                AddRecorderPlatformTask(domain, platform, state_changed_processor)
+            )
 
     await async_process_integration_platforms(hass, DOMAIN, _process_recorder_platform)
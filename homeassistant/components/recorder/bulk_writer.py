@@ -0,0 +1,221 @@
+"""Write pending recorder rows with core-level multi-row INSERTs."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import Column, Table, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm.session import Session
+
+from .db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+type _DimensionRow = StatesMeta | StateAttributes | EventTypes | EventData
+
+
+def _insert_columns(table: Table) -> list[Column[Any]]:
+    """Return the columns of a table that are written on insert."""
+    return [column for column in table.columns if not column.primary_key]
+
+
+_STATES_COLUMNS = _insert_columns(States.__table__)
+_EVENTS_COLUMNS = _insert_columns(Events.__table__)
+_DIMENSION_COLUMNS: dict[type[_DimensionRow], list[Column[Any]]] = {
+    StatesMeta: _insert_columns(StatesMeta.__table__),
+    StateAttributes: _insert_columns(StateAttributes.__table__),
+    EventTypes: _insert_columns(EventTypes.__table__),
+    EventData: _insert_columns(EventData.__table__),
+}
+
+
+def bulk_insert_supported(engine: Engine) -> bool:
+    """Return if the database can return ids for multi-row INSERTs in order."""
+    return bool(engine.dialect.insert_executemany_returning_sort_by_parameter_order)
+
+
+class BulkWriter:
+    """Collect rows for the event session and write them with multi-row INSERTs.
+
+    Instead of adding one ORM object per event to the session and flushing
+    them through the unit of work, rows are collected here and written
+    with one executemany INSERT per table at commit time.
+
+    The rows are still built as (transient) ORM objects so the table
+    managers can keep linking them together with their pending maps.
+    Foreign keys to pending rows are resolved from those links once the
+    referenced rows have been inserted and their ids are known.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk writer."""
+        self._dimension_rows: dict[type[_DimensionRow], list[_DimensionRow]] = {
+            row_type: [] for row_type in _DIMENSION_COLUMNS
+        }
+        self._states: list[States] = []
+        self._events: list[Events] = []
+        # Objects and primary key names of the ids assigned by write
+        self._assigned: list[tuple[object, str]] = []
+
+    def add(self, obj: object) -> None:
+        """Add a row to be written at the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if type(obj) is States:
+            self._states.append(obj)
+        elif type(obj) is Events:
+            self._events.append(obj)
+        else:
+            self._dimension_rows[type(obj)].append(obj)  # type: ignore[index]
+
+    def clear(self) -> None:
+        """Drop all rows that have not been written yet.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for rows in self._dimension_rows.values():
+            rows.clear()
+        self._states.clear()
+        self._events.clear()
+        self._assigned.clear()
+
+    def reset_ids(self) -> None:
+        """Reset the ids assigned to the rows after a rollback.
+
+        The rows are kept so the write can be retried.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        for obj, pk_name in self._assigned:
+            setattr(obj, pk_name, None)
+        self._assigned.clear()
+
+    def write(self, session: Session) -> None:
+        """Write all pending rows in the session's transaction.
+
+        The ids of the inserted rows are set on the pending objects so the
+        table managers can pick them up in post_commit_pending. The rows
+        are kept until the transaction is committed and clear is called.
+        If any INSERT fails, the transaction is rolled back, the assigned
+        ids are reset and the rows are kept so the write can be retried.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        try:
+            self._write(session, self._assigned)
+        except Exception:
+            session.rollback()
+            self.reset_ids()
+            raise
+
+    def _write(self, session: Session, assigned: list[tuple[object, str]]) -> None:
+        """Write the pending rows and record the ids assigned to them."""
+        for row_type, rows in self._dimension_rows.items():
+            if rows:
+                _insert_returning_ids(
+                    session, rows, _DIMENSION_COLUMNS[row_type], assigned
+                )
+
+        if events := self._events:
+            session.execute(
+                insert(Events.__table__),
+                [_event_to_row(event) for event in events],
+            )
+
+        for states in _states_in_dependency_order(self._states):
+            _insert_returning_ids(
+                session,
+                states,
+                _STATES_COLUMNS,
+                assigned,
+                [_state_to_row(state) for state in states],
+            )
+
+
+def _insert_returning_ids(
+    session: Session,
+    objs: list[Any],
+    columns: list[Column[Any]],
+    assigned: list[tuple[object, str]],
+    rows: list[dict[str, Any]] | None = None,
+) -> None:
+    """Insert objects with one multi-row INSERT and set their primary keys."""
+    table: Table = objs[0].__table__
+    pk_column = table.primary_key.columns.values()[0]
+    pk_name = pk_column.key
+    if rows is None:
+        rows = [
+            {column.key: getattr(obj, column.key) for column in columns} for obj in objs
+        ]
+    ids = session.execute(
+        insert(table).returning(pk_column, sort_by_parameter_order=True), rows
+    ).scalars()
+    for obj, id_ in zip(objs, ids, strict=True):
+        setattr(obj, pk_name, id_)
+        assigned.append((obj, pk_name))
+
+
+def _states_in_dependency_order(states: Iterable[States]) -> list[list[States]]:
+    """Group pending states into generations that can be inserted together.
+
+    A state whose old state is pending in the same commit must be inserted
+    after it so the old_state_id is known. The first generation holds the
+    states that only link to already committed states. Old states that were
+    linked to but not added themselves are included, as the ORM would
+    have cascaded them into the session.
+    """
+    generation_by_state: dict[int, int] = {}
+    generations: list[list[States]] = []
+    for state in states:
+        # Walk back to the oldest pending state of the chain that
+        # has not been placed yet, then place the chain forward.
+        chain: list[States] = []
+        generation = -1
+        pending: States | None = state
+        while pending is not None and pending.state_id is None:
+            if (placed := generation_by_state.get(id(pending))) is not None:
+                generation = placed
+                break
+            chain.append(pending)
+            pending = pending.old_state
+        for pending in reversed(chain):
+            generation += 1
+            generation_by_state[id(pending)] = generation
+            if generation == len(generations):
+                generations.append([])
+            generations[generation].append(pending)
+    return generations
+
+
+def _state_to_row(state: States) -> dict[str, Any]:
+    """Convert a pending state to an INSERT row with resolved foreign keys."""
+    row = {column.key: getattr(state, column.key) for column in _STATES_COLUMNS}
+    if (old_state := state.old_state) is not None:
+        row["old_state_id"] = old_state.state_id
+    if (states_meta := state.states_meta_rel) is not None:
+        row["metadata_id"] = states_meta.metadata_id
+    if (state_attributes := state.state_attributes) is not None:
+        row["attributes_id"] = state_attributes.attributes_id
+    return row
+
+
+def _event_to_row(event: Events) -> dict[str, Any]:
+    """Convert a pending event to an INSERT row with resolved foreign keys."""
+    row = {column.key: getattr(event, column.key) for column in _EVENTS_COLUMNS}
+    if (event_type := event.event_type_rel) is not None:
+        row["event_type_id"] = event_type.event_type_id
+    if (event_data := event.event_data_rel) is not None:
+        row["data_id"] = event_data.data_id
+    return row
@@ -0,0 +1,101 @@
+"""Size recorder transactions from the queue backlog and commit latency."""
+
+from __future__ import annotations
+
+import time
+
+# Queue depth at which transactions are committed by size
+# instead of waiting for the commit interval.
+COMMIT_BACKLOG_THRESHOLD = 1000
+
+# Bounds for the number of events per transaction when
+# committing by size.
+MIN_COMMIT_BATCH_SIZE = 250
+MAX_COMMIT_BATCH_SIZE = 20000
+
+# Fraction of the recorder thread time we aim to spend in commits
+TARGET_COMMIT_OVERHEAD = 0.1
+
+# Number of commits we want to drain the backlog in
+BACKLOG_DRAIN_COMMITS = 10
+
+# Smoothing factor for the moving averages
+EWMA_ALPHA = 0.2
+
+
+def _ewma(average: float | None, value: float) -> float:
+    """Return the exponentially weighted moving average."""
+    if average is None:
+        return value
+    return average + EWMA_ALPHA * (value - average)
+
+
+class AdaptiveCommitScheduler:
+    """Decide when to commit the event session while there is a backlog.
+
+    Without a backlog the recorder commits on the commit interval. Once the
+    queue grows past COMMIT_BACKLOG_THRESHOLD, the commit task queued by the
+    interval timer sits behind the whole backlog, so instead the session is
+    committed every `batch_size` events.
+
+    The batch size is derived from the measured cost of processing an event
+    and of committing, so the commit overhead stays around
+    TARGET_COMMIT_OVERHEAD, and it grows with the backlog so a large backlog
+    is drained in roughly BACKLOG_DRAIN_COMMITS commits.
+
+    All methods except the read-only properties must be called from the
+    recorder thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self.batch_size = MIN_COMMIT_BATCH_SIZE
+        self.commit_latency: float | None = None
+        self.event_cost: float | None = None
+        self.last_backlog = 0
+        self.commits_by_size = 0
+        self._pending_events = 0
+        # Time spent processing the pending events, without the time
+        # the recorder waited for events
+        self._processing_time = 0.0
+
+    def event_started(self) -> float:
+        """Record that processing an event is starting and return the start time."""
+        return time.monotonic()
+
+    def event_processed(self, started: float, backlog: int) -> bool:
+        """Record an event was added to the session.
+
+        Returns True if the session should be committed now.
+        """
+        self._pending_events += 1
+        self._processing_time += time.monotonic() - started
+        if backlog < COMMIT_BACKLOG_THRESHOLD or self._pending_events < self.batch_size:
+            return False
+        self.commits_by_size += 1
+        return True
+
+    def commit_started(self) -> float:
+        """Record that a commit is starting and return the start time."""
+        return time.monotonic()
+
+    def commit_finished(self, started: float, backlog: int) -> None:
+        """Record a successful commit and resize the next batch."""
+        finished = time.monotonic()
+        if self._pending_events:
+            self.event_cost = _ewma(
+                self.event_cost, self._processing_time / self._pending_events
+            )
+        self.commit_latency = _ewma(self.commit_latency, finished - started)
+        self.last_backlog = backlog
+        self._pending_events = 0
+        self._processing_time = 0.0
+
+        target = MIN_COMMIT_BATCH_SIZE
+        if self.event_cost:
+            target = max(
+                target,
+                int(self.commit_latency / (self.event_cost * TARGET_COMMIT_OVERHEAD)),
+            )
+        target = max(target, backlog // BACKLOG_DRAIN_COMMITS)
+        self.batch_size = min(target, MAX_COMMIT_BATCH_SIZE)
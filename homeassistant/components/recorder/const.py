@@ -64,11 +64,15 @@ LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 INTEGRATION_PLATFORM_COMPILE_STATISTICS = "compile_statistics"
 INTEGRATION_PLATFORM_VALIDATE_STATISTICS = "validate_statistics"
 INTEGRATION_PLATFORM_LIST_STATISTIC_IDS = "list_statistic_ids"
+INTEGRATION_PLATFORM_SETUP_STATE_CHANGED_PROCESSOR = (
+    "async_setup_state_changed_processor"
+)
 
 INTEGRATION_PLATFORM_METHODS = {
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
+    INTEGRATION_PLATFORM_SETUP_STATE_CHANGED_PROCESSOR,
 }
 
 
@@ -50,6 +50,8 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_writer import BulkWriter, bulk_insert_supported
+from .commit_scheduler import AdaptiveCommitScheduler
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -173,6 +175,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        bulk_insert: bool,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -190,6 +193,7 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.bulk_insert = bulk_insert
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -212,6 +216,13 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # Set when bulk inserts are enabled and supported by the database
+        self._bulk_writer: BulkWriter | None = None
+        self.commit_scheduler = AdaptiveCommitScheduler()
+        # State changed processors of recorder platforms
+        self.state_changed_processors: list[
+            Callable[[Event[EventStateChangedData]], None]
+        ] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -694,7 +705,10 @@ class Recorder(threading.Thread):
     def _add_to_session(self, session: Session, obj: object) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
-        session.add(obj)
+        if self._bulk_writer:
+            self._bulk_writer.add(obj)
+        else:
+            session.add(obj)
 
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
@@ -1022,12 +1036,20 @@ class Recorder(threading.Thread):
     def _process_one_event(self, event: Event[Any]) -> None:
         if not self.enabled:
             return
+        if event.event_type == EVENT_STATE_CHANGED:
+            # Platforms only follow the state changes that are recorded
+            for processor in self.state_changed_processors:
+                processor(event)
+        event_started = self.commit_scheduler.event_started()
         if event.event_type == EVENT_STATE_CHANGED:
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
-        # Commit if the commit interval is zero
-        if not self.commit_interval:
+        # Commit if the commit interval is zero or if the
+        # transaction has grown large enough while there is a backlog
+        if not self.commit_interval or self.commit_scheduler.event_processed(
+            event_started, self._queue.qsize()
+        ):
             self._commit_event_session_or_retry()
 
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
@@ -1204,23 +1226,38 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        commit_started = self.commit_scheduler.commit_started()
 
-        if (
-            pending_last_reported
-            := self.states_manager.get_pending_last_reported_timestamp()
-        ) and self.schema_version >= LAST_REPORTED_SCHEMA_VERSION:
-            with session.no_autoflush:
-                session.execute(
-                    update(States),
-                    [
-                        {
-                            "state_id": state_id,
-                            "last_reported_ts": last_reported_timestamp,
-                        }
-                        for state_id, last_reported_timestamp in pending_last_reported.items()
-                    ],
-                )
-        session.commit()
+        if bulk_writer := self._bulk_writer:
+            bulk_writer.write(session)
+
+        try:
+            if (
+                pending_last_reported
+                := self.states_manager.get_pending_last_reported_timestamp()
+            ) and self.schema_version >= LAST_REPORTED_SCHEMA_VERSION:
+                with session.no_autoflush:
+                    session.execute(
+                        update(States),
+                        [
+                            {
+                                "state_id": state_id,
+                                "last_reported_ts": last_reported_timestamp,
+                            }
+                            for state_id, last_reported_timestamp in pending_last_reported.items()
+                        ],
+                    )
+            session.commit()
+        except Exception:
+            if bulk_writer:
+                # The inserted rows were rolled back, keep them
+                # without their ids so the commit can be retried
+                session.rollback()
+                bulk_writer.reset_ids()
+            raise
+        if bulk_writer:
+            bulk_writer.clear()
+        self.commit_scheduler.commit_finished(commit_started, self._queue.qsize())
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1260,6 +1297,8 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        if self._bulk_writer:
+            self._bulk_writer.clear()
 
         if not self.event_session:
             return
@@ -1418,6 +1457,15 @@ class Recorder(threading.Thread):
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
         self.__dict__.pop("dialect_name", None)
+        self._bulk_writer = None
+        if self.bulk_insert:
+            if bulk_insert_supported(self.engine):
+                self._bulk_writer = BulkWriter()
+            else:
+                _LOGGER.warning(
+                    "The database does not support returning the ids of "
+                    "multi-row inserts, falling back to writing rows one by one"
+                )
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         migration.pre_migrate_schema(self.engine)
@@ -596,14 +596,8 @@ class StateAttributes(Base):
         )
 
     @staticmethod
-    def shared_attrs_bytes_from_event(
-        event: Event[EventStateChangedData],
-        dialect: SupportedDialect | None,
-    ) -> bytes:
-        """Create shared_attrs from a state_changed event."""
-        # None state means the state was removed from the state machine
-        if (state := event.data["new_state"]) is None:
-            return b"{}"
+    def recorded_attributes(state: State) -> dict[str, Any]:
+        """Return the attributes of a state that are recorded."""
         if state_info := state.state_info:
             unrecorded_attributes = state_info["unrecorded_attributes"]
             exclude_attrs = {
@@ -617,10 +611,19 @@ class StateAttributes(Base):
                 exclude_attrs -= _MATCH_ALL_KEEP
         else:
             exclude_attrs = ALL_DOMAIN_EXCLUDE_ATTRS
+        return {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
+
+    @staticmethod
+    def shared_attrs_bytes_from_event(
+        event: Event[EventStateChangedData],
+        dialect: SupportedDialect | None,
+    ) -> bytes:
+        """Create shared_attrs from a state_changed event."""
+        # None state means the state was removed from the state machine
+        if (state := event.data["new_state"]) is None:
+            return b"{}"
         encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
-        bytes_result = encoder(
-            {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
-        )
+        bytes_result = encoder(StateAttributes.recorded_attributes(state))
         if len(bytes_result) > MAX_STATE_ATTRS_BYTES:
             _LOGGER.warning(
                 "State attributes for %s exceed maximum size of %s bytes. "
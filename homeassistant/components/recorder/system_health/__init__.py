@@ -55,6 +55,20 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_commit_info(instance: Recorder) -> dict[str, Any]:
+    """Get the decisions of the adaptive commit scheduler."""
+    commit_scheduler = instance.commit_scheduler
+    commit_info: dict[str, Any] = {
+        "queue_backlog": instance.backlog,
+        "commit_batch_size": commit_scheduler.batch_size,
+        "commits_by_size": commit_scheduler.commits_by_size,
+    }
+    if (commit_latency := commit_scheduler.commit_latency) is not None:
+        commit_info["commit_latency"] = f"{commit_latency*1000:.2f} ms"
+    return commit_info
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -62,6 +76,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     recorder_runs_manager = instance.recorder_runs_manager
     database_name = urlparse(instance.db_url).path.lstrip("/")
     db_engine_info = _async_get_db_engine_info(instance)
+    commit_info = _async_get_commit_info(instance)
     db_stats: dict[str, Any] = {}
 
     if instance.async_db_ready.done():
@@ -72,4 +87,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | commit_info
@@ -11,6 +11,7 @@ import logging
 import threading
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import Event, EventStateChangedData
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
@@ -297,6 +298,9 @@ class AddRecorderPlatformTask(RecorderTask):
 
     domain: str
     platform: Any
+    state_changed_processor: Callable[[Event[EventStateChangedData]], None] | None = (
+        None
+    )
     commit_before = False
 
     def run(self, instance: Recorder) -> None:
@@ -306,6 +310,8 @@ class AddRecorderPlatformTask(RecorderTask):
         platform = self.platform
         platforms: dict[str, Any] = hass.data[DOMAIN].recorder_platforms
         platforms[domain] = platform
+        if self.state_changed_processor is not None:
+            instance.state_changed_processors.append(self.state_changed_processor)
 
 
 @dataclass(slots=True)
@@ -18,6 +18,7 @@ from homeassistant.components.recorder import (
     history,
     statistics,
 )
+from homeassistant.components.recorder.db_schema import StatisticsShortTerm
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
@@ -30,7 +31,14 @@ from homeassistant.const import (
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
@@ -75,6 +83,343 @@ WARN_UNSUPPORTED_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unsupported_u
 WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Accumulated statistics of sensors, only used from the recorder thread
+ACCUMULATOR: HassKey[SensorStatisticsAccumulator] = HassKey(f"{DOMAIN}_accumulator")
+
+# Number of closed periods kept per sensor until they are compiled
+MAX_CLOSED_PERIODS = 12
+
+
+def _float_or_none(state: str) -> float | None:
+    """Return the state as a finite float or None."""
+    try:
+        value = float(state)
+    except (ValueError, TypeError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _period_start(timestamp: datetime.datetime) -> datetime.datetime:
+    """Return the start of the short term statistics period of a time."""
+    return timestamp.replace(
+        minute=timestamp.minute - timestamp.minute % 5, second=0, microsecond=0
+    )
+
+
+class _MeasurementPeriod:
+    """Running time-weighted mean, min and max of a sensor in a period.
+
+    Matches _time_weighted_average of the significant states: states that
+    are not numeric are skipped and if the state at the start of the
+    period is not numeric the mean starts with the first numeric state.
+    """
+
+    __slots__ = (
+        "start",
+        "end",
+        "carried",
+        "state",
+        "value",
+        "value_start",
+        "mean_start",
+        "accumulated",
+        "min",
+        "max",
+        "mixed_units",
+    )
+
+    def __init__(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        carried: State | None,
+    ) -> None:
+        """Initialize the period with the state at its start."""
+        self.start = start
+        self.end = end
+        self.carried = carried
+        # The last numeric state and when its value started in the period
+        self.state: State | None = None
+        self.value = 0.0
+        self.value_start = start
+        self.mean_start = start
+        self.accumulated = 0.0
+        self.min = 0.0
+        self.max = 0.0
+        self.mixed_units = False
+        if carried is not None:
+            self._add(carried)
+
+    def add(self, state: State) -> None:
+        """Add a state change in the period."""
+        # Attribute changes are not significant
+        if state.last_changed == state.last_updated:
+            self._add(state)
+
+    def _add(self, state: State) -> None:
+        """Add a state to the running values."""
+        if (value := _float_or_none(state.state)) is None:
+            return
+        start_time = max(state.last_updated, self.start)
+        if self.state is None:
+            self.mean_start = start_time
+            self.min = self.max = value
+        else:
+            self.accumulated += (
+                self.value * (start_time - self.value_start).total_seconds()
+            )
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+            if state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) != (
+                self.state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+            ):
+                self.mixed_units = True
+        self.state = state
+        self.value = value
+        self.value_start = start_time
+
+    def float_states(self) -> list[tuple[float, State]]:
+        """Return the mean, min and max with the last numeric state."""
+        if (state := self.state) is None:
+            return []
+        duration = self.end - self.value_start
+        accumulated = self.accumulated + self.value * duration.total_seconds()
+        if period_seconds := (self.end - self.mean_start).total_seconds():
+            mean = accumulated / period_seconds
+        else:
+            # The only numeric state is at the end of the period
+            mean = 0.0
+        return [(mean, state), (self.min, state), (self.max, state)]
+
+
+class _SumPeriod:
+    """Numeric states of a sensor in a period needed to compile its sum.
+
+    A state that is not below the state before it, with the same unit
+    and last_reset, can neither be a new cycle nor a dip. Within a run
+    of such states the compiled sum only depends on the last one, so the
+    others are dropped as the states are added.
+    """
+
+    __slots__ = ("start", "end", "carried", "states", "values")
+
+    def __init__(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        carried: State | None,
+    ) -> None:
+        """Initialize the period with the state at its start."""
+        self.start = start
+        self.end = end
+        self.carried = carried
+        self.states: list[State] = []
+        self.values: list[float] = []
+        if carried is not None:
+            self.add(carried)
+
+    def add(self, state: State) -> None:
+        """Add a state change in the period."""
+        if (value := _float_or_none(state.state)) is None:
+            return
+        states = self.states
+        values = self.values
+        if (
+            len(states) > 1
+            and _continues_run(values[-2], states[-2], values[-1], states[-1])
+            and _continues_run(values[-1], states[-1], value, state)
+        ):
+            states[-1] = state
+            values[-1] = value
+            return
+        states.append(state)
+        values.append(value)
+
+
+def _continues_run(
+    previous_value: float, previous: State, value: float, state: State
+) -> bool:
+    """Return if a state continues a run of increasing states."""
+    return (
+        0 <= previous_value <= value
+        and previous.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        == state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        and previous.attributes.get(ATTR_LAST_RESET)
+        == state.attributes.get(ATTR_LAST_RESET)
+    )
+
+
+type _Period = _MeasurementPeriod | _SumPeriod
+
+
+class _EntityAccumulator:
+    """Accumulated statistics of a sensor for the open and closed periods."""
+
+    __slots__ = ("has_sum", "complete_from", "latest", "period", "closed")
+
+    def __init__(
+        self, has_sum: bool, old_state: State | None, timestamp: datetime.datetime
+    ) -> None:
+        """Initialize the accumulator with the state before the first change."""
+        self.has_sum = has_sum
+        start = _period_start(timestamp)
+        # The state at the start of a period is only known if the
+        # state before the first change is from an earlier period
+        self.complete_from = (
+            start
+            if old_state is not None and old_state.last_updated < start
+            else start + StatisticsShortTerm.duration
+        )
+        self.latest = old_state
+        self.period = self._new_period(start, old_state)
+        self.closed: dict[datetime.datetime, _Period] = {}
+
+    def _new_period(self, start: datetime.datetime, carried: State | None) -> _Period:
+        """Return a new period."""
+        period_class = _SumPeriod if self.has_sum else _MeasurementPeriod
+        return period_class(start, start + StatisticsShortTerm.duration, carried)
+
+    def advance(self, timestamp: datetime.datetime) -> None:
+        """Close the open period if the time is after it."""
+        if timestamp < self.period.end:
+            return
+        closed = self.closed
+        closed[self.period.start] = self.period
+        if len(closed) > MAX_CLOSED_PERIODS:
+            oldest = min(closed)
+            del closed[oldest]
+            self.complete_from = max(
+                self.complete_from, oldest + StatisticsShortTerm.duration
+            )
+        self.period = self._new_period(_period_start(timestamp), self.latest)
+
+    def add(self, timestamp: datetime.datetime, state: State | None) -> bool:
+        """Add a state change, return False if it is out of order."""
+        if timestamp < self.period.start:
+            return False
+        self.advance(timestamp)
+        if state is not None:
+            self.period.add(state)
+        # A removed sensor is recorded without a state
+        self.latest = state
+        return True
+
+    def get_period(self, start: datetime.datetime) -> _Period | None:
+        """Return a period if the states in it are known."""
+        if start < self.complete_from:
+            return None
+        self.advance(start + StatisticsShortTerm.duration)
+        if period := self.closed.get(start):
+            return period
+        # No state changed in the period, its state is the
+        # state at the start of the next known period.
+        next_start = min(
+            (period_start for period_start in self.closed if period_start > start),
+            default=self.period.start,
+        )
+        carried = (self.closed.get(next_start) or self.period).carried
+        return self._new_period(start, carried)
+
+    def trim(self, start: datetime.datetime) -> None:
+        """Drop the periods up to start, they are not compiled again."""
+        for period_start in [
+            period_start for period_start in self.closed if period_start <= start
+        ]:
+            del self.closed[period_start]
+        self.complete_from = max(
+            self.complete_from, start + StatisticsShortTerm.duration
+        )
+
+
+class SensorStatisticsAccumulator:
+    """Accumulate the statistics of sensors with a state class.
+
+    Recorded state changes are fed by the recorder thread while it
+    processes the event queue, so when statistics are compiled every
+    state change queued before the compile task has been accumulated.
+    Each sensor keeps the running time-weighted mean, min and max, or
+    the states a sum depends on, of the open period and of the closed
+    periods not compiled yet. Sensors without a known state at the
+    start of a period, for example after a restart, are compiled from
+    the database.
+
+    This class is not thread-safe and must only be used from the
+    recorder thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the accumulator."""
+        self._entities: dict[str, _EntityAccumulator] = {}
+
+    def process_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Accumulate a recorded state change."""
+        entity_id = event.data["entity_id"]
+        if not entity_id.startswith("sensor."):
+            return
+        new_state = event.data["new_state"]
+        accumulator = self._entities.get(entity_id)
+        if new_state is None:
+            if accumulator is not None and not accumulator.add(
+                event.time_fired, None
+            ):
+                del self._entities[entity_id]
+            return
+        if (
+            state_class := try_parse_enum(
+                SensorStateClass, new_state.attributes.get(ATTR_STATE_CLASS)
+            )
+        ) is None:
+            self._entities.pop(entity_id, None)
+            return
+        has_sum = "sum" in DEFAULT_STATISTICS[state_class]
+        if accumulator is None or accumulator.has_sum is not has_sum:
+            accumulator = self._entities[entity_id] = _EntityAccumulator(
+                has_sum, event.data["old_state"], new_state.last_updated
+            )
+        if not accumulator.add(new_state.last_updated, new_state):
+            # The states are not in order, compile from the database
+            del self._entities[entity_id]
+
+    def get_period(
+        self,
+        entity_id: str,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        has_sum: bool,
+    ) -> _Period | None:
+        """Return the accumulated period of a sensor.
+
+        Returns None if the states in the period are not known.
+        """
+        if (
+            (accumulator := self._entities.get(entity_id)) is None
+            or accumulator.has_sum is not has_sum
+            or start != _period_start(start)
+            or end != start + StatisticsShortTerm.duration
+        ):
+            return None
+        return accumulator.get_period(start)
+
+    def trim(self, entity_ids: set[str], start: datetime.datetime) -> None:
+        """Drop the periods up to start.
+
+        Sensors not in entity_ids no longer have statistics compiled
+        and are dropped completely.
+        """
+        for entity_id in list(self._entities):
+            if entity_id in entity_ids:
+                self._entities[entity_id].trim(start)
+            else:
+                del self._entities[entity_id]
+
+
+@callback
+def async_setup_state_changed_processor(
+    hass: HomeAssistant,
+) -> Callable[[Event[EventStateChangedData]], None]:
+    """Set up the accumulator of recorded sensor state changes."""
+    accumulator = hass.data[ACCUMULATOR] = SensorStatisticsAccumulator()
+    return accumulator.process_state_changed
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -402,24 +747,45 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
+    # Get history between start and end, from the accumulated periods
+    # if the states in them are known or else from the database
+    history_list: dict[str, list[State]] = {}
+    measurements: dict[str, list[tuple[float, State]]] = {}
+    if (accumulator := hass.data.get(ACCUMULATOR)) is not None:
+        for _state in sensor_states:
+            entity_id = _state.entity_id
+            period = accumulator.get_period(
+                entity_id, start, end, "sum" in wanted_statistics[entity_id]
+            )
+            if isinstance(period, _SumPeriod):
+                history_list[entity_id] = period.states
+            elif isinstance(period, _MeasurementPeriod) and not period.mixed_units:
+                # An empty history skips the sensor like one without
+                # numeric states in the database
+                history_list[entity_id] = []
+                measurements[entity_id] = period.float_states()
+        accumulator.trim(set(wanted_statistics), start)
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id] and i.entity_id not in history_list
     ]
-    history_list: dict[str, list[State]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
-            hass,
-            session,
-            start - datetime.timedelta.resolution,
-            end,
-            entity_ids=entities_full_history,
-            significant_changes_only=False,
+        history_list.update(
+            history.get_full_significant_states_with_session(
+                hass,
+                session,
+                start - datetime.timedelta.resolution,
+                end,
+                entity_ids=entities_full_history,
+                significant_changes_only=False,
+            )
         )
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in history_list
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -436,6 +802,9 @@ def compile_statistics(  # noqa: C901
         entity_id = _state.entity_id
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
+        if float_states := measurements.get(entity_id):
+            entities_with_float_states[entity_id] = float_states
+            continue
         if not (entity_history := history_list.get(entity_id, [_state])):
             continue
         if not (float_states := _entity_history_to_float_and_state(entity_history)):
@@ -514,17 +883,21 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+        if entity_id in measurements:
+            # The mean, min and max were accumulated
+            (stat["mean"], _), (stat["min"], _), (stat["max"], _) = valid_float_states
+        else:
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
 
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _time_weighted_average(valid_float_states, start, end)
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
@@ -0,0 +1,166 @@
+"""Sample window of the statistics sensor with incremental aggregates."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime
+import math
+
+
+class SampleWindow:
+    """Keep the samples of a statistics sensor and aggregates over them.
+
+    Adding or removing a sample updates running sums, the Welford mean and
+    variance and the time weighted areas in constant time, so the
+    characteristics do not have to be computed from all samples on every
+    state change. Values are kept sorted in a compact array when order
+    statistics (median, percentiles, extremes) are needed.
+
+    The running sums are recomputed from the samples once every sample has
+    been replaced, which bounds the accumulated floating point error at an
+    amortized constant cost.
+    """
+
+    def __init__(
+        self, max_size: int | None, order_statistics: bool, circular: bool
+    ) -> None:
+        """Initialize the window."""
+        self.max_size = max_size
+        self.values: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        self._timestamps: deque[float] = deque()
+        self.sorted_values: array[float] | None = (
+            array("d") if order_statistics else None
+        )
+        self._circular = circular
+        self.sum = 0.0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.sin_sum = 0.0
+        self.cos_sum = 0.0
+        self.sum_differences = 0.0
+        self.sum_differences_nonnegative = 0.0
+        # Time weighted areas between consecutive samples
+        self.area_step = 0.0
+        self.area_linear = 0.0
+        self._removed_since_rebuild = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.values)
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add a sample, dropping the oldest one if the window is full."""
+        if self.max_size is not None and len(self.values) >= self.max_size:
+            self.popleft()
+        timestamp = age.timestamp()
+        if self.values:
+            prev = self.values[-1]
+            elapsed = timestamp - self._timestamps[-1]
+            self.area_step += prev * elapsed
+            self.area_linear += 0.5 * (value + prev) * elapsed
+            self.sum_differences += abs(value - prev)
+            self.sum_differences_nonnegative += value - prev if value >= prev else value
+        self.values.append(value)
+        self.ages.append(age)
+        self._timestamps.append(timestamp)
+        self.sum += value
+        delta = value - self.mean
+        self.mean += delta / len(self.values)
+        self._m2 += delta * (value - self.mean)
+        if self._circular:
+            radians = math.radians(value)
+            self.sin_sum += math.sin(radians)
+            self.cos_sum += math.cos(radians)
+        if self.sorted_values is not None:
+            insort(self.sorted_values, value)
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        value = self.values.popleft()
+        self.ages.popleft()
+        timestamp = self._timestamps.popleft()
+        if not self.values:
+            if self.sorted_values is not None:
+                del self.sorted_values[:]
+            self._rebuild()
+            return
+        following = self.values[0]
+        elapsed = self._timestamps[0] - timestamp
+        self.area_step -= value * elapsed
+        self.area_linear -= 0.5 * (value + following) * elapsed
+        self.sum_differences -= abs(following - value)
+        self.sum_differences_nonnegative -= (
+            following - value if following >= value else following
+        )
+        self.sum -= value
+        mean = self.mean
+        self.mean = (mean * (len(self.values) + 1) - value) / len(self.values)
+        self._m2 -= (value - mean) * (value - self.mean)
+        if self._circular:
+            radians = math.radians(value)
+            self.sin_sum -= math.sin(radians)
+            self.cos_sum -= math.cos(radians)
+        if self.sorted_values is not None:
+            del self.sorted_values[bisect_left(self.sorted_values, value)]
+        self._removed_since_rebuild += 1
+        if self._removed_since_rebuild >= len(self.values):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """Recompute the running sums from the samples."""
+        self._removed_since_rebuild = 0
+        values = self.values
+        timestamps = self._timestamps
+        count = len(values)
+        self.sum = math.fsum(values)
+        self.mean = self.sum / count if count else 0.0
+        self._m2 = math.fsum((value - self.mean) ** 2 for value in values)
+        if self._circular:
+            self.sin_sum = math.fsum(math.sin(math.radians(value)) for value in values)
+            self.cos_sum = math.fsum(math.cos(math.radians(value)) for value in values)
+        self.sum_differences = math.fsum(
+            abs(values[i] - values[i - 1]) for i in range(1, count)
+        )
+        self.sum_differences_nonnegative = math.fsum(
+            values[i] - values[i - 1] if values[i] >= values[i - 1] else values[i]
+            for i in range(1, count)
+        )
+        self.area_step = math.fsum(
+            values[i - 1] * (timestamps[i] - timestamps[i - 1]) for i in range(1, count)
+        )
+        self.area_linear = math.fsum(
+            0.5 * (values[i] + values[i - 1]) * (timestamps[i] - timestamps[i - 1])
+            for i in range(1, count)
+        )
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two samples."""
+        return max(self._m2, 0.0) / (len(self.values) - 1)
+
+    def median(self) -> float:
+        """Return the median of the samples."""
+        assert self.sorted_values is not None
+        sorted_values = self.sorted_values
+        middle = len(sorted_values) // 2
+        if len(sorted_values) % 2:
+            return sorted_values[middle]
+        return (sorted_values[middle - 1] + sorted_values[middle]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile of the samples, requires at least two samples.
+
+        Matches statistics.quantiles with n=100 and the exclusive method.
+        """
+        assert self.sorted_values is not None
+        sorted_values = self.sorted_values
+        count = len(sorted_values)
+        scaled = percentile * (count + 1)
+        idx = min(max(scaled // 100, 1), count - 1)
+        delta = scaled - idx * 100
+        return (
+            sorted_values[idx - 1] * (100 - delta) + sorted_values[idx] * delta
+        ) / 100
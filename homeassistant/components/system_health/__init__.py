@@ -64,7 +64,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     websocket_api.async_register_command(hass, handle_info)
     hass.data.setdefault(DOMAIN, {})
 
-    await integration_platform.async_process_integration_platforms(
+    # System health is only requested on demand, so the platforms
+    # are imported the first time the info is requested.
+    integration_platform.async_register_lazy_integration_platforms(
         hass, DOMAIN, _register_system_health_platform
     )
 
@@ -115,6 +117,7 @@ async def handle_info(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle an info request via a subscription."""
+    await integration_platform.async_load_lazy_integration_platforms(hass, DOMAIN)
     registrations: dict[str, SystemHealthRegistration] = hass.data[DOMAIN]
     data = {}
     pending_info: dict[tuple[str, str], asyncio.Task] = {}
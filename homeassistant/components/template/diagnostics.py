@@ -0,0 +1,19 @@
+"""Diagnostics support for Template."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.template import async_get_template_cache_stats
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    return {
+        "options": dict(entry.options),
+        "template_cache": async_get_template_cache_stats(hass),
+    }
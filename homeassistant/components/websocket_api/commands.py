@@ -65,6 +65,7 @@ from homeassistant.util.json import format_unserializable_data
 from . import const, decorators, messages
 from .connection import ActiveConnection
 from .messages import construct_result_message
+from .snapshot import async_subscribe_states_snapshot
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
@@ -309,12 +310,18 @@ async def handle_call_service(
         connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
 
 
+@callback
+def _async_can_read_all_states(connection: ActiveConnection) -> bool:
+    """Return if the user of the connection can read all states."""
+    user = connection.user
+    return user.is_admin or user.permissions.access_all_entities(POLICY_READ)
+
+
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
 ) -> list[State]:
-    user = connection.user
-    if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+    if _async_can_read_all_states(connection):
         return hass.states.async_all()
     entity_perm = connection.user.permissions.check_entity
     return [
@@ -367,6 +374,79 @@ def _send_handle_get_states_response(
     )
 
 
+class _MergedEntityChanges:
+    """Merge the state changes of a subscription while the client is behind.
+
+    Once the connection has PENDING_MSG_MERGE messages waiting to be
+    written, only the latest state of each changed entity is kept and a
+    single message is queued for them. The message is rendered when it
+    is written, so changes that happen before that are merged into it.
+    """
+
+    __slots__ = ("_connection", "_message_id_as_bytes", "_states", "_queued")
+
+    def __init__(
+        self, connection: ActiveConnection, message_id_as_bytes: bytes
+    ) -> None:
+        """Initialize the merged changes."""
+        self._connection = connection
+        self._message_id_as_bytes = message_id_as_bytes
+        self._states: dict[str, State | None] = {}
+        self._queued = False
+
+    @callback
+    def async_merge(self, event: Event[EventStateChangedData]) -> bool:
+        """Merge a state change if the client is behind.
+
+        Returns False if the state change should be sent as a diff.
+        """
+        connection = self._connection
+        if (
+            not self._queued
+            and connection.pending_message_count() < const.PENDING_MSG_MERGE
+        ):
+            return False
+        self._states[event.data["entity_id"]] = event.data["new_state"]
+        hass_data = connection.hass.data
+        hass_data[const.DATA_MERGED_MESSAGES] = (
+            hass_data.get(const.DATA_MERGED_MESSAGES, 0) + 1
+        )
+        if not self._queued:
+            self._queued = True
+            connection.send_message(self)
+        return True
+
+    def __call__(self) -> bytes:
+        """Render the message with the merged state changes."""
+        states = self._states
+        self._states = {}
+        self._queued = False
+        serialized_states: list[bytes] = []
+        removed: list[str] = []
+        for entity_id, state in states.items():
+            if state is None:
+                removed.append(entity_id)
+                continue
+            try:
+                serialized_states.append(state.as_compressed_state_json)
+            except (ValueError, TypeError):
+                self._connection.logger.error(
+                    "Unable to serialize to JSON. Bad data found at %s",
+                    format_unserializable_data(
+                        find_paths_unserializable_data(state, dump=JSON_DUMP)
+                    ),
+                )
+        parts = [b'{"id":', self._message_id_as_bytes, b',"type":"event","event":{']
+        if serialized_states or not removed:
+            parts.extend((b'"a":{', b",".join(serialized_states), b"}"))
+            if removed:
+                parts.append(b",")
+        if removed:
+            parts.extend((b'"r":', json_bytes(removed)))
+        parts.append(b"}}")
+        return b"".join(parts)
+
+
 @callback
 def _forward_entity_changes(
     send_message: Callable[[str | bytes | dict[str, Any]], None],
@@ -374,6 +454,7 @@ def _forward_entity_changes(
     entity_filter: Callable[[str], bool] | None,
     user: User,
     message_id_as_bytes: bytes,
+    merged: _MergedEntityChanges | None,
     event: Event[EventStateChangedData],
 ) -> None:
     """Forward entity state changed events to websocket."""
@@ -391,6 +472,8 @@ def _forward_entity_changes(
         and not permissions.check_entity(entity_id, POLICY_READ)
     ):
         return
+    if merged is not None and merged.async_merge(event):
+        return
     send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
 
 
@@ -399,6 +482,7 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("merge_pending_changes", default=False): bool,
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -412,10 +496,9 @@ def handle_subscribe_entities(
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
+    connection.subscriptions[msg_id] = unsub_state_changed = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
         partial(
             _forward_entity_changes,
@@ -424,10 +507,35 @@ def handle_subscribe_entities(
             entity_filter,
             connection.user,
             message_id_as_bytes,
+            _MergedEntityChanges(connection, message_id_as_bytes)
+            if msg["merge_pending_changes"]
+            else None,
         ),
     )
     connection.send_result(msg_id)
 
+    if not entity_ids and not entity_filter and _async_can_read_all_states(connection):
+        # Fast path when the subscription receives all states, the
+        # snapshot is shared with all other subscriptions and kept
+        # up to date while any of them is subscribed
+        snapshot, unsub_snapshot = async_subscribe_states_snapshot(hass)
+
+        @callback
+        def _unsub() -> None:
+            """Unsubscribe from state changes and the snapshot."""
+            unsub_state_changed()
+            unsub_snapshot()
+
+        connection.subscriptions[msg_id] = _unsub
+        try:
+            init_message = snapshot.async_get_init_message(message_id_as_bytes)
+        except (ValueError, TypeError):
+            pass
+        else:
+            connection.send_message(init_message)
+            return
+
+    states = _async_get_allowed_states(hass, connection)
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
@@ -446,7 +554,7 @@ def handle_subscribe_entities(
         pass
     else:
         _send_handle_entities_init_response(
-            connection, message_id_as_bytes, serialized_states
+            connection, message_id_as_bytes, b",".join(serialized_states)
         )
         return
 
@@ -463,26 +571,18 @@ def handle_subscribe_entities(
             )
 
     _send_handle_entities_init_response(
-        connection, message_id_as_bytes, serialized_states
+        connection, message_id_as_bytes, b",".join(serialized_states)
     )
 
 
 def _send_handle_entities_init_response(
     connection: ActiveConnection,
     message_id_as_bytes: bytes,
-    serialized_states: list[bytes],
+    joined_serialized_states: bytes,
 ) -> None:
     """Send handle entities init response."""
     connection.send_message(
-        b"".join(
-            (
-                b'{"id":',
-                message_id_as_bytes,
-                b',"type":"event","event":{"a":{',
-                b",".join(serialized_states),
-                b"}}}",
-            )
-        )
+        messages.entities_init_message(message_id_as_bytes, joined_serialized_states)
     )
 
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+from collections.abc import Callable, Coroutine, Hashable
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -30,6 +30,15 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+def _no_pending_messages() -> int:
+    """Return the number of pending messages when it is not known."""
+    return 0
+
+
+async def _async_no_drain(max_pending: int) -> None:
+    """Return right away when the pending messages are not known."""
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -37,6 +46,8 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "pending_message_count",
+        "async_wait_for_drain",
         "user",
         "refresh_token_id",
         "subscriptions",
@@ -51,7 +62,9 @@ class ActiveConnection:
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[bytes | str | dict[str, Any]], None],
+        send_message: Callable[
+            [bytes | str | dict[str, Any] | Callable[[], bytes]], None
+        ],
         user: User,
         refresh_token: RefreshToken,
     ) -> None:
@@ -59,6 +72,13 @@ class ActiveConnection:
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        # Set by the websocket handler to report its queue depth
+        self.pending_message_count: Callable[[], int] = _no_pending_messages
+        # Set by the websocket handler to wait until at most
+        # a number of messages are waiting to be written
+        self.async_wait_for_drain: Callable[[int], Coroutine[Any, Any, None]] = (
+            _async_no_drain
+        )
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
@@ -34,6 +34,10 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages from which subscriptions that allow it
+# merge their state changes instead of queueing a message per change.
+PENDING_MSG_MERGE: Final = 128
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -56,5 +60,9 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
+# Data used to store the handlers of the current connections
+DATA_HANDLERS: Final = f"{DOMAIN}.handlers"
+# Data used to count the state changes merged into pending messages
+DATA_MERGED_MESSAGES: Final = f"{DOMAIN}.merged_messages"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
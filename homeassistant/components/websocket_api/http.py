@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterable
 import datetime as dt
 from functools import partial
 import logging
@@ -24,6 +24,7 @@ from homeassistant.util.json import json_loads
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
     DATA_CONNECTIONS,
+    DATA_HANDLERS,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
@@ -80,8 +81,11 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_deferred_messages",
         "_ready_future",
         "_release_ready_queue_size",
+        "_drain_waiters",
+        "_writer_done",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -102,9 +106,14 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[bytes] = deque()
+        self._message_queue: deque[bytes | Callable[[], bytes]] = deque()
+        # Number of messages in the queue that are rendered when written
+        self._deferred_messages = 0
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Futures waiting for the queue to drain to a number of messages
+        self._drain_waiters: list[tuple[int, asyncio.Future[None]]] = []
+        self._writer_done = False
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -115,6 +124,38 @@ class WebSocketHandler:
             f"description={self.description}>"
         )
 
+    @property
+    def pending_message_count(self) -> int:
+        """Return the number of messages waiting to be written."""
+        return len(self._message_queue)
+
+    async def async_wait_for_drain(self, max_pending: int) -> None:
+        """Wait until at most max_pending messages are waiting to be written.
+
+        Returns right away once the writer is done since the
+        remaining messages will never be written.
+        """
+        if len(self._message_queue) <= max_pending or self._writer_done:
+            return
+        future: asyncio.Future[None] = self._loop.create_future()
+        self._drain_waiters.append((max_pending, future))
+        await future
+
+    @callback
+    def _release_drain_waiters(self) -> None:
+        """Release the waiters for which the queue has drained enough."""
+        queue_size = len(self._message_queue)
+        waiters = self._drain_waiters
+        self._drain_waiters = []
+        for max_pending, future in waiters:
+            if future.done():
+                # The waiter was cancelled
+                continue
+            if queue_size <= max_pending or self._writer_done:
+                future.set_result(None)
+            else:
+                self._drain_waiters.append((max_pending, future))
+
     @property
     def description(self) -> str:
         """Return a description of the connection."""
@@ -155,16 +196,31 @@ class WebSocketHandler:
 
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
+                    if type(message) is not bytes:
+                        self._deferred_messages -= 1
+                        message = message()
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
+                    if self._drain_waiters:
+                        self._release_drain_waiters()
                     continue
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
+                if self._deferred_messages:
+                    self._deferred_messages = 0
+                    queued_messages: Iterable[bytes] = [
+                        message if type(message) is bytes else message()
+                        for message in message_queue
+                    ]
+                else:
+                    queued_messages = message_queue  # type: ignore[assignment]
+                coalesced_messages = b"".join((b"[", b",".join(queued_messages), b"]"))
                 message_queue.clear()
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
                 await send_bytes_text(coalesced_messages)
+                if self._drain_waiters:
+                    self._release_drain_waiters()
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -174,6 +230,8 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            self._writer_done = True
+            self._release_drain_waiters()
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -183,9 +241,14 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | bytes | dict[str, Any]) -> None:
+    def _send_message(
+        self, message: str | bytes | dict[str, Any] | Callable[[], bytes]
+    ) -> None:
         """Queue sending a message to the client.
 
+        A callable message is called to render the message
+        when it is written.
+
         Closes connection if the client is not reading the messages.
 
         Async friendly.
@@ -200,6 +263,8 @@ class WebSocketHandler:
                 message = message_to_json_bytes(message)
             elif isinstance(message, str):
                 message = message.encode("utf-8")
+            else:
+                self._deferred_messages += 1
 
         message_queue = self._message_queue
         message_queue.append(message)
@@ -401,8 +466,11 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
+        connection.pending_message_count = lambda: self.pending_message_count
+        connection.async_wait_for_drain = self.async_wait_for_drain
         self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
+        self._hass.data.setdefault(DATA_HANDLERS, set()).add(self)
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
 
         self._authenticated = True
@@ -522,6 +590,7 @@ class WebSocketHandler:
 
                 if connection is not None:
                     hass.data[DATA_CONNECTIONS] -= 1
+                    hass.data[DATA_HANDLERS].discard(self)
                     self._connection = None
 
                 async_dispatcher_send(hass, SIGNAL_WEBSOCKET_DISCONNECTED)
@@ -141,6 +141,21 @@ def _partial_cached_event_message(event: Event) -> bytes:
     )
 
 
+def entities_init_message(
+    message_id_as_bytes: bytes, joined_serialized_states: bytes
+) -> bytes:
+    """Return the subscribe_entities event message with the initial states."""
+    return b"".join(
+        (
+            b'{"id":',
+            message_id_as_bytes,
+            b',"type":"event","event":{"a":{',
+            joined_serialized_states,
+            b"}}}",
+        )
+    )
+
+
 def cached_state_diff_message(
     message_id_as_bytes: bytes, event: Event[EventStateChangedData]
 ) -> bytes:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -10,6 +10,8 @@ from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import (
     DATA_CONNECTIONS,
+    DATA_HANDLERS,
+    DATA_MERGED_MESSAGES,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
 )
@@ -22,9 +24,7 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the API streams platform."""
-    entity = APICount()
-
-    async_add_entities([entity])
+    async_add_entities([APICount(), APIPendingMessages(), APIMergedMessages()])
 
 
 class APICount(SensorEntity):
@@ -54,3 +54,30 @@ class APICount(SensorEntity):
     def _update_count(self) -> None:
         self._attr_native_value = self.hass.data.get(DATA_CONNECTIONS, 0)
         self.async_write_ha_state()
+
+
+class APIPendingMessages(SensorEntity):
+    """Entity to represent the messages waiting to be sent to the clients."""
+
+    _attr_name = "Pending messages"
+    _attr_native_unit_of_measurement = "messages"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    async def async_update(self) -> None:
+        """Update the number of pending messages."""
+        self._attr_native_value = sum(
+            handler.pending_message_count
+            for handler in self.hass.data.get(DATA_HANDLERS, ())
+        )
+
+
+class APIMergedMessages(SensorEntity):
+    """Entity to represent the state changes merged for clients that are behind."""
+
+    _attr_name = "Merged messages"
+    _attr_native_unit_of_measurement = "messages"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    async def async_update(self) -> None:
+        """Update the number of merged messages."""
+        self._attr_native_value = self.hass.data.get(DATA_MERGED_MESSAGES, 0)
@@ -0,0 +1,151 @@
+"""Shared snapshot of the compressed states for subscribe_entities."""
+
+from __future__ import annotations
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .messages import entities_init_message
+
+DATA_STATES_SNAPSHOT: HassKey[CompressedStatesSnapshot] = HassKey(
+    f"{DOMAIN}_states_snapshot"
+)
+
+# Number of entities serialized together, a state change only
+# requires the chunk of the entity to be joined again.
+SNAPSHOT_CHUNK_SIZE = 256
+
+# Number of init messages kept until a state changes, clients
+# usually subscribe with one of a few message ids
+MAX_INIT_MESSAGES = 16
+
+
+class CompressedStatesSnapshot:
+    """Keep the JSON of the compressed states of all entities.
+
+    The snapshot is shared by all subscribe_entities subscriptions that
+    receive every state, so a new subscription does not have to join the
+    compressed state of every entity again. It is kept up to date from
+    state_changed events in chunks, so a state change only invalidates
+    the chunk of the entity. The snapshot stops following the state
+    changes once the last subscription using it is removed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot."""
+        self._chunk_by_entity_id: dict[str, int] = {}
+        self._chunks: list[dict[str, State]] = []
+        self._chunks_json: list[bytes] = []
+        self._dirty_chunks: set[int] = set()
+        self._json: bytes | None = None
+        self._init_messages: dict[bytes, bytes] = {}
+        self._hass = hass
+        self._subscribers = 0
+        for state in hass.states.async_all():
+            self._async_set_state(state)
+        self._unsub_state_changed = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed
+        )
+
+    @callback
+    def async_add_subscriber(self) -> CALLBACK_TYPE:
+        """Add a subscription using the snapshot and return a remove callback."""
+        self._subscribers += 1
+
+        @callback
+        def _async_remove_subscriber() -> None:
+            """Remove the subscription and drop the snapshot if it was the last."""
+            self._subscribers -= 1
+            if self._subscribers:
+                return
+            self._unsub_state_changed()
+            if self._hass.data.get(DATA_STATES_SNAPSHOT) is self:
+                del self._hass.data[DATA_STATES_SNAPSHOT]
+
+        return _async_remove_subscriber
+
+    @callback
+    def _async_set_state(self, state: State) -> None:
+        """Set the state of an entity."""
+        entity_id = state.entity_id
+        if (chunk_idx := self._chunk_by_entity_id.get(entity_id)) is None:
+            if not self._chunks or len(self._chunks[-1]) >= SNAPSHOT_CHUNK_SIZE:
+                self._chunks.append({})
+                self._chunks_json.append(b"")
+            chunk_idx = self._chunk_by_entity_id[entity_id] = len(self._chunks) - 1
+        self._chunks[chunk_idx][entity_id] = state
+        self._dirty_chunks.add(chunk_idx)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the snapshot with a state change."""
+        self._json = None
+        self._init_messages.clear()
+        if (new_state := event.data["new_state"]) is not None:
+            self._async_set_state(new_state)
+            return
+        entity_id = event.data["entity_id"]
+        if (chunk_idx := self._chunk_by_entity_id.pop(entity_id, None)) is not None:
+            del self._chunks[chunk_idx][entity_id]
+            self._dirty_chunks.add(chunk_idx)
+
+    @callback
+    def async_get_json(self) -> bytes:
+        """Return the compressed states of all entities joined with commas.
+
+        Raises ValueError or TypeError if a state can not be serialized.
+        """
+        if self._json is not None:
+            return self._json
+        chunks_json = self._chunks_json
+        for chunk_idx in self._dirty_chunks:
+            chunks_json[chunk_idx] = b",".join(
+                state.as_compressed_state_json
+                for state in self._chunks[chunk_idx].values()
+            )
+        self._dirty_chunks.clear()
+        self._json = b",".join(chunk_json for chunk_json in chunks_json if chunk_json)
+        return self._json
+
+    @callback
+    def async_get_init_message(self, message_id_as_bytes: bytes) -> bytes:
+        """Return the subscribe_entities init message for a message id.
+
+        The message is shared by subscriptions with the same message id
+        until a state changes, so the states are not copied into a new
+        message for every subscription.
+
+        Raises ValueError or TypeError if a state can not be serialized.
+        """
+        init_messages = self._init_messages
+        if (message := init_messages.get(message_id_as_bytes)) is not None:
+            return message
+        if len(init_messages) >= MAX_INIT_MESSAGES:
+            init_messages.clear()
+        message = init_messages[message_id_as_bytes] = entities_init_message(
+            message_id_as_bytes, self.async_get_json()
+        )
+        return message
+
+
+@callback
+def async_subscribe_states_snapshot(
+    hass: HomeAssistant,
+) -> tuple[CompressedStatesSnapshot, CALLBACK_TYPE]:
+    """Return the shared snapshot of the compressed states.
+
+    The returned callback must be called when the subscription no
+    longer uses the snapshot.
+    """
+    if (snapshot := hass.data.get(DATA_STATES_SNAPSHOT)) is None:
+        snapshot = hass.data[DATA_STATES_SNAPSHOT] = CompressedStatesSnapshot(hass)
+    return snapshot, snapshot.async_add_subscriber()
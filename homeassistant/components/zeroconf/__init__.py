@@ -5,8 +5,6 @@ from __future__ import annotations
 import contextlib
 from contextlib import suppress
 from dataclasses import dataclass
-from fnmatch import translate
-from functools import lru_cache
 from ipaddress import IPv4Address, IPv6Address
 import logging
 import re
@@ -34,6 +32,7 @@ from homeassistant.data_entry_flow import BaseServiceInfo
 from homeassistant.helpers import discovery_flow, instance_id
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.discovery_flow import DiscoveryKey
+from homeassistant.helpers.discovery_matcher import MatcherIndex, compile_fnmatch
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.typing import ConfigType
@@ -266,13 +265,51 @@ def _build_homekit_model_lookups(
 
     for model, discovery in homekit_models.items():
         if "*" in model or "?" in model or "[" in model:
-            homekit_model_matchers[_compile_fnmatch(model)] = discovery
+            homekit_model_matchers[compile_fnmatch(model)] = discovery
         else:
             homekit_model_lookup[model] = discovery
 
     return homekit_model_lookup, homekit_model_matchers
 
 
+def _build_zeroconf_matcher_indexes(
+    zeroconf_types: dict[str, list[ZeroconfMatcher]],
+) -> dict[str, MatcherIndex[str | tuple[str, str], ZeroconfMatcher]]:
+    """Build matcher indexes by service type.
+
+    The name is indexed as the name field and every property
+    as a field of the property key.
+    """
+    matcher_indexes: dict[
+        str, MatcherIndex[str | tuple[str, str], ZeroconfMatcher]
+    ] = {}
+    for service_type, matchers in zeroconf_types.items():
+        matcher_index = matcher_indexes[service_type] = MatcherIndex()
+        for matcher in matchers:
+            patterns: dict[str | tuple[str, str], str] = {}
+            if ATTR_NAME in matcher:
+                patterns[ATTR_NAME] = matcher[ATTR_NAME]
+            for key, value in matcher.get(ATTR_PROPERTIES, {}).items():
+                patterns[(ATTR_PROPERTIES, key)] = value
+            matcher_index.add(patterns, matcher)
+    return matcher_indexes
+
+
+def _match_zeroconf_matchers(
+    matcher_index: MatcherIndex[str | tuple[str, str], ZeroconfMatcher],
+    name: str,
+    props: dict[str, str | None],
+) -> list[ZeroconfMatcher]:
+    """Return the matchers of a service type matching the name and properties."""
+    match_values: dict[str | tuple[str, str], str | None] = {}
+    for field in matcher_index.fields:
+        if field == ATTR_NAME:
+            match_values[field] = name.lower()
+        elif (prop_val := props.get(field[1])) is not None:
+            match_values[field] = prop_val.lower()
+    return matcher_index.match(match_values)
+
+
 def _filter_disallowed_characters(name: str) -> str:
     """Filter disallowed characters from a string.
 
@@ -326,15 +363,6 @@ async def _async_register_hass_zc_service(
     await aio_zc.async_register_service(info, allow_name_change=True)
 
 
-def _match_against_props(matcher: dict[str, str], props: dict[str, str | None]) -> bool:
-    """Check a matcher to ensure all values in props."""
-    for key, value in matcher.items():
-        prop_val = props.get(key)
-        if prop_val is None or not _memorized_fnmatch(prop_val.lower(), value):
-            return False
-    return True
-
-
 def is_homekit_paired(props: dict[str, Any]) -> bool:
     """Check properties to see if a device is homekit paired."""
     if HOMEKIT_PAIRED_STATUS_FLAG not in props:
@@ -361,6 +389,9 @@ class ZeroconfDiscovery:
         self.hass = hass
         self.zeroconf = zeroconf
         self.zeroconf_types = zeroconf_types
+        self.zeroconf_matcher_indexes = _build_zeroconf_matcher_indexes(
+            zeroconf_types
+        )
         self.homekit_model_lookups = homekit_model_lookups
         self.homekit_model_matchers = homekit_model_matchers
         self.async_service_browser: AsyncServiceBrowser | None = None
@@ -523,22 +554,12 @@ class ZeroconfDiscovery:
                 # discover it, we can stop here.
                 return
 
-        if not (matchers := self.zeroconf_types.get(service_type)):
-            return
-
         # Not all homekit types are currently used for discovery
         # so not all service type exist in zeroconf_types
-        for matcher in matchers:
-            if len(matcher) > 1:
-                if ATTR_NAME in matcher and not _memorized_fnmatch(
-                    info.name.lower(), matcher[ATTR_NAME]
-                ):
-                    continue
-                if ATTR_PROPERTIES in matcher and not _match_against_props(
-                    matcher[ATTR_PROPERTIES], props
-                ):
-                    continue
+        if not (matcher_index := self.zeroconf_matcher_indexes.get(service_type)):
+            return
 
+        for matcher in _match_zeroconf_matchers(matcher_index, info.name, props):
             matcher_domain = matcher[ATTR_DOMAIN]
             context = {
                 "source": config_entries.SOURCE_ZEROCONF,
@@ -651,24 +672,3 @@ def _truncate_location_name_to_valid(location_name: str) -> str:
         location_name,
     )
     return location_name.encode("utf-8")[:MAX_NAME_LEN].decode("utf-8", "ignore")
-
-
-@lru_cache(maxsize=4096, typed=True)
-def _compile_fnmatch(pattern: str) -> re.Pattern:
-    """Compile a fnmatch pattern."""
-    return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    Zeroconf has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
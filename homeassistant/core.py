@@ -11,6 +11,7 @@ from collections import UserDict, defaultdict
 from collections.abc import (
     Callable,
     Collection,
+    Container,
     Coroutine,
     Iterable,
     KeysView,
@@ -1400,11 +1401,23 @@ def _event_repr(
     return f"<Event {event_type}[{str(origin)[0]}]>"
 
 
+@dataclass(slots=True, frozen=True)
+class _ListenerIndex:
+    """Entity ids or domains an indexed listener runs for."""
+
+    keys: Container[str]  # owned by the listener
+    by_domain: bool
+
+
 _FilterableJobType = tuple[
     HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],  # job
     Callable[[_DataT], bool] | None,  # event_filter
+    _ListenerIndex | None,  # index
 ]
 
+# Events that can be listened to indexed by the entity_id in the event data
+INDEXED_EVENT_TYPES: Final = {EVENT_STATE_CHANGED, EVENT_STATE_REPORTED}
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1448,9 +1461,9 @@ class EventBus:
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
-        self._listeners: defaultdict[
-            EventType[Any] | str, list[_FilterableJobType[Any]]
-        ] = defaultdict(list)
+        # The listener lists are replaced instead of mutated when listeners
+        # are added or removed so they can be iterated without a copy
+        self._listeners: dict[EventType[Any] | str, list[_FilterableJobType[Any]]] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -1540,28 +1553,45 @@ class EventBus:
             match_all_listeners = EMPTY_LIST
 
         event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
-            if event_filter is not None:
-                try:
-                    if event_data is None or not event_filter(event_data):
+        for filterable_jobs in (listeners, match_all_listeners):
+            for job, event_filter, index in filterable_jobs:
+                if index is not None:
+                    # Look up the entity_id or its domain in the index
+                    # instead of calling a filter
+                    if event_data is None:
+                        continue
+                    entity_id: str = event_data["entity_id"]  # type: ignore[index]
+                    keys = index.keys
+                    if index.by_domain:
+                        if (
+                            entity_id.partition(".")[0] not in keys
+                            and MATCH_ALL not in keys
+                        ):
+                            continue
+                    elif entity_id not in keys:
                         continue
-                except Exception:
-                    _LOGGER.exception("Error in event filter")
-                    continue
-
-            if not event:
-                event = Event(
-                    event_type,
-                    event_data,
-                    origin,
-                    time_fired,
-                    context,
-                )
 
-            try:
-                self._hass.async_run_hass_job(job, event)
-            except Exception:
-                _LOGGER.exception("Error running job: %s", job)
+                if event_filter is not None:
+                    try:
+                        if event_data is None or not event_filter(event_data):
+                            continue
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
+                        continue
+
+                if not event:
+                    event = Event(
+                        event_type,
+                        event_data,
+                        origin,
+                        time_fired,
+                        context,
+                    )
+
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
 
     def listen(
         self,
@@ -1618,7 +1648,11 @@ class EventBus:
 
         if event_filter is not None and not is_callback_check_partial(event_filter):
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
-        filterable_job = (HassJob(listener, f"listen {event_type}"), event_filter)
+        filterable_job = (
+            HassJob(listener, f"listen {event_type}"),
+            event_filter,
+            None,
+        )
         if event_type == EVENT_STATE_REPORTED:
             if not event_filter:
                 raise HomeAssistantError(
@@ -1633,11 +1667,56 @@ class EventBus:
         filterable_job: _FilterableJobType[_DataT],
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
-        self._listeners[event_type].append(filterable_job)
+        if event_type == MATCH_ALL:
+            self._match_all_listeners = [*self._match_all_listeners, filterable_job]
+            self._listeners[MATCH_ALL] = self._match_all_listeners
+        else:
+            self._listeners[event_type] = [
+                *self._listeners.get(event_type, EMPTY_LIST),
+                filterable_job,
+            ]
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_indexed(
+        self,
+        event_type: EventType[_DataT] | str,
+        index: Container[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        by_domain: bool = False,
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of entities in an index.
+
+        The listener runs for events where the entity_id, or its domain if
+        by_domain is set, is in the index and the event_filter, if any,
+        accepts the event data. A domain index containing MATCH_ALL matches
+        all domains. The index should be a set or a dict, it is owned by the
+        caller and can be changed while listening, which avoids calling an
+        event filter for every event. Indexed listeners run in the order
+        they were added with the other listeners of the event type.
+
+        Only the event types in INDEXED_EVENT_TYPES are supported.
+
+        This method must be run in the event loop.
+        """
+        if event_type not in INDEXED_EVENT_TYPES:
+            raise HomeAssistantError(
+                f"Event {event_type} can not be listened to by entity"
+            )
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        return self._async_listen_filterable_job(
+            event_type,
+            (
+                HassJob(listener, f"listen indexed {event_type}"),
+                event_filter,
+                _ListenerIndex(index, by_domain),
+            ),
+        )
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1698,6 +1777,7 @@ class EventBus:
                     job_type=HassJobType.Callback,
                 ),
                 None,
+                None,
             ),
         )
         one_time_listener.remove = remove
@@ -1714,17 +1794,24 @@ class EventBus:
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(filterable_job)
-
-            # delete event_type list if empty
-            if not self._listeners[event_type] and event_type != MATCH_ALL:
-                self._listeners.pop(event_type)
+            listeners = self._listeners[event_type].copy()
+            listeners.remove(filterable_job)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+            return
+
+        if event_type == MATCH_ALL:
+            self._match_all_listeners = listeners
+            self._listeners[MATCH_ALL] = listeners
+        elif listeners:
+            self._listeners[event_type] = listeners
+        else:
+            # delete event_type list if empty
+            del self._listeners[event_type]
 
 
 class CompressedState(TypedDict):
@@ -2271,6 +2358,109 @@ class StateMachine:
 
         This method must be run in the event loop.
         """
+        # It is much faster to convert a timestamp to a utc datetime object
+        # than converting a utc datetime object to a timestamp since cpython
+        # does not have a fast path for handling the UTC timezone and has to do
+        # multiple local timezone conversions.
+        #
+        # from_timestamp implementation:
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
+        #
+        # timestamp implementation:
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
+        now = dt_util.utc_from_timestamp(timestamp)
+
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+
+        self._async_set_at(
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+            timestamp,
+            now,
+        )
+
+    @callback
+    def async_set_many_internal(
+        self,
+        updates: Iterable[
+            tuple[
+                str,
+                str,
+                Mapping[str, Any] | None,
+                bool,
+                Context | None,
+                StateInfo | None,
+            ]
+        ],
+        timestamp: float,
+    ) -> list[tuple[str, InvalidStateError]]:
+        """Set the states of many entities in one pass.
+
+        Each update is a tuple of entity_id, state, attributes, force_update,
+        context and state_info, as passed to async_set_internal. All states
+        share the timestamp and the updates without a context share one
+        context. A state_changed or state_reported event is still fired for
+        each entity.
+
+        Returns the entity ids and errors of the updates with an invalid
+        state, the other updates are still applied.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        now = dt_util.utc_from_timestamp(timestamp)
+        shared_context: Context | None = None
+        failed: list[tuple[str, InvalidStateError]] = []
+        for (
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+        ) in updates:
+            if context is None:
+                if shared_context is None:
+                    shared_context = Context(id=ulid_at_time(timestamp))
+                context = shared_context
+            try:
+                self._async_set_at(
+                    entity_id,
+                    new_state,
+                    attributes,
+                    force_update,
+                    context,
+                    state_info,
+                    timestamp,
+                    now,
+                )
+            except InvalidStateError as err:
+                failed.append((entity_id, err))
+        return failed
+
+    @callback
+    def _async_set_at(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context,
+        state_info: StateInfo | None,
+        timestamp: float,
+        now: datetime.datetime,
+    ) -> None:
+        """Set the state of an entity at the given time."""
         # Most cases the key will be in the dict
         # so we optimize for the happy path as
         # python 3.11+ has near zero overhead for
@@ -2288,22 +2478,6 @@ class StateMachine:
             same_attr = old_state.attributes == attributes
             last_changed = old_state.last_changed if same_state else None
 
-        # It is much faster to convert a timestamp to a utc datetime object
-        # than converting a utc datetime object to a timestamp since cpython
-        # does not have a fast path for handling the UTC timezone and has to do
-        # multiple local timezone conversions.
-        #
-        # from_timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
-        #
-        # timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
-
-        if context is None:
-            context = Context(id=ulid_at_time(timestamp))
-
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
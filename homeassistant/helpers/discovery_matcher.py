@@ -0,0 +1,137 @@
+"""Compiled matchers for the discovery integrations."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Mapping, Sequence
+from fnmatch import translate
+from functools import lru_cache
+import re
+
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+@lru_cache(maxsize=4096, typed=True)
+def compile_fnmatch(pattern: str) -> re.Pattern:
+    """Compile a fnmatch pattern."""
+    return re.compile(translate(pattern))
+
+
+class PatternIndex[_T]:
+    """Index of values by the fnmatch pattern of one field.
+
+    Patterns without wildcards are looked up in a dict. The other
+    patterns are combined into one regex so a value that matches none
+    of them, the common case, is rejected with a single match. Only
+    when it matches are the patterns matched one by one.
+    """
+
+    __slots__ = ("_exact", "_patterns", "_values", "_combined")
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._exact: dict[str, list[_T]] = {}
+        self._patterns: list[re.Pattern] = []
+        self._values: list[list[_T]] = []
+        self._combined: re.Pattern | None = None
+
+    def add(self, pattern: str, value: _T) -> None:
+        """Add a value for a pattern."""
+        if _WILDCARD_CHARS.isdisjoint(pattern):
+            self._exact.setdefault(pattern, []).append(value)
+            return
+        compiled = compile_fnmatch(pattern)
+        if compiled in self._patterns:
+            self._values[self._patterns.index(compiled)].append(value)
+            return
+        self._patterns.append(compiled)
+        self._values.append([value])
+        self._combined = re.compile(
+            "|".join(f"(?:{compiled.pattern})" for compiled in self._patterns)
+        )
+
+    def match(self, name: str) -> Sequence[_T]:
+        """Return the values of the patterns matching a name."""
+        exact = self._exact.get(name, ())
+        if self._combined is None or not self._combined.match(name):
+            return exact
+        matched = list(exact)
+        for pattern, values in zip(self._patterns, self._values, strict=True):
+            if pattern.match(name):
+                matched.extend(values)
+        return matched
+
+
+class MatcherIndex[_K: Hashable, _T]:
+    """Index of matchers that match when the patterns of all their fields match.
+
+    Every field has its own pattern index. A value is matched when the
+    number of its matched fields equals the number of its patterns,
+    values without patterns always match. As long as no value has more
+    than one pattern the matched fields are not counted.
+    """
+
+    __slots__ = (
+        "_values",
+        "_required",
+        "_unconditional",
+        "_fields",
+        "_conjunctive",
+        "fields",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._values: list[_T] = []
+        self._required: list[int] = []
+        self._unconditional: list[int] = []
+        self._fields: dict[_K, PatternIndex[int]] = {}
+        self._conjunctive = False
+        # The fields of the patterns
+        self.fields: tuple[_K, ...] = ()
+
+    def add(self, patterns: Mapping[_K, str], value: _T) -> None:
+        """Add a value matching when all patterns match."""
+        position = len(self._values)
+        self._values.append(value)
+        self._required.append(len(patterns))
+        if not patterns:
+            self._unconditional.append(position)
+        elif len(patterns) > 1:
+            self._conjunctive = True
+        for field, pattern in patterns.items():
+            if (index := self._fields.get(field)) is None:
+                index = self._fields[field] = PatternIndex()
+                self.fields = (*self.fields, field)
+            index.add(pattern, position)
+
+    def match(self, values: Mapping[_K, str | None]) -> list[_T]:
+        """Return the matched values in the order they were added."""
+        if not self._fields:
+            return self._values.copy()
+        if self._conjunctive:
+            matched = self._match_conjunctive(values)
+        else:
+            matched = [
+                position
+                for field, index in self._fields.items()
+                if (value := values.get(field)) is not None
+                for position in index.match(value)
+            ]
+        if not matched:
+            return [self._values[position] for position in self._unconditional]
+        matched.extend(self._unconditional)
+        return [self._values[position] for position in sorted(matched)]
+
+    def _match_conjunctive(self, values: Mapping[_K, str | None]) -> list[int]:
+        """Return the positions of the values with all their fields matched."""
+        matched_fields: dict[int, int] = {}
+        for field, index in self._fields.items():
+            if (value := values.get(field)) is not None:
+                for position in index.match(value):
+                    matched_fields[position] = matched_fields.get(position, 0) + 1
+        required = self._required
+        return [
+            position
+            for position, count in matched_fields.items()
+            if count == required[position]
+        ]
@@ -5,7 +5,8 @@ from __future__ import annotations
 from abc import ABCMeta
 import asyncio
 from collections import deque
-from collections.abc import Callable, Coroutine, Iterable, Mapping
+from collections.abc import Callable, Coroutine, Generator, Iterable, Mapping
+from contextlib import contextmanager
 import dataclasses
 from enum import Enum, IntFlag, auto
 import functools as ft
@@ -75,6 +76,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_STATE_WRITE_BATCH = "entity_state_write_batch"
 
 # Used when converting float states to string: limit precision according to machine
 # epsilon to make the string representation readable
@@ -100,6 +102,68 @@ def entity_sources(hass: HomeAssistant) -> dict[str, EntityInfo]:
     return {}
 
 
+@contextmanager
+def async_batch_state_writes(hass: HomeAssistant) -> Generator[None]:
+    """Defer state writes of entities and write them in one pass at the end.
+
+    Entities that write their state more than once during the batch are
+    written once with their latest state, so the intermediate states are
+    never seen by listeners or the recorder. The state machine is not
+    updated until the batch ends, reading a state inside the batch
+    returns the state from before the batch. All states written by the
+    batch share the same timestamp. Nested batches are written by the
+    outermost batch.
+
+    This must be run in the event loop.
+    """
+    if DATA_STATE_WRITE_BATCH in hass.data:
+        yield
+        return
+    batch: dict[Entity, None] = {}
+    hass.data[DATA_STATE_WRITE_BATCH] = batch
+    try:
+        yield
+    finally:
+        del hass.data[DATA_STATE_WRITE_BATCH]
+        if batch:
+            _async_write_ha_states(hass, batch)
+
+
+@callback
+def _async_write_ha_states(hass: HomeAssistant, entities: Iterable[Entity]) -> None:
+    """Write the state of entities to the state machine in one pass."""
+    updates: list[
+        tuple[
+            str,
+            str,
+            Mapping[str, Any] | None,
+            bool,
+            Context | None,
+            StateInfo | None,
+        ]
+    ] = []
+    for entity in entities:
+        if type(entity)._async_write_ha_state is not Entity._async_write_ha_state:  # noqa: SLF001
+            # The entity does more than writing its state
+            entity._async_write_ha_state()  # noqa: SLF001
+        elif (update := entity._async_calculate_state_write()) is not None:  # noqa: SLF001
+            updates.append(update[:-1])
+    if not updates:
+        return
+    if not (failed := hass.states.async_set_many_internal(updates, timer())):
+        return
+    updates_by_entity_id = {update[0]: update for update in updates}
+    for entity_id, err in failed:
+        _LOGGER.error(
+            "Failed to set state for %s, fall back to %s: %s",
+            entity_id,
+            STATE_UNKNOWN,
+            err,
+        )
+        _, _, _, force_update, context, _ = updates_by_entity_id[entity_id]
+        hass.states.async_set(entity_id, STATE_UNKNOWN, {}, force_update, context)
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -1002,6 +1066,9 @@ class Entity(
             self._async_verify_state_writable()
         if self.hass.loop_thread_id != threading.get_ident():
             report_non_thread_safe_operation("async_write_ha_state")
+        if (batch := self.hass.data.get(DATA_STATE_WRITE_BATCH)) is not None:
+            batch[self] = None
+            return
         self._async_write_ha_state()
 
     def _stringify_state(self, available: bool) -> str:
@@ -1105,9 +1172,36 @@ class Entity(
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if (update := self._async_calculate_state_write()) is None:
+            return
+        entity_id, state, attr, force_update, context, state_info, time_now = update
+        hass = self.hass
+        try:
+            hass.states.async_set_internal(
+                entity_id, state, attr, force_update, context, state_info, time_now
+            )
+        except InvalidStateError:
+            _LOGGER.exception(
+                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
+            )
+            hass.states.async_set(entity_id, STATE_UNKNOWN, {}, force_update, context)
+
+    @callback
+    def _async_calculate_state_write(
+        self,
+    ) -> (
+        tuple[str, str, dict[str, Any], bool, Context | None, StateInfo | None, float]
+        | None
+    ):
+        """Calculate the state to write to the state machine.
+
+        Returns None if the state should not be written, otherwise the
+        arguments for the state machine and the time the state was
+        calculated at.
+        """
         if self._platform_state is EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
-            return
+            return None
 
         hass = self.hass
         entity_id = self.entity_id
@@ -1123,7 +1217,7 @@ class Entity(
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
@@ -1205,23 +1299,15 @@ class Entity(
             self._context = None
             self._context_set = None
 
-        try:
-            hass.states.async_set_internal(
-                entity_id,
-                state,
-                attr,
-                self.force_update,
-                self._context,
-                self._state_info,
-                time_now,
-            )
-        except InvalidStateError:
-            _LOGGER.exception(
-                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
-            )
-            hass.states.async_set(
-                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
-            )
+        return (
+            entity_id,
+            state,
+            attr,
+            self.force_update,
+            self._context,
+            self._state_info,
+            time_now,
+        )
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -34,6 +34,7 @@ from homeassistant.exceptions import (
     PlatformNotReady,
 )
 from homeassistant.generated import languages
+from homeassistant.loader import DATA_COMPONENTS
 from homeassistant.setup import SetupPhases, async_start_setup
 from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.hass_dict import HassKey
@@ -66,6 +67,9 @@ DATA_DOMAIN_ENTITIES: HassKey[dict[str, dict[str, Entity]]] = HassKey("domain_en
 DATA_DOMAIN_PLATFORM_ENTITIES: HassKey[dict[tuple[str, str], dict[str, Entity]]] = (
     HassKey("domain_platform_entities")
 )
+DATA_INTEGRATION_SERVICE_CALLS: HassKey[dict[str, asyncio.Semaphore | None]] = HassKey(
+    "integration_service_calls"
+)
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
 _LOGGER = getLogger(__name__)
@@ -157,6 +161,13 @@ class EntityPlatform:
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
 
+        self._service_call_semaphores: tuple[asyncio.Semaphore, ...] | None = None
+        # Platforms that push their own state after a command can skip
+        # the refresh of polling entities after an entity service call
+        self.refresh_after_service_call: bool = getattr(
+            platform, "REFRESH_AFTER_SERVICE_CALL", True
+        )
+
         # Storage for entities indexed by domain
         # with the child dict indexed by entity_id
         #
@@ -219,6 +230,48 @@ class EntityPlatform:
 
         return self.parallel_updates
 
+    @callback
+    def async_get_service_call_semaphores(self) -> tuple[asyncio.Semaphore, ...]:
+        """Get or create the semaphores limiting parallel entity service calls.
+
+        - If the platform sets PARALLEL_SERVICE_CALLS, the calls to the
+          entities of this platform are limited to that number.
+        - If the integration sets PARALLEL_SERVICE_CALLS, the calls to the
+          entities of all its platforms share that limit.
+
+        The semaphores are returned in the order they must be acquired.
+        Without a limit, calls are only limited by PARALLEL_UPDATES.
+        """
+        if self._service_call_semaphores is not None:
+            return self._service_call_semaphores
+
+        semaphores: list[asyncio.Semaphore] = []
+        # The narrower platform limit is acquired first so calls waiting
+        # for their platform do not hold a call of the integration
+        if parallel_service_calls := getattr(
+            self.platform, "PARALLEL_SERVICE_CALLS", None
+        ):
+            semaphores.append(asyncio.Semaphore(parallel_service_calls))
+
+        integration_semaphores = self.hass.data.setdefault(
+            DATA_INTEGRATION_SERVICE_CALLS, {}
+        )
+        if self.platform_name in integration_semaphores:
+            integration_semaphore = integration_semaphores[self.platform_name]
+        else:
+            integration_semaphore = None
+            integration = self.hass.data[DATA_COMPONENTS].get(self.platform_name)
+            if parallel_service_calls := getattr(
+                integration, "PARALLEL_SERVICE_CALLS", None
+            ):
+                integration_semaphore = asyncio.Semaphore(parallel_service_calls)
+            integration_semaphores[self.platform_name] = integration_semaphore
+        if integration_semaphore is not None:
+            semaphores.append(integration_semaphore)
+
+        self._service_call_semaphores = tuple(semaphores)
+        return self._service_call_semaphores
+
     async def async_setup(
         self,
         platform_config: ConfigType,
@@ -12,7 +12,7 @@ from functools import partial, wraps
 import logging
 from random import randint
 import time
-from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Concatenate, Generic, Literal, TypeVar
 
 from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
@@ -107,14 +107,20 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
         ],
         None,
     ]
-    filter_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            _TypedDictT,
-        ],
-        bool,
-    ]
+    filter_callable: (
+        Callable[
+            [
+                HomeAssistant,
+                dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+                _TypedDictT,
+            ],
+            bool,
+        ]
+        | None
+    ) = None
+    # Route events on the bus by the entity_id or domain, the
+    # filter_callable is only called for the events of the index
+    index: Literal["entity_id", "domain"] | None = None
 
 
 @dataclass(slots=True, frozen=True)
@@ -358,21 +364,11 @@ def _async_dispatch_entity_id_event(
             )
 
 
-@callback
-def _async_state_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event_data: _StateEventDataT,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
-
-
 _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
     key=_TRACK_STATE_CHANGE_DATA,
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
+    index="entity_id",
 )
 
 
@@ -393,7 +389,7 @@ _KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
     key=_TRACK_STATE_REPORT_DATA,
     event_type=EVENT_STATE_REPORTED,
     dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_filter,
+    index="entity_id",
 )
 
 
@@ -455,11 +451,23 @@ def _async_track_event(
         callbacks = event_data.callbacks
     else:
         callbacks = defaultdict(list)
-        listener = hass.bus.async_listen(
-            tracker.event_type,
-            partial(tracker.dispatcher_callable, hass, callbacks),
-            event_filter=partial(tracker.filter_callable, hass, callbacks),
-        )
+        if tracker.index is not None:
+            listener = hass.bus.async_listen_indexed(
+                tracker.event_type,
+                callbacks,
+                partial(tracker.dispatcher_callable, hass, callbacks),
+                by_domain=tracker.index == "domain",
+                event_filter=partial(tracker.filter_callable, hass, callbacks)
+                if tracker.filter_callable
+                else None,
+            )
+        else:
+            assert tracker.filter_callable is not None
+            listener = hass.bus.async_listen(
+                tracker.event_type,
+                partial(tracker.dispatcher_callable, hass, callbacks),
+                event_filter=partial(tracker.filter_callable, hass, callbacks),
+            )
         event_data = _KeyedEventData(listener, callbacks)
         hass_data[tracker_key] = event_data
 
@@ -618,14 +626,8 @@ def _async_domain_added_filter(
     callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
     event_data: EventStateChangedData,
 ) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["old_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If old_state is None, new_state must be set but
-        # mypy doesn't know that
-        event_data["new_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+    """Filter state changes of the indexed domains by added entities."""
+    return event_data["old_state"] is None
 
 
 @bind_hass
@@ -646,6 +648,7 @@ _KEYED_TRACK_STATE_ADDED_DOMAIN = _KeyedEventTracker(
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_domain_event,
     filter_callable=_async_domain_added_filter,
+    index="domain",
 )
 
 
@@ -668,14 +671,8 @@ def _async_domain_removed_filter(
     callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
     event_data: EventStateChangedData,
 ) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["new_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If new_state is None, old_state must be set but
-        # mypy doesn't know that
-        event_data["old_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+    """Filter state changes of the indexed domains by removed entities."""
+    return event_data["new_state"] is None
 
 
 _KEYED_TRACK_STATE_REMOVED_DOMAIN = _KeyedEventTracker(
@@ -683,6 +680,7 @@ _KEYED_TRACK_STATE_REMOVED_DOMAIN = _KeyedEventTracker(
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_domain_event,
     filter_callable=_async_domain_removed_filter,
+    index="domain",
 )
 
 
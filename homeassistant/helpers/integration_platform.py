@@ -7,6 +7,7 @@ from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from functools import partial
 import logging
+import time
 from types import ModuleType
 from typing import Any
 
@@ -14,6 +15,7 @@ from homeassistant.const import EVENT_COMPONENT_LOADED
 from homeassistant.core import Event, HassJob, HomeAssistant, callback
 from homeassistant.loader import (
     Integration,
+    IntegrationNotLoaded,
     async_get_integrations,
     async_get_loaded_integration,
     async_register_preload_platform,
@@ -27,6 +29,9 @@ _LOGGER = logging.getLogger(__name__)
 DATA_INTEGRATION_PLATFORMS: HassKey[list[IntegrationPlatform]] = HassKey(
     "integration_platforms"
 )
+DATA_LAZY_INTEGRATION_PLATFORMS: HassKey[dict[str, LazyIntegrationPlatform]] = HassKey(
+    "lazy_integration_platforms"
+)
 
 
 @dataclass(slots=True, frozen=True)
@@ -256,3 +261,139 @@ async def _async_process_integration_platforms(
 
     if futures:
         await asyncio.gather(*futures)
+
+
+class LazyIntegrationPlatform:
+    """An integration platform that is imported the first time it is needed.
+
+    Loaded integrations that provide the platform are recorded from the
+    files of the integration, without importing the platform. The platforms
+    are imported and processed by async_load, which consumers call before
+    they use the processed platforms.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        platform_name: str,
+        process_job: HassJob[[HomeAssistant, str, Any], Awaitable[None] | None],
+    ) -> None:
+        """Initialize the lazy integration platform."""
+        self.hass = hass
+        self.platform_name = platform_name
+        self.process_job = process_job
+        # Domains that provide the platform
+        self.domains: set[str] = set()
+        # Seconds it took to import the platform of each processed domain
+        self.import_times: dict[str, float] = {}
+        self._pending: set[str] = set()
+        self._lock = asyncio.Lock()
+
+    @callback
+    def async_add_component(self, component_name: str) -> None:
+        """Record if a loaded component provides the platform."""
+        if "." in component_name or component_name in self.domains:
+            return
+        try:
+            integration = async_get_loaded_integration(self.hass, component_name)
+        except IntegrationNotLoaded:
+            return
+        if integration.platforms_exists((self.platform_name,)):
+            self.domains.add(component_name)
+            self._pending.add(component_name)
+
+    async def async_load(self) -> None:
+        """Import and process the platforms that were not processed yet."""
+        if not self._pending and not self._lock.locked():
+            return
+        async with self._lock:
+            futures: list[asyncio.Future[Awaitable[None] | None]] = []
+            while self._pending:
+                domain = self._pending.pop()
+                integration = async_get_loaded_integration(self.hass, domain)
+                start = time.monotonic()
+                try:
+                    platform = await integration.async_get_platform(self.platform_name)
+                except ImportError:
+                    _LOGGER.debug(
+                        "Unexpected error importing %s for %s",
+                        self.platform_name,
+                        domain,
+                    )
+                    continue
+                self.import_times[domain] = import_time = time.monotonic() - start
+                _LOGGER.debug(
+                    "Imported %s platform for %s in %.3fs",
+                    self.platform_name,
+                    domain,
+                    import_time,
+                )
+                if future := self.hass.async_run_hass_job(
+                    self.process_job, self.hass, domain, platform
+                ):
+                    futures.append(future)
+            if futures:
+                await asyncio.gather(*futures)
+
+
+@callback
+def async_register_lazy_integration_platforms(
+    hass: HomeAssistant,
+    platform_name: str,
+    # Any = platform.
+    process_platform: Callable[[HomeAssistant, str, Any], Awaitable[None] | None],
+) -> None:
+    """Process a platform of current and future loaded integrations on demand.
+
+    Unlike async_process_integration_platforms, the platforms are only
+    imported and processed when async_load_lazy_integration_platforms
+    is called.
+    """
+    if (lazy_platforms := hass.data.get(DATA_LAZY_INTEGRATION_PLATFORMS)) is None:
+        lazy_platforms = hass.data[DATA_LAZY_INTEGRATION_PLATFORMS] = {}
+
+        @callback
+        def _async_component_loaded(event: Event[EventComponentLoaded]) -> None:
+            component_name = event.data[ATTR_COMPONENT]
+            for lazy_platform in lazy_platforms.values():
+                lazy_platform.async_add_component(component_name)
+
+        hass.bus.async_listen(EVENT_COMPONENT_LOADED, _async_component_loaded)
+
+    process_job = HassJob(
+        catch_log_exception(
+            process_platform,
+            partial(_format_err, str(process_platform), platform_name),
+        ),
+        f"process_platform {platform_name}",
+    )
+    lazy_platform = lazy_platforms[platform_name] = LazyIntegrationPlatform(
+        hass, platform_name, process_job
+    )
+    for component_name in hass.config.top_level_components:
+        lazy_platform.async_add_component(component_name)
+
+
+async def async_load_lazy_integration_platforms(
+    hass: HomeAssistant, platform_name: str
+) -> None:
+    """Import and process the lazy platforms that were not processed yet."""
+    await hass.data[DATA_LAZY_INTEGRATION_PLATFORMS][platform_name].async_load()
+
+
+@callback
+def async_get_lazy_integration_platforms_report(
+    hass: HomeAssistant,
+) -> dict[str, dict[str, Any]]:
+    """Return how many lazy platforms were imported and how long it took."""
+    return {
+        platform_name: {
+            "providers": len(lazy_platform.domains),
+            "imported": len(lazy_platform.import_times),
+            "import_time": sum(lazy_platform.import_times.values()),
+            "import_times": dict(lazy_platform.import_times),
+        }
+        for platform_name, lazy_platform in hass.data.get(
+            DATA_LAZY_INTEGRATION_PLATFORMS, {}
+        ).items()
+    }
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from contextlib import AsyncExitStack
 import dataclasses
 from enum import Enum
 from functools import cache, partial
 import logging
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, cast
 
@@ -32,6 +35,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -47,7 +51,6 @@ from homeassistant.exceptions import (
     UnknownUser,
 )
 from homeassistant.loader import Integration, async_get_integrations, bind_hass
-from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.yaml import load_yaml_dict
 from homeassistant.util.yaml.loader import JSON_TYPE
@@ -79,6 +82,21 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+TARGET_RESOLUTION_CACHE: HassKey[_TargetResolutionCache] = HassKey(
+    "service_target_resolution_cache"
+)
+
+ENTITY_SERVICE_CALL_LATENCY: HassKey[
+    dict[tuple[str, str, str], EntityServiceCallLatency]
+] = HassKey("entity_service_call_latency")
+
+# Maximum number of distinct targets to keep resolved
+MAX_TARGET_RESOLUTION_CACHE_SIZE = 1024
+
+# Upper bounds in seconds of the entity service call latency buckets
+ENTITY_SERVICE_CALL_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+type _TargetKey = tuple[frozenset[str], frozenset[str], frozenset[str], frozenset[str]]
 
 
 @cache
@@ -501,8 +519,74 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
     return ids not in (None, ENTITY_MATCH_NONE)
 
 
+class _TargetResolutionCache:
+    """Cache of the entities, devices and areas referenced by targets.
+
+    Resolving device, area, floor and label targets walks the registry
+    indexes and filters the entries of the result. The result only
+    changes when a registry changes, so it is kept until any of the
+    registries is updated or replaced.
+    """
+
+    __slots__ = ("registries", "resolved")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.registries: tuple[Any, ...] = ()
+        self.resolved: dict[_TargetKey, SelectedEntities] = {}
+        for event_type in (
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+            floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+            label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+        ):
+            hass.bus.async_listen(event_type, self._async_invalidate)
+
+    @callback
+    def _async_invalidate(self, event: Event[Any]) -> None:
+        """Forget the resolved targets when a registry is updated."""
+        self.resolved.clear()
+
+
+@callback
+def _async_resolve_registry_targets(
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> SelectedEntities:
+    """Return the items referenced by the registry targets of a selector.
+
+    The result is shared between calls and must not be modified.
+    """
+    registries = (
+        entity_registry.async_get(hass),
+        device_registry.async_get(hass),
+        area_registry.async_get(hass),
+        floor_registry.async_get(hass),
+        label_registry.async_get(hass),
+    )
+    if (cache := hass.data.get(TARGET_RESOLUTION_CACHE)) is None:
+        cache = hass.data[TARGET_RESOLUTION_CACHE] = _TargetResolutionCache(hass)
+    if cache.registries != registries:
+        cache.registries = registries
+        cache.resolved.clear()
+
+    key = (
+        frozenset(selector.device_ids),
+        frozenset(selector.area_ids),
+        frozenset(selector.floor_ids),
+        frozenset(selector.label_ids),
+    )
+    if (resolved := cache.resolved.get(key)) is None:
+        if len(cache.resolved) >= MAX_TARGET_RESOLUTION_CACHE_SIZE:
+            cache.resolved.clear()
+        resolved = cache.resolved[key] = _resolve_registry_targets(
+            selector, *registries
+        )
+    return resolved
+
+
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -526,12 +610,30 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
-    entities = entity_registry.async_get(hass).entities
-    dev_reg = device_registry.async_get(hass)
-    area_reg = area_registry.async_get(hass)
+    resolved = _async_resolve_registry_targets(hass, selector)
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.missing_floors.update(resolved.missing_floors)
+    selected.missing_labels.update(resolved.missing_labels)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.referenced_areas.update(resolved.referenced_areas)
+    return selected
+
+
+def _resolve_registry_targets(  # noqa: C901
+    selector: ServiceTargetSelector,
+    ent_reg: entity_registry.EntityRegistry,
+    dev_reg: device_registry.DeviceRegistry,
+    area_reg: area_registry.AreaRegistry,
+    floor_reg: floor_registry.FloorRegistry,
+    label_reg: label_registry.LabelRegistry,
+) -> SelectedEntities:
+    """Resolve the device, area, floor and label targets of a selector."""
+    selected = SelectedEntities()
+    entities = ent_reg.entities
 
     if selector.floor_ids:
-        floor_reg = floor_registry.async_get(hass)
         for floor_id in selector.floor_ids:
             if floor_id not in floor_reg.floors:
                 selected.missing_floors.add(floor_id)
@@ -545,7 +647,6 @@ def async_extract_referenced_entity_ids(  # noqa: C901
             selected.missing_devices.add(device_id)
 
     if selector.label_ids:
-        label_reg = label_registry.async_get(hass)
         for label_id in selector.label_ids:
             if label_id not in label_reg.labels:
                 selected.missing_labels.add(label_id)
@@ -904,6 +1005,57 @@ def _get_permissible_entity_candidates(
     return [entities[entity_id] for entity_id in all_referenced.intersection(entities)]
 
 
+@dataclasses.dataclass(slots=True)
+class EntityServiceCallLatency:
+    """Histogram of the latency of the calls to entities of a service.
+
+    The latency of a call includes waiting for the parallel service
+    calls and updates and the refresh of polling entities.
+    """
+
+    counts: list[int] = dataclasses.field(
+        default_factory=lambda: [0] * (len(ENTITY_SERVICE_CALL_LATENCY_BUCKETS) + 1)
+    )
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a call."""
+        self.counts[bisect_left(ENTITY_SERVICE_CALL_LATENCY_BUCKETS, latency)] += 1
+        self.count += 1
+        self.total += latency
+        self.maximum = max(self.maximum, latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dictionary."""
+        return {
+            "buckets": {
+                **{
+                    str(bound): count
+                    for bound, count in zip(
+                        ENTITY_SERVICE_CALL_LATENCY_BUCKETS, self.counts, strict=False
+                    )
+                },
+                "+Inf": self.counts[-1],
+            },
+            "count": self.count,
+            "total": self.total,
+            "maximum": self.maximum,
+        }
+
+
+@callback
+def async_get_entity_service_call_latency(
+    hass: HomeAssistant,
+) -> dict[tuple[str, str, str], EntityServiceCallLatency]:
+    """Return the latency histograms of entity service calls.
+
+    The histograms are keyed by service domain, service and integration.
+    """
+    return hass.data.get(ENTITY_SERVICE_CALL_LATENCY, {})
+
+
 @bind_hass
 async def entity_service_call(
     hass: HomeAssistant,
@@ -993,23 +1145,18 @@ async def entity_service_call(
     if len(entities) == 1:
         # Single entity case avoids creating task
         entity = entities[0]
-        single_response = await _handle_entity_call(
-            hass, entity, func, data, call.context
+        single_response = await _async_handle_entity_call_and_refresh(
+            hass, entity, func, data, call, False
         )
-        if entity.should_poll:
-            # Context expires if the turn on commands took a long time.
-            # Set context again so it's there when we update
-            entity.async_set_context(call.context)
-            await entity.async_update_ha_state(True)
         return {entity.entity_id: single_response} if return_response else None
 
     # Use asyncio.gather here to ensure the returned results
-    # are in the same order as the entities list
+    # are in the same order as the entities list. Every entity is
+    # refreshed as soon as its own call is done so slow entities
+    # do not hold back the refresh of the others.
     results: list[ServiceResponse | BaseException] = await asyncio.gather(
         *[
-            entity.async_request_call(
-                _handle_entity_call(hass, entity, func, data, call.context)
-            )
+            _async_handle_entity_call_and_refresh(hass, entity, func, data, call, True)
             for entity in entities
         ],
         return_exceptions=True,
@@ -1021,24 +1168,53 @@ async def entity_service_call(
             raise result from None
         response_data[entity.entity_id] = result
 
-    tasks: list[asyncio.Task[None]] = []
+    return response_data if return_response and response_data else None
 
-    for entity in entities:
-        if not entity.should_poll:
-            continue
 
+async def _async_handle_entity_call_and_refresh(
+    hass: HomeAssistant,
+    entity: Entity,
+    func: str | HassJob,
+    data: dict | ServiceCall,
+    call: ServiceCall,
+    request_call: bool,
+) -> ServiceResponse:
+    """Call the service method of an entity and refresh a polling entity.
+
+    When request_call is set, the call is limited by the parallel
+    service calls of the integration and platform and by the
+    parallel updates of the platform.
+    """
+    start = time.monotonic()
+    platform = entity.platform
+    if not request_call:
+        result = await _handle_entity_call(hass, entity, func, data, call.context)
+    elif platform and (semaphores := platform.async_get_service_call_semaphores()):
+        async with AsyncExitStack() as stack:
+            for semaphore in semaphores:
+                await stack.enter_async_context(semaphore)
+            result = await entity.async_request_call(
+                _handle_entity_call(hass, entity, func, data, call.context)
+            )
+    else:
+        result = await entity.async_request_call(
+            _handle_entity_call(hass, entity, func, data, call.context)
+        )
+
+    if entity.should_poll and (not platform or platform.refresh_after_service_call):
         # Context expires if the turn on commands took a long time.
         # Set context again so it's there when we update
         entity.async_set_context(call.context)
-        tasks.append(create_eager_task(entity.async_update_ha_state(True)))
+        await entity.async_update_ha_state(True)
 
-    if tasks:
-        done, pending = await asyncio.wait(tasks)
-        assert not pending
-        for future in done:
-            future.result()  # pop exception if have
+    if platform:
+        latencies = hass.data.setdefault(ENTITY_SERVICE_CALL_LATENCY, {})
+        key = (call.domain, call.service, platform.platform_name)
+        if (latency := latencies.get(key)) is None:
+            latency = latencies[key] = EntityServiceCallLatency()
+        latency.record(time.monotonic() - start)
 
-    return response_data if return_response and response_data else None
+    return result
 
 
 async def _handle_entity_call(
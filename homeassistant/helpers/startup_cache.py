@@ -0,0 +1,207 @@
+"""Snapshot of the files read while starting Home Assistant."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, __version__
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.file import WriteError, write_utf8_file
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
+
+from .json import json_bytes
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STARTUP_CACHE: HassKey[StartupCache] = HassKey("startup_cache")
+
+STARTUP_CACHE_FILE = "core.startup_cache"
+STARTUP_CACHE_VERSION = 1
+
+
+class StartupCache:
+    """Cache the manifests, translations and directory listings read at startup.
+
+    Starting Home Assistant reads a manifest.json file and lists the
+    directory of every integration it resolves and loads a translation
+    file per integration and language. On slow storage opening thousands
+    of small files dominates the startup time, so their content is kept in
+    a single file that is read once.
+
+    Every entry is keyed by the modification time and size of the file or
+    the modification time of the directory, which are checked before an
+    entry is used, and the whole cache is discarded when the version of
+    Home Assistant changes. Files and directories below the package path
+    are only changed by installing another version, so they are not
+    checked. Entries that were not used during a startup are dropped when
+    the cache is saved, and saving releases the cached contents.
+
+    JSON files are kept as text and parsed on every load. Callers modify
+    the parsed objects, and parsing is about as fast as a deep copy, so
+    the cache saves opening the files but not parsing them.
+
+    The cache is used from executor threads.
+    """
+
+    def __init__(self, path: str, package_path: str | None = None) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self._package_path = (
+            None if package_path is None else os.path.join(package_path, "")
+        )
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+        self._files: dict[str, list[Any]] = {}
+        self._dirs: dict[str, list[Any]] = {}
+        self._used_files: dict[str, list[Any]] = {}
+        self._used_dirs: dict[str, list[Any]] = {}
+
+    def _ensure_loaded(self) -> None:
+        """Load the cache file on first use."""
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                if self._package_path is not None and os.path.exists(
+                    os.path.join(
+                        os.path.dirname(os.path.dirname(self._package_path)), ".git"
+                    )
+                ):
+                    # A source checkout can be changed without changing
+                    # the version
+                    self._package_path = None
+                self._load()
+                self._loaded = True
+
+    def _load(self) -> None:
+        """Load the cache file, must be called with the lock held."""
+        try:
+            with open(self.path, "rb") as fdesc:
+                data = json_loads(fdesc.read())
+        except FileNotFoundError:
+            return
+        except (OSError, *JSON_DECODE_EXCEPTIONS) as err:
+            _LOGGER.warning("Discarding startup cache %s: %s", self.path, err)
+            return
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != STARTUP_CACHE_VERSION
+            or data.get("ha_version") != __version__
+        ):
+            _LOGGER.debug("Discarding outdated startup cache %s", self.path)
+            return
+        self._files = data["files"]
+        self._dirs = data["dirs"]
+
+    def load_json(self, path: str | os.PathLike[str]) -> Any:
+        """Load and parse a JSON file.
+
+        Returns a new object on every call so it can be modified.
+        Raises FileNotFoundError if the file does not exist.
+        """
+        path = os.fspath(path)
+        self._ensure_loaded()
+        stat = None if self._in_package(path) else os.stat(path)
+        with self._lock:
+            entry = self._files.get(path)
+            if (
+                entry is None
+                or stat is not None
+                and (entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size)
+            ):
+                self.misses += 1
+                if stat is None:
+                    stat = os.stat(path)
+                with open(path, encoding="utf-8") as fdesc:
+                    entry = [stat.st_mtime_ns, stat.st_size, fdesc.read()]
+                self._files[path] = entry
+                self._dirty = True
+            else:
+                self.hits += 1
+            if path not in self._used_files:
+                self._used_files[path] = entry
+        return json_loads(entry[2])
+
+    def listdir(self, path: str | os.PathLike[str]) -> list[str]:
+        """Return the names of the entries in a directory."""
+        path = os.fspath(path)
+        self._ensure_loaded()
+        mtime_ns = None if self._in_package(path) else os.stat(path).st_mtime_ns
+        with self._lock:
+            entry = self._dirs.get(path)
+            if entry is None or mtime_ns is not None and entry[0] != mtime_ns:
+                self.misses += 1
+                if mtime_ns is None:
+                    mtime_ns = os.stat(path).st_mtime_ns
+                entry = [mtime_ns, os.listdir(path)]
+                self._dirs[path] = entry
+                self._dirty = True
+            else:
+                self.hits += 1
+            if path not in self._used_dirs:
+                self._used_dirs[path] = entry
+        return list(entry[1])
+
+    def _in_package(self, path: str) -> bool:
+        """Return if a path is below the package path."""
+        return self._package_path is not None and path.startswith(self._package_path)
+
+    def save(self) -> None:
+        """Write the entries used since the cache was loaded.
+
+        The cached contents are released once they are written.
+        """
+        with self._lock:
+            unchanged = (
+                not self._dirty
+                and len(self._used_files) == len(self._files)
+                and len(self._used_dirs) == len(self._dirs)
+            )
+            used_files, used_dirs = self._used_files, self._used_dirs
+            self._files, self._dirs = {}, {}
+            self._used_files, self._used_dirs = {}, {}
+            self._dirty = False
+            if unchanged:
+                return
+            data = json_bytes(
+                {
+                    "version": STARTUP_CACHE_VERSION,
+                    "ha_version": __version__,
+                    "files": used_files,
+                    "dirs": used_dirs,
+                }
+            )
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_utf8_file(self.path, data, mode="wb")
+        except (OSError, WriteError) as err:
+            _LOGGER.warning("Could not write startup cache %s: %s", self.path, err)
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Set up the startup cache and save it once Home Assistant has started."""
+    startup_cache = hass.data[DATA_STARTUP_CACHE] = StartupCache(
+        hass.config.path(".storage", STARTUP_CACHE_FILE),
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+
+    @callback
+    def _async_save(_: Event) -> None:
+        """Save the startup cache and stop using it."""
+        hass.data.pop(DATA_STARTUP_CACHE, None)
+        _LOGGER.debug(
+            "Startup cache hits: %s, misses: %s",
+            startup_cache.hits,
+            startup_cache.misses,
+        )
+        hass.async_add_executor_job(startup_cache.save)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
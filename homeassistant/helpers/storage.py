@@ -48,6 +48,12 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into a new snapshot once it has this many
+# records or is larger than this fraction of the snapshot
+MAX_JOURNAL_RECORDS = 500
+MAX_JOURNAL_SIZE_RATIO = 0.5
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -226,6 +232,185 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+def _list_delta(previous: list[Any], current: list[Any]) -> list[dict[str, Any]] | None:
+    """Return the operations that turn the previous list into the current one.
+
+    Items are matched by identity, ranges of items that are still in
+    the list are referenced by their position in the previous list.
+    Returns None if the list did not change.
+    """
+    positions = {id(item): idx for idx, item in enumerate(previous)}
+    ops: list[dict[str, Any]] = []
+    added: list[Any] = []
+    run_start = run_end = -1
+    for item in current:
+        if (idx := positions.get(id(item))) is None:
+            if run_start >= 0:
+                ops.append({"keep": [run_start, run_end]})
+                run_start = -1
+            added.append(item)
+            continue
+        if added:
+            ops.append({"add": added})
+            added = []
+        if run_start >= 0:
+            if idx == run_end:
+                run_end += 1
+                continue
+            ops.append({"keep": [run_start, run_end]})
+        run_start, run_end = idx, idx + 1
+    if run_start >= 0:
+        if not ops and run_start == 0 and run_end == len(previous):
+            return None
+        ops.append({"keep": [run_start, run_end]})
+    elif added:
+        ops.append({"add": added})
+    return ops
+
+
+def _apply_journal_record(stored: dict[str, Any], record: dict[str, Any]) -> None:
+    """Apply a journal record to the stored data."""
+    for key, ops in record["lists"].items():
+        previous = stored[key]
+        items: list[Any] = []
+        for op in ops:
+            if keep := op.get("keep"):
+                items.extend(previous[keep[0] : keep[1]])
+            else:
+                items.extend(op["add"])
+        stored[key] = items
+    stored.update(record["values"])
+
+
+class _StoreJournal:
+    """Append-only journal of the changes to the data of a store.
+
+    Instead of rewriting the whole file on every save, the changes since
+    the previous save are appended to the journal file next to the store
+    file, which holds the last snapshot. The journal is replayed on top of
+    the snapshot when the store is loaded and compacted into a new snapshot
+    once it grows too large.
+
+    Only top level lists are written as changes. Their items are matched
+    by identity, so items must not be modified in place once they have
+    been saved, which holds for the json fragments of the registries.
+
+    Snapshots carry a generation which is also written with each record,
+    so records from before a snapshot are never replayed on top of it,
+    even if writing the snapshot was interrupted before the old journal
+    was removed.
+
+    All methods must be called from the executor.
+    """
+
+    def __init__(self, path: str, private: bool) -> None:
+        """Initialize the journal."""
+        self.path = path + JOURNAL_SUFFIX
+        self._private = private
+        self.generation = 0
+        self._lists: dict[str, list[Any]] = {}
+        self._values: dict[str, bytes] = {}
+        self._version: tuple[int, int] | None = None
+        self._records = 0
+        self._size = 0
+        self._snapshot_size = 0
+        # Write a snapshot on the next write
+        self.compact = False
+
+    def replay(self, data: dict[str, Any]) -> None:
+        """Apply the journal to the data loaded from the snapshot."""
+        self.generation = data.get("journal_generation", 0)
+        try:
+            with open(self.path, "rb") as journal_file:
+                lines = journal_file.readlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                record = json_util.json_loads_object(line)
+            except ValueError:
+                # The last record was not written completely
+                _LOGGER.warning("Ignoring incomplete record in %s", self.path)
+                break
+            if record["generation"] == self.generation:
+                _apply_journal_record(data["data"], record)
+
+    def append(self, data: dict[str, Any]) -> bool:
+        """Append the changes since the last write to the journal.
+
+        Returns False if a snapshot needs to be written instead.
+        """
+        stored = data["data"]
+        if (
+            self.compact
+            or self._version != (data["version"], data["minor_version"])
+            or not isinstance(stored, dict)
+            or stored.keys() != self._lists.keys() | self._values.keys()
+            or self._records >= MAX_JOURNAL_RECORDS
+            or self._size > self._snapshot_size * MAX_JOURNAL_SIZE_RATIO
+        ):
+            return False
+        lists: dict[str, list[dict[str, Any]]] = {}
+        values: dict[str, Any] = {}
+        for key, value in stored.items():
+            if key in self._lists and isinstance(value, list):
+                if (ops := _list_delta(self._lists[key], value)) is not None:
+                    lists[key] = ops
+            elif key in self._values:
+                if (value_json := json_helper.json_bytes(value)) != self._values[key]:
+                    values[key] = value
+                    self._values[key] = value_json
+            else:
+                return False
+        if lists or values:
+            line = (
+                json_helper.json_bytes(
+                    {"generation": self.generation, "lists": lists, "values": values}
+                )
+                + b"\n"
+            )
+            try:
+                fd = os.open(
+                    self.path,
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                    0o600 if self._private else 0o644,
+                )
+                try:
+                    os.write(fd, line)
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError as error:
+                _LOGGER.exception("Appending to journal failed: %s", self.path)
+                raise WriteError(error) from error
+            self._records += 1
+            self._size += len(line)
+        self._lists.update(
+            (key, value) for key, value in stored.items() if key in self._lists
+        )
+        return True
+
+    def snapshot_written(self, snapshot_path: str, data: dict[str, Any]) -> None:
+        """Start a new journal after a snapshot has been written."""
+        with suppress(FileNotFoundError):
+            os.unlink(self.path)
+        self.generation = data["journal_generation"]
+        self.compact = False
+        stored = data["data"]
+        self._version = (data["version"], data["minor_version"])
+        self._lists = {}
+        self._values = {}
+        if isinstance(stored, dict):
+            for key, value in stored.items():
+                if isinstance(value, list):
+                    self._lists[key] = value
+                else:
+                    self._values[key] = json_helper.json_bytes(value)
+        self._records = 0
+        self._size = 0
+        self._snapshot_size = os.path.getsize(snapshot_path)
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -241,8 +426,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        With journal, saves append the changes to a journal which is
+        compacted into the store file from time to time. This is meant for
+        large stores that save often and change little between saves.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,6 +449,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = _StoreJournal(self.path, private) if journal else None
 
     @cached_property
     def path(self):
@@ -325,6 +517,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal:
+                await self.hass.async_add_executor_job(self._journal.replay, data)
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -387,6 +581,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+            if self._journal:
+                await self.hass.async_add_executor_job(self._journal.replay, data)
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -517,6 +714,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if self._journal:
+            # Leave a snapshot without journal behind on shutdown
+            self._journal.compact = True
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -551,6 +751,12 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if journal := self._journal:
+            if journal.append(data):
+                _LOGGER.debug("Appended changes for %s to the journal", self.key)
+                return
+            data["journal_generation"] = journal.generation + 1
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -560,6 +766,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+        if journal:
+            journal.snapshot_written(path, data)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -572,3 +781,6 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self._journal.path)
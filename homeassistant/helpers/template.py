@@ -6,10 +6,12 @@ from ast import literal_eval
 import asyncio
 import base64
 import collections.abc
-from collections.abc import Callable, Generator, Iterable
+from collections import defaultdict
+from collections.abc import Callable, Generator, Iterable, Iterator
 from contextlib import AbstractContextManager
 from contextvars import ContextVar
 from datetime import date, datetime, time, timedelta
+from fractions import Fraction
 from functools import cache, cached_property, lru_cache, partial, wraps
 import json
 import logging
@@ -29,7 +31,7 @@ import weakref
 from awesomeversion import AwesomeVersion
 import jinja2
 from jinja2 import pass_context, pass_environment, pass_eval_context
-from jinja2.runtime import AsyncLoopContext, LoopContext
+from jinja2.runtime import AsyncLoopContext, LoopContext, new_context
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
 from lru import LRU
@@ -44,12 +46,15 @@ from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
 )
 from homeassistant.core import (
     Context,
+    Event,
+    EventStateChangedData,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -100,6 +105,7 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_STATES_VIEW: HassKey[StatesView] = HassKey("template.states_view")
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -150,11 +156,77 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
+# Number of compiled templates kept per environment after the last
+# Template object using them is gone, so templates that are created
+# again (dashboards, websocket subscriptions) do not have to be compiled
+# again. Also the number of templates with their entities extracted.
+COMPILED_TEMPLATE_CACHE_SIZE = 1024
+
+# Number of filters over iterated states kept up to date, see StatesView
+MAX_STATES_QUERIES = 64
+
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
+STATIC_ENTITIES_LRU: LRU[str, frozenset[str] | None] = LRU(COMPILED_TEMPLATE_CACHE_SIZE)
+
+# Functions, filters and tests that do not depend on the state machine
+# beyond the entity passed to them, see _extract_static_entities.
+_STATIC_ENTITY_FUNCTIONS = {
+    "states",
+    "is_state",
+    "state_attr",
+    "is_state_attr",
+    "has_value",
+}
+_STATIC_SAFE_FILTERS = {
+    "abs",
+    "bool",
+    "capitalize",
+    "default",
+    "float",
+    "int",
+    "is_number",
+    "length",
+    "lower",
+    "multiply",
+    "replace",
+    "round",
+    "string",
+    "title",
+    "trim",
+    "upper",
+}
+_STATIC_SAFE_TESTS = {
+    "boolean",
+    "defined",
+    "eq",
+    "equalto",
+    "false",
+    "in",
+    "is_number",
+    "none",
+    "number",
+    "string",
+    "true",
+    "undefined",
+}
+_STATIC_SAFE_NODES = (
+    jinja2.nodes.Template,
+    jinja2.nodes.Output,
+    jinja2.nodes.TemplateData,
+    jinja2.nodes.Const,
+    jinja2.nodes.List,
+    jinja2.nodes.Tuple,
+    jinja2.nodes.Dict,
+    jinja2.nodes.Pair,
+    jinja2.nodes.Keyword,
+    jinja2.nodes.Operand,
+    jinja2.nodes.UnaryExpr,
+    jinja2.nodes.Concat,
+)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
 ORJSON_PASSTHROUGH_OPTIONS = (
@@ -181,7 +253,8 @@ def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
 
 
 def async_setup(hass: HomeAssistant) -> bool:
-    """Set up tracking the template LRUs."""
+    """Set up tracking the template LRUs and the view of iterated states."""
+    hass.data[_STATES_VIEW] = StatesView(hass)
 
     @callback
     def _async_adjust_lru_sizes(_: Any) -> None:
@@ -368,6 +441,107 @@ def _cached_parse_result(render_result: str) -> Any:
     return render_result
 
 
+def _extract_static_entities(template: jinja2.nodes.Template) -> frozenset[str] | None:
+    """Return the entities of a simple template without rendering it.
+
+    A template is simple when it only looks up states with literal entity
+    ids and has no control flow, short-circuit operators or variables, so
+    every render accesses all of its entities. Returns None for templates
+    that are not simple.
+    """
+    entities: set[str] = set()
+
+    def _visit(node: jinja2.nodes.Node) -> bool:
+        if isinstance(node, jinja2.nodes.Call):
+            if (
+                not isinstance(node.node, jinja2.nodes.Name)
+                or node.node.name not in _STATIC_ENTITY_FUNCTIONS
+                or not node.args
+                or node.dyn_args
+                or node.dyn_kwargs
+                or not isinstance(entity_id := node.args[0], jinja2.nodes.Const)
+                or not isinstance(entity_id.value, str)
+                or not valid_entity_id(entity_id.value)
+            ):
+                return False
+            entities.add(entity_id.value)
+            return all(_visit(child) for child in (*node.args[1:], *node.kwargs))
+        if isinstance(node, jinja2.nodes.Getattr):
+            # states.domain.object_id.state, only the state attributes
+            # that are collected when they are accessed are allowed
+            if (
+                isinstance(entity := node.node, jinja2.nodes.Getattr)
+                and isinstance(domain := entity.node, jinja2.nodes.Getattr)
+                and isinstance(domain.node, jinja2.nodes.Name)
+                and domain.node.name == "states"
+            ):
+                if node.attr not in _COLLECTABLE_STATE_ATTRIBUTES or not (
+                    valid_entity_id(entity_id := f"{domain.attr}.{entity.attr}")
+                ):
+                    return False
+                entities.add(entity_id)
+                return True
+            return _visit(node.node)
+        if isinstance(node, jinja2.nodes.Filter):
+            if (
+                node.node is None
+                or node.name not in _STATIC_SAFE_FILTERS
+                or node.dyn_args
+                or node.dyn_kwargs
+            ):
+                return False
+        elif isinstance(node, jinja2.nodes.Test):
+            if node.name not in _STATIC_SAFE_TESTS or node.dyn_args or node.dyn_kwargs:
+                return False
+        elif isinstance(node, jinja2.nodes.Compare):
+            # Chained comparisons short-circuit
+            if len(node.ops) != 1:
+                return False
+        elif isinstance(node, (jinja2.nodes.And, jinja2.nodes.Or)) or not isinstance(
+            node, (*_STATIC_SAFE_NODES, jinja2.nodes.BinExpr)
+        ):
+            return False
+        return all(_visit(child) for child in node.iter_child_nodes())
+
+    if not _visit(template):
+        return None
+    return frozenset(entities)
+
+
+@callback
+def async_get_template_cache_stats(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the sizes and hit counts of the compiled template caches."""
+    environments: dict[str, Any] = {}
+    for name, key in (
+        ("default", _ENVIRONMENT),
+        ("limited", _ENVIRONMENT_LIMITED),
+        ("strict", _ENVIRONMENT_STRICT),
+    ):
+        if (env := hass.data.get(key)) is None:
+            continue
+        environments[name] = {
+            "compiled": {
+                "size": len(env.template_lru),
+                "hits": env.template_cache_hits,
+                "misses": env.template_cache_misses,
+            },
+            "bound": {
+                "size": len(env.bound_templates),
+                "hits": env.bound_template_hits,
+                "misses": env.bound_template_misses,
+            },
+        }
+    return {
+        "environments": environments,
+        "static_entities": {
+            "size": len(STATIC_ENTITIES_LRU),
+            "simple": sum(
+                entities is not None for entities in STATIC_ENTITIES_LRU.values()
+            ),
+        },
+    }
+
+
 class RenderInfo:
     """Holds information about a template render."""
 
@@ -565,14 +739,19 @@ class Template:
         if self.is_static or self._compiled_code is not None:
             return
 
-        if compiled := self._env.template_cache.get(self.template):
+        env = self._env
+        if (compiled := env.template_cache.get(self.template)) or (
+            compiled := env.template_lru.get(self.template)
+        ):
+            env.template_cache_hits += 1
             self._compiled_code = compiled
             return
 
+        env.template_cache_misses += 1
         with _template_context_manager as cm:
             cm.set_template(self.template, "compiling")
             try:
-                self._compiled_code = self._env.compile(self.template)
+                self._compiled_code = env.compile(self.template)
             except jinja2.TemplateError as err:
                 raise TemplateError(err) from err
 
@@ -743,6 +922,21 @@ class Template:
             render_info._freeze_static()  # noqa: SLF001
             return render_info
 
+        if (static_entities := self._async_get_static_entities()) is not None:
+            # Every render of a simple template accesses all of its
+            # entities, so they do not have to be collected while rendering.
+            # Errors are rendered again below to collect what was accessed.
+            try:
+                render_info._result = self.async_render(  # noqa: SLF001
+                    variables, strict=strict, log_fn=log_fn, **kwargs
+                )
+            except TemplateError:
+                pass
+            else:
+                render_info.entities = static_entities
+                render_info._freeze()  # noqa: SLF001
+                return render_info
+
         token = _render_info.set(render_info)
         try:
             render_info._result = self.async_render(  # noqa: SLF001
@@ -846,12 +1040,34 @@ class Template:
         self._log_fn = log_fn
         env = self._env
 
+        # Environments with a custom log function are not shared
+        if log_fn is None and (compiled := env.bound_templates.get(self.template)):
+            env.bound_template_hits += 1
+            self._compiled = compiled
+            return compiled
+
+        env.bound_template_misses += 1
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        if log_fn is None:
+            env.bound_templates[self.template] = self._compiled
 
         return self._compiled
 
+    def _async_get_static_entities(self) -> frozenset[str] | None:
+        """Return the entities the template accesses if they are known statically."""
+        if (
+            entities := STATIC_ENTITIES_LRU.get(self.template, _SENTINEL)
+        ) is not _SENTINEL:
+            return entities  # type: ignore[return-value]
+        try:
+            entities = _extract_static_entities(self._env.parse(self.template))
+        except jinja2.TemplateError:
+            entities = None
+        STATIC_ENTITIES_LRU[self.template] = entities
+        return entities
+
     def __eq__(self, other):
         """Compare template with another."""
         return (
@@ -1213,6 +1429,390 @@ def _state_generator(
         yield _template_state_no_collect(hass, state)
 
 
+# Filters and tests that only depend on the value passed to them, and
+# attributes of a state that only change along with the state, so the
+# states can be filtered one at a time, see StatesView.
+_STATES_QUERY_ATTRIBUTES = {
+    "attributes",
+    "domain",
+    "entity_id",
+    "last_changed",
+    "last_reported",
+    "last_updated",
+    "name",
+    "object_id",
+    "state",
+}
+_STATES_QUERY_MAP_FILTERS = {
+    "abs",
+    "bool",
+    "float",
+    "int",
+    "lower",
+    "round",
+    "string",
+    "trim",
+    "upper",
+}
+_STATES_QUERY_TESTS = {
+    "!=",
+    "<",
+    "<=",
+    "==",
+    ">",
+    ">=",
+    "boolean",
+    "contains",
+    "defined",
+    "eq",
+    "equalto",
+    "false",
+    "float",
+    "ge",
+    "greaterthan",
+    "gt",
+    "in",
+    "integer",
+    "le",
+    "lessthan",
+    "lower",
+    "lt",
+    "match",
+    "ne",
+    "none",
+    "number",
+    "search",
+    "string",
+    "true",
+    "undefined",
+    "upper",
+}
+_NO_MATCH = object()
+
+type _StatesQueryStep = tuple[str, tuple[Any, ...], tuple[tuple[str, Any], ...]]
+
+
+def _states_query_step(
+    name: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> _StatesQueryStep | None:
+    """Return the step of a filter over states if it can be kept up to date."""
+    if name == "map" and args:
+        if not isinstance(args[0], str) or args[0] not in _STATES_QUERY_MAP_FILTERS:
+            return None
+    else:
+        if name == "map":
+            if not kwargs.keys() <= {"attribute", "default"}:
+                return None
+            attribute = kwargs.get("attribute")
+        elif kwargs or not args:
+            return None
+        elif len(args) > 1 and (
+            not isinstance(args[1], str) or args[1] not in _STATES_QUERY_TESTS
+        ):
+            return None
+        else:
+            attribute = args[0]
+        if (
+            not isinstance(attribute, str)
+            or attribute.partition(".")[0] not in _STATES_QUERY_ATTRIBUTES
+        ):
+            return None
+    step = (name, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(step)
+    except TypeError:
+        return None
+    return step
+
+
+def _apply_states_filters(
+    context: jinja2.runtime.Context,
+    iterable: Iterable[Any],
+    steps: tuple[_StatesQueryStep, ...],
+) -> Iterable[Any]:
+    """Apply the jinja filters of the steps to an iteration of states."""
+    for name, args, kwargs in steps:
+        jinja_filter = jinja2.filters.FILTERS[name]
+        iterable = jinja_filter(context, iterable, *args, **dict(kwargs))
+    return iterable
+
+
+class _StatesQueryResult:
+    """The steps of a StatesQuery applied to each state, see StatesView."""
+
+    __slots__ = (
+        "changed",
+        "context",
+        "count",
+        "domain",
+        "floats",
+        "others",
+        "steps",
+        "total",
+        "values",
+    )
+
+    def __init__(
+        self,
+        context: jinja2.runtime.Context,
+        domain: str | None,
+        steps: tuple[_StatesQueryStep, ...],
+    ) -> None:
+        """Initialize the result."""
+        self.context = context
+        self.domain = domain
+        self.steps = steps
+        # Entities changed since the values were last updated
+        self.changed: set[str] = set()
+        # The filtered value of every state in the order of the state
+        # machine, None when the states have to be filtered again
+        self.values: dict[str, Any] | None = None
+        self.count = 0
+        # The exact sum of the numbers, the number of floats in it and
+        # the number of other values
+        self.total = Fraction()
+        self.floats = 0
+        self.others = 0
+
+    def _filter(self, template_state: TemplateState) -> Any:
+        """Return the filtered value of a state."""
+        for value in _apply_states_filters(self.context, (template_state,), self.steps):
+            return value
+        return _NO_MATCH
+
+    def _add(self, value: Any, sign: int) -> None:
+        """Add or remove a filtered value from the aggregates."""
+        if value is _NO_MATCH:
+            return
+        self.count += sign
+        if isinstance(value, float) and math.isfinite(value):
+            self.floats += sign
+            self.total += sign * Fraction(value)
+        elif isinstance(value, int):
+            self.total += sign * value
+        else:
+            self.others += sign
+
+    def async_update(self, hass: HomeAssistant) -> None:
+        """Filter the states changed since the last update."""
+        if (values := self.values) is not None:
+            for entity_id in self.changed:
+                if (state := hass.states.get(entity_id)) is None or (
+                    entity_id not in values
+                ):
+                    break
+                self._add(values[entity_id], -1)
+                value = values[entity_id] = self._filter(
+                    _template_state_no_collect(hass, state)
+                )
+                self._add(value, 1)
+            else:
+                self.changed.clear()
+                return
+        self.changed.clear()
+        self.values = values = {}
+        self.count = self.floats = self.others = 0
+        self.total = Fraction()
+        for template_state in _state_generator(hass, self.domain):
+            value = values[template_state.entity_id] = self._filter(template_state)
+            self._add(value, 1)
+
+    def items(self) -> list[Any]:
+        """Return the values of the states matching the filters."""
+        assert self.values is not None
+        return [value for value in self.values.values() if value is not _NO_MATCH]
+
+    def sum(self) -> float | None:
+        """Return the sum of the values, None if they are not all numbers."""
+        if self.others:
+            return None
+        return float(self.total) if self.floats else int(self.total)
+
+
+class StatesView:
+    """Filters over the iterated states kept up to date for templates.
+
+    Templates filtering all states or the states of a domain, such as
+    ``states.light | selectattr('state', 'eq', 'on') | count`` or
+    ``states.sensor | map(attribute='state') | map('float') | sum``, are
+    rendered again whenever one of the states changes. The view keeps
+    the result of the filters for each state, and the number and sum of
+    the matching values, so a render only filters the states changed
+    since the previous render. Sums are exact, so a sum of floats can
+    differ in the last digit from adding them up one by one.
+
+    Adding or removing a state changes the order of the states, which
+    filters all of them again on the next render. The view is set up
+    before the integrations, so it sees a state_changed event before
+    the templates rendered by it.
+    """
+
+    __slots__ = ("_hass", "_results", "_results_by_domain")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self._hass = hass
+        self._results: LRU[tuple[Any, ...], _StatesQueryResult] = LRU(
+            MAX_STATES_QUERIES, callback=self._async_evicted
+        )
+        self._results_by_domain: defaultdict[str | None, set[_StatesQueryResult]] = (
+            defaultdict(set)
+        )
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    def _async_evicted(self, key: tuple[Any, ...], result: _StatesQueryResult) -> None:
+        """Stop updating an evicted result."""
+        self._results_by_domain[result.domain].discard(result)
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Mark the changed state in the results."""
+        data = event.data
+        entity_id = data["entity_id"]
+        reorder = data["old_state"] is None or data["new_state"] is None
+        for domain in (None, entity_id.partition(".")[0]):
+            for result in self._results_by_domain.get(domain, ()):
+                if reorder:
+                    result.values = None
+                elif result.values is not None:
+                    result.changed.add(entity_id)
+
+    @callback
+    def async_get(
+        self,
+        environment: TemplateEnvironment,
+        domain: str | None,
+        steps: tuple[_StatesQueryStep, ...],
+    ) -> _StatesQueryResult | None:
+        """Return the up to date result of filters over states."""
+        key = (environment, domain, steps)
+        if (result := self._results.get(key)) is None:
+            context = new_context(environment, None, {})
+            result = self._results[key] = _StatesQueryResult(context, domain, steps)
+            self._results_by_domain[domain].add(result)
+        try:
+            result.async_update(self._hass)
+        except Exception:  # noqa: BLE001
+            # Filtering all the states in the template raises the error
+            del self._results[key]
+            self._results_by_domain[domain].discard(result)
+            return None
+        return result
+
+
+class StatesQuery:
+    """Filters applied to all states or the states of a domain.
+
+    Iterating gives the items the jinja filters give, from the
+    StatesView when it is set up.
+    """
+
+    __slots__ = ("_context", "_domain", "_states", "_steps")
+
+    def __init__(
+        self,
+        context: jinja2.runtime.Context,
+        states: AllStates | DomainStates | StatesQuery,
+        step: _StatesQueryStep,
+    ) -> None:
+        """Initialize the query."""
+        self._context = context
+        if isinstance(states, StatesQuery):
+            self._domain: str | None = states._domain  # noqa: SLF001
+            self._states: AllStates | DomainStates = states._states  # noqa: SLF001
+            self._steps = (*states._steps, step)  # noqa: SLF001
+            return
+        self._domain = (
+            states._domain  # noqa: SLF001
+            if isinstance(states, DomainStates)
+            else None
+        )
+        self._states = states
+        self._steps = (step,)
+
+    def _collect(self) -> None:
+        if (render_info := _render_info.get()) is not None:
+            if self._domain is None:
+                render_info.all_states = True
+            else:
+                render_info.domains.add(self._domain)  # type: ignore[attr-defined]
+
+    def _async_result(self) -> _StatesQueryResult | None:
+        environment = cast(TemplateEnvironment, self._context.environment)
+        if environment.hass is None or (
+            states_view := environment.hass.data.get(_STATES_VIEW)
+        ) is None:
+            return None
+        return states_view.async_get(environment, self._domain, self._steps)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Return the filtered items."""
+        if (result := self._async_result()) is None:
+            return iter(_apply_states_filters(self._context, self._states, self._steps))
+        self._collect()
+        return iter(result.items())
+
+    def async_count(self) -> int:
+        """Return the number of filtered items."""
+        if (result := self._async_result()) is None:
+            return sum(1 for _ in self)
+        self._collect()
+        return result.count
+
+    def async_sum(self) -> float | None:
+        """Return the sum of the filtered items, None if jinja adds them up."""
+        if (result := self._async_result()) is None or (total := result.sum()) is None:
+            return None
+        self._collect()
+        return total
+
+    def __repr__(self) -> str:
+        """Representation of the query."""
+        return f"<template StatesQuery({self._states!r}, {self._steps!r})>"
+
+
+def _states_query_filter(name: str) -> Callable[..., Any]:
+    """Return a jinja filter which keeps filters over states up to date."""
+    jinja_filter = jinja2.filters.FILTERS[name]
+
+    @pass_context
+    def states_query_filter(
+        context: jinja2.runtime.Context, value: Any, *args: Any, **kwargs: Any
+    ) -> Any:
+        if isinstance(value, (AllStates, DomainStates, StatesQuery)) and (
+            step := _states_query_step(name, args, kwargs)
+        ):
+            return StatesQuery(context, value, step)
+        return jinja_filter(context, value, *args, **kwargs)
+
+    return states_query_filter
+
+
+def states_query_count(value: Any) -> int:
+    """Return the number of items, see StatesQuery."""
+    if isinstance(value, StatesQuery):
+        return value.async_count()
+    return len(value)
+
+
+@pass_environment
+def states_query_sum(
+    environment: jinja2.Environment,
+    iterable: Iterable[Any],
+    attribute: str | int | None = None,
+    start: float = 0,
+) -> Any:
+    """Return the sum of the items, see StatesQuery."""
+    if (
+        isinstance(iterable, StatesQuery)
+        and attribute is None
+        and start == 0
+        and (total := iterable.async_sum()) is not None
+    ):
+        return total
+    return jinja2.filters.FILTERS["sum"](environment, iterable, attribute, start)
+
+
 def _get_state_if_valid(hass: HomeAssistant, entity_id: str) -> TemplateState | None:
     state = hass.states.get(entity_id)
     if state is None and not valid_entity_id(entity_id):
@@ -2849,6 +3449,20 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
+        # Keeps recently compiled code alive after the templates using it
+        # are gone. Templates without hass are deprecated and not kept.
+        self.template_lru: LRU[str | jinja2.nodes.Template, CodeType] = LRU(
+            COMPILED_TEMPLATE_CACHE_SIZE
+        )
+        self.template_cache_hits = 0
+        self.template_cache_misses = 0
+        # Templates bound to this environment, shared by all
+        # Template objects with the same source
+        self.bound_templates: LRU[str, jinja2.Template] = LRU(
+            COMPILED_TEMPLATE_CACHE_SIZE
+        )
+        self.bound_template_hits = 0
+        self.bound_template_misses = 0
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3121,6 +3735,10 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.filters["state_attr"] = self.globals["state_attr"]
         self.globals["states"] = AllStates(hass)
         self.filters["states"] = self.globals["states"]
+        for name in ("map", "rejectattr", "selectattr"):
+            self.filters[name] = _states_query_filter(name)
+        self.filters["count"] = self.filters["length"] = states_query_count
+        self.filters["sum"] = states_query_sum
         self.globals["state_translated"] = StateTranslated(hass)
         self.filters["state_translated"] = self.globals["state_translated"]
         self.globals["has_value"] = hassfunction(has_value)
@@ -3203,6 +3821,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         compiled = super().compile(source)
         self.template_cache[source] = compiled
+        if self.hass is not None:
+            self.template_lru[source] = compiled
         return compiled
 
 
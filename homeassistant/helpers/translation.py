@@ -23,9 +23,10 @@ from homeassistant.loader import (
     async_get_integrations,
     bind_hass,
 )
-from homeassistant.util.json import load_json
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, load_json
 
 from . import singleton
+from .startup_cache import DATA_STARTUP_CACHE, StartupCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,8 +47,20 @@ def recursive_flatten(
     return output
 
 
+def _load_translations_file(
+    startup_cache: StartupCache | None, translation_file: pathlib.Path
+) -> Any:
+    """Load and parse a translation.json file."""
+    if startup_cache is not None:
+        # Missing or invalid files are handled by load_json
+        with suppress(OSError, *JSON_DECODE_EXCEPTIONS):
+            return startup_cache.load_json(translation_file)
+    return load_json(translation_file)
+
+
 def _load_translations_files_by_language(
     translation_files: dict[str, dict[str, pathlib.Path]],
+    startup_cache: StartupCache | None = None,
 ) -> dict[str, dict[str, Any]]:
     """Load and parse translation.json files."""
     loaded: dict[str, dict[str, Any]] = {}
@@ -56,7 +69,7 @@ def _load_translations_files_by_language(
         loaded[language] = loaded_for_language
 
         for component, translation_file in component_translation_file.items():
-            loaded_json = load_json(translation_file)
+            loaded_json = _load_translations_file(startup_cache, translation_file)
 
             if not isinstance(loaded_json, dict):
                 _LOGGER.warning(
@@ -113,7 +126,9 @@ async def _async_get_component_strings(
 
     if has_files_to_load:
         loaded_translations_by_language = await hass.async_add_executor_job(
-            _load_translations_files_by_language, files_to_load_by_language
+            _load_translations_files_by_language,
+            files_to_load_by_language,
+            hass.data.get(DATA_STARTUP_CACHE),
         )
 
     for language in languages:
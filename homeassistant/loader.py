@@ -40,6 +40,7 @@ from .generated.ssdp import SSDP
 from .generated.usb import USB
 from .generated.zeroconf import HOMEKIT, ZEROCONF
 from .helpers.json import json_bytes, json_fragment
+from .helpers.startup_cache import DATA_STARTUP_CACHE
 from .helpers.typing import UNDEFINED
 from .util.hass_dict import HassKey
 from .util.json import JSON_DECODE_EXCEPTIONS, json_loads
@@ -659,14 +660,20 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        startup_cache = hass.data.get(DATA_STARTUP_CACHE)
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
+            if startup_cache is None and not manifest_path.is_file():
                 continue
 
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                if startup_cache is not None:
+                    manifest = cast(Manifest, startup_cache.load_json(manifest_path))
+                else:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+            except OSError:
+                continue
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
@@ -682,7 +689,13 @@ class Integration:
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                None
+                if is_virtual
+                else set(
+                    startup_cache.listdir(file_path)
+                    if startup_cache is not None
+                    else os.listdir(file_path)
+                ),
             )
 
             if not integration.import_executor:
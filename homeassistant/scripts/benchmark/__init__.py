@@ -6,17 +6,25 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from functools import partial
 import logging
+import os
+import tempfile
 from timeit import default_timer as timer
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
+    _async_dispatch_domain_event,
+    _async_dispatch_entity_id_event_soon,
+    async_track_state_added_domain,
     async_track_state_change,
     async_track_state_change_event,
+    async_track_state_removed_domain,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -223,6 +231,97 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+async def _state_changed_event_many_listeners(hass, subscribe):
+    """Run 2000 events per second for a minute through 20k state change listeners.
+
+    Each entity has its own listener, along with listeners for
+    entities added to and removed from each domain.
+    """
+    count = 0
+    domains = ("light", "switch", "sensor", "binary_sensor")
+    entity_ids = [f"{domains[idx % 4]}.entity_{idx}" for idx in range(20000)]
+    events_to_fire = 2000 * 60
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    subscribe(hass, entity_ids, domains, listener)
+
+    events_data = [
+        {
+            "entity_id": entity_id,
+            "old_state": core.State(entity_id, "off"),
+            "new_state": core.State(entity_id, "on"),
+        }
+        for entity_id in entity_ids[:2000]
+    ]
+
+    start = timer()
+
+    for _ in range(events_to_fire // len(events_data)):
+        for event_data in events_data:
+            hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
+@benchmark
+async def state_changed_event_many_listeners(hass):
+    """Run 2000 events per second for a minute through the indexed trackers."""
+
+    def subscribe(hass, entity_ids, domains, listener):
+        """Subscribe with the state change trackers."""
+        for entity_id in entity_ids:
+            async_track_state_change_event(hass, entity_id, listener)
+        async_track_state_added_domain(hass, domains, listener)
+        async_track_state_removed_domain(hass, domains, listener)
+
+    return await _state_changed_event_many_listeners(hass, subscribe)
+
+
+@benchmark
+async def state_changed_event_many_listeners_baseline(hass):
+    """Run 2000 events per second for a minute through filtered listeners.
+
+    The listeners are dispatched like the state change trackers, but
+    every tracker listens with an event filter instead of an index.
+    """
+
+    def subscribe(hass, entity_ids, domains, listener):
+        """Subscribe with an event filter per tracker."""
+        job = core.HassJob(listener)
+        entity_callbacks = {entity_id: [job] for entity_id in entity_ids}
+        domain_callbacks = {domain: [job] for domain in domains}
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(_async_dispatch_entity_id_event_soon, hass, entity_callbacks),
+            event_filter=core.callback(
+                lambda event_data: event_data["entity_id"] in entity_callbacks
+            ),
+        )
+        for state_key in ("old_state", "new_state"):
+            hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                partial(_async_dispatch_domain_event, hass, domain_callbacks),
+                event_filter=core.callback(
+                    lambda event_data, state_key=state_key: (
+                        event_data[state_key] is None
+                        and event_data["entity_id"].partition(".")[0]
+                        in domain_callbacks
+                    )
+                ),
+            )
+
+    return await _state_changed_event_many_listeners(hass, subscribe)
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -308,3 +407,282 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_subscription_matching(hass):
+    """Match 50k messages against 10k wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import (
+        Subscription,
+        WildcardSubscriptionTrie,
+    )
+
+    job = core.HassJob(lambda msg: None)
+    trie = WildcardSubscriptionTrie()
+    for idx in range(10**4):
+        if idx % 2:
+            topic = f"zigbee2mqtt/device_{idx}/+"
+        else:
+            topic = f"tasmota/discovery/device_{idx}/#"
+        trie.add(Subscription(topic, False, job))
+
+    topics = [
+        f"zigbee2mqtt/device_{idx}/state"
+        if idx % 2
+        else f"tasmota/discovery/device_{idx}/config"
+        for idx in range(10**4)
+    ]
+    size = len(topics)
+
+    start = timer()
+
+    matched = 0
+    for idx in range(5 * 10**4):
+        matched += len(list(trie.iter_match(topics[idx % size])))
+
+    assert matched == 5 * 10**4
+
+    return timer() - start
+
+
+def _statistics_window_samples():
+    """Return samples for the statistics window benchmarks."""
+    # pylint: disable-next=import-outside-toplevel
+    from datetime import timedelta
+
+    start = dt_util.utcnow()
+    return [
+        ((idx * 7919) % 1000 / 10, start + timedelta(seconds=idx))
+        for idx in range(10**4)
+    ]
+
+
+@benchmark
+async def statistics_window_incremental(hass):
+    """Update a 2000 sample statistics window 10k times incrementally."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.statistics.window import SampleWindow
+
+    samples = _statistics_window_samples()
+    window = SampleWindow(2000, True, False)
+
+    start = timer()
+
+    for value, age in samples:
+        window.append(value, age)
+        window.sum / len(window)
+        if len(window) >= 2:
+            assert window.variance >= 0
+            window.median()
+            window.percentile(95)
+
+    return timer() - start
+
+
+@benchmark
+async def statistics_window_recompute(hass):
+    """Update a 2000 sample statistics window 10k times recomputing it."""
+    # pylint: disable-next=import-outside-toplevel
+    from collections import deque
+    import statistics
+
+    samples = _statistics_window_samples()
+    states: deque[float] = deque(maxlen=2000)
+    ages = deque(maxlen=2000)
+
+    start = timer()
+
+    for value, age in samples:
+        states.append(value)
+        ages.append(age)
+        statistics.mean(states)
+        if len(states) >= 2:
+            statistics.variance(states)
+            statistics.median(states)
+            statistics.quantiles(states, n=100, method="exclusive")[94]
+
+    return timer() - start
+
+
+def _read_startup_files(load_json, listdir):
+    """Read the manifests, listings and translations of built-in integrations."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant import components
+
+    base = components.__path__[0]
+    for domain in sorted(listdir(base)):
+        path = f"{base}/{domain}"
+        try:
+            load_json(f"{path}/manifest.json")
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        if "translations" in listdir(path):
+            with suppress(FileNotFoundError):
+                load_json(f"{path}/translations/en.json")
+
+
+@benchmark
+async def startup_files_uncached(hass):
+    """Read the files of built-in integrations needed at startup."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util.json import json_loads
+
+    def _load_json(path):
+        with open(path, "rb") as fdesc:
+            return json_loads(fdesc.read())
+
+    start = timer()
+
+    _read_startup_files(_load_json, os.listdir)
+
+    return timer() - start
+
+
+@benchmark
+async def startup_files_cached(hass):
+    """Read the files of built-in integrations needed at startup from the cache."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.startup_cache import StartupCache
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "core.startup_cache")
+        startup_cache = StartupCache(path)
+        _read_startup_files(startup_cache.load_json, startup_cache.listdir)
+        startup_cache.save()
+
+        start = timer()
+
+        startup_cache = StartupCache(path)
+        _read_startup_files(startup_cache.load_json, startup_cache.listdir)
+
+        return timer() - start
+
+
+async def _resolve_floor_targets(hass, invalidate):
+    """Resolve floor targets in registries with 10k entities."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+        label_registry as lr,
+        service,
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        hass.config.config_dir = tmpdir
+        await asyncio.gather(
+            ar.async_load(hass),
+            dr.async_load(hass),
+            er.async_load(hass),
+            fr.async_load(hass),
+            lr.async_load(hass),
+        )
+
+    floor_reg = fr.async_get(hass)
+    area_reg = ar.async_get(hass)
+    dev_reg = dr.async_get(hass)
+    ent_reg = er.async_get(hass)
+    for floor_idx in range(10):
+        floor_id = f"floor_{floor_idx}"
+        floor_reg.floors[floor_id] = fr.FloorEntry(
+            aliases=set(), floor_id=floor_id, name=floor_id, normalized_name=floor_id
+        )
+        for area_idx in range(10):
+            area_id = f"area_{floor_idx}_{area_idx}"
+            area_reg.areas[area_id] = ar.AreaEntry(
+                aliases=set(),
+                floor_id=floor_id,
+                icon=None,
+                id=area_id,
+                name=area_id,
+                normalized_name=area_id,
+                picture=None,
+            )
+            for device_idx in range(25):
+                device = dr.DeviceEntry(area_id=area_id)
+                dev_reg.devices[device.id] = device
+                for entity_idx in range(4):
+                    entity_id = f"light.light_{device.id}_{entity_idx}"
+                    ent_reg.entities[entity_id] = er.RegistryEntry(
+                        entity_id=entity_id,
+                        unique_id=entity_id,
+                        platform="benchmark",
+                        device_id=device.id,
+                        labels={"label_1"} if entity_idx == 0 else set(),
+                    )
+
+    calls = [
+        core.ServiceCall("light", "turn_on", {"floor_id": f"floor_{idx % 10}"})
+        for idx in range(10**4)
+    ]
+
+    start = timer()
+
+    for call in calls:
+        selected = service.async_extract_referenced_entity_ids(hass, call)
+        assert len(selected.indirectly_referenced) == 1000
+        if invalidate:
+            hass.data[service.TARGET_RESOLUTION_CACHE].resolved.clear()
+
+    return timer() - start
+
+
+@benchmark
+async def service_target_resolution(hass):
+    """Resolve 10k floor targets in registries with 10k entities."""
+    return await _resolve_floor_targets(hass, False)
+
+
+@benchmark
+async def service_target_resolution_uncached(hass):
+    """Resolve 10k floor targets in registries with 10k entities without cache."""
+    return await _resolve_floor_targets(hass, True)
+
+
+@benchmark
+async def zeroconf_discovery_matching(hass):
+    """Replay 100k announcements of 2000 zeroconf services against the matchers."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import zeroconf
+    from homeassistant.generated.zeroconf import ZEROCONF
+
+    matcher_indexes = zeroconf._build_zeroconf_matcher_indexes(ZEROCONF)  # noqa: SLF001
+    service_types = [
+        *ZEROCONF,
+        "_sleep-proxy._udp.local.",
+        "_companion-link._tcp.local.",
+    ]
+    announcements = []
+    for idx in range(2000):
+        service_type = service_types[idx % len(service_types)]
+        name = f"Device {idx}.{service_type}"
+        if idx % 10 == 0 and (matchers := ZEROCONF.get(service_type)):
+            # Every tenth service is one of a discovered integration
+            matcher = matchers[idx % len(matchers)]
+            if pattern := matcher.get("name"):
+                name = f"{pattern.replace('*', f' {idx}')}.{service_type}"
+        props = {
+            "macaddress": f"{idx * 7919:012x}",
+            "model": f"model {idx}",
+            "manufacturer": "acme",
+            "vendor": "acme",
+            "am": f"model {idx}",
+        }
+        announcements.append((service_type, name, props))
+
+    start = timer()
+
+    matched = 0
+    for idx in range(10**5):
+        service_type, name, props = announcements[idx % 2000]
+        if matcher_index := matcher_indexes.get(service_type):
+            matched += len(
+                zeroconf._match_zeroconf_matchers(matcher_index, name, props)  # noqa: SLF001
+            )
+
+    assert matched
+
+    return timer() - start
@@ -72,6 +72,10 @@ DATA_SETUP_TIME: HassKey[
     defaultdict[str, defaultdict[str | None, defaultdict[SetupPhases, float]]]
 ] = HassKey("setup_time")
 
+# DATA_SETUP_SPANS is a dict, indicating when the setup
+# of a component started and finished.
+DATA_SETUP_SPANS: HassKey[dict[str, tuple[float, float]]] = HassKey("setup_spans")
+
 DATA_DEPS_REQS: HassKey[set[str]] = HassKey("deps_reqs_processed")
 
 DATA_PERSISTENT_ERRORS: HassKey[dict[str, str | None]] = HassKey(
@@ -730,6 +734,12 @@ def _setup_times(
     return defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
 
 
+@singleton.singleton(DATA_SETUP_SPANS)
+def _setup_spans(hass: core.HomeAssistant) -> dict[str, tuple[float, float]]:
+    """Return the setup spans dict."""
+    return {}
+
+
 @contextlib.contextmanager
 def async_start_setup(
     hass: core.HomeAssistant,
@@ -777,6 +787,7 @@ def async_start_setup(
         # platforms, but we only care about the longest time.
         group_setup_times[phase] = max(group_setup_times[phase], time_taken)
         if group is None:
+            _setup_spans(hass)[integration] = (started, started + time_taken)
             _LOGGER.info(
                 "Setup of domain %s took %.2f seconds", integration, time_taken
             )
@@ -816,6 +827,15 @@ def async_get_setup_timings(hass: core.HomeAssistant) -> dict[str, float]:
     return domain_timings
 
 
+@callback
+def async_get_setup_spans(hass: core.HomeAssistant) -> dict[str, tuple[float, float]]:
+    """Return when the setup of each integration started and finished.
+
+    The times are from time.monotonic.
+    """
+    return _setup_spans(hass)
+
+
 @callback
 def async_get_domain_setup_times(
     hass: core.HomeAssistant, domain: str
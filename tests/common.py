@@ -88,6 +88,9 @@ from homeassistant.helpers.dispatcher import (
 )
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.integration_platform import (
+    async_load_lazy_integration_platforms,
+)
 from homeassistant.helpers.json import JSONEncoder, _orjson_default_encoder, json_dumps
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util.async_ import (
@@ -915,6 +918,10 @@ class MockEntityPlatform(entity_platform.EntityPlatform):
         # Otherwise the constructor will blow up.
         if isinstance(platform, Mock) and isinstance(platform.PARALLEL_UPDATES, Mock):
             platform.PARALLEL_UPDATES = 0
+        if isinstance(platform, Mock) and isinstance(
+            platform.PARALLEL_SERVICE_CALLS, Mock
+        ):
+            platform.PARALLEL_SERVICE_CALLS = None
 
         super().__init__(
             hass=hass,
@@ -1430,6 +1437,7 @@ async def flush_store(store: storage.Store) -> None:
 
 async def get_system_health_info(hass: HomeAssistant, domain: str) -> dict[str, Any]:
     """Get system health info."""
+    await async_load_lazy_integration_platforms(hass, "system_health")
     return await hass.data["system_health"][domain].info_callback(hass)
 
 
@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 from homeassistant.components.backup import DOMAIN
+from homeassistant.components.backup.archive import BackupStats
 from homeassistant.components.backup.manager import Backup
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
@@ -19,6 +20,15 @@ TEST_BACKUP = Backup(
     size=0.0,
 )
 
+TEST_STATS = BackupStats(
+    duration=1.0,
+    size=123,
+    source_size=1000,
+    chunks=2,
+    reused_chunks=1,
+    reused_size=500,
+)
+
 
 async def setup_backup_integration(
     hass: HomeAssistant,
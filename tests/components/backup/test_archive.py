@@ -0,0 +1,109 @@
+"""Tests for the generation of backup archives."""
+
+import gzip
+import io
+import os
+from pathlib import Path
+import tarfile
+
+import pytest
+
+from homeassistant.components.backup.archive import (
+    CHUNK_SIZE,
+    ChunkIndex,
+    _gzip_stream_header,
+    write_backup_archive,
+)
+
+
+def _read_inner_archive(tar_file_path: Path) -> tarfile.TarFile:
+    """Return the inner archive of a backup."""
+    with tarfile.open(tar_file_path) as outer_tar:
+        assert outer_tar.getnames() == ["./backup.json", "./homeassistant.tar.gz"]
+        fileobj = outer_tar.extractfile("./homeassistant.tar.gz")
+        assert fileobj is not None
+        inner = gzip.decompress(fileobj.read())
+    return tarfile.open(fileobj=io.BytesIO(inner))
+
+
+def test_write_backup_archive(tmp_path: Path) -> None:
+    """Test writing a backup and reusing the chunks of the previous backup."""
+    config_dir = tmp_path / "config"
+    backup_dir = config_dir / "backups"
+    backup_dir.mkdir(parents=True)
+    database = os.urandom(10_000_000)
+    (config_dir / "home-assistant_v2.db").write_bytes(database)
+    (config_dir / "configuration.yaml").write_text("default_config:\n")
+    index_path = backup_dir / ".chunk_index.json"
+    excludes = ["backups/*.tar", "backups/.chunk_index.json"]
+
+    stats = write_backup_archive(
+        backup_dir / "first.tar", b"{}", config_dir, excludes, index_path
+    )
+    assert stats.size == (backup_dir / "first.tar").stat().st_size
+    assert stats.source_size > len(database)
+    assert stats.chunks > 1
+    assert stats.reused_chunks == 0
+    assert stats.as_dict()["throughput"] > 0
+    assert ChunkIndex.load(index_path).backup_path == backup_dir / "first.tar"
+
+    (config_dir / "configuration.yaml").write_text("homeassistant:\n")
+    stats = write_backup_archive(
+        backup_dir / "second.tar", b"{}", config_dir, excludes, index_path
+    )
+    # The full chunks of the database did not change
+    assert 2 <= stats.reused_chunks < stats.chunks
+    assert stats.reused_size >= 2 * CHUNK_SIZE
+
+    with _read_inner_archive(backup_dir / "second.tar") as inner_tar:
+        assert {"data/configuration.yaml", "data/home-assistant_v2.db"} <= set(
+            inner_tar.getnames()
+        )
+        config = inner_tar.extractfile("data/configuration.yaml")
+        assert config is not None
+        assert config.read() == b"homeassistant:\n"
+        db = inner_tar.extractfile("data/home-assistant_v2.db")
+        assert db is not None
+        assert db.read() == database
+
+
+def test_outdated_chunk_index(tmp_path: Path) -> None:
+    """Test the chunk index is ignored when the previous backup changed."""
+    index_path = tmp_path / ".chunk_index.json"
+    assert ChunkIndex.load(index_path).backup_path is None
+
+    backup_path = tmp_path / "backup.tar"
+    backup_path.write_bytes(b"backup")
+    ChunkIndex(backup_path, {"abc": [0, 6]}).save(index_path)
+    assert ChunkIndex.load(index_path).chunks == {"abc": [0, 6]}
+
+    backup_path.write_bytes(b"changed backup")
+    assert ChunkIndex.load(index_path).chunks == {}
+
+    index_path.write_text("not json")
+    assert ChunkIndex.load(index_path).chunks == {}
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "./homeassistant.tar.gz",
+        # The PAX records of a long name nearly fill a block
+        f"./{'a' * 459}.tar.gz",
+    ],
+)
+def test_gzip_stream_header_size(name: str) -> None:
+    """Test the member header keeps its length for sizes above 8 GiB."""
+    size = 2**34 + 1
+    with tarfile.open(fileobj=io.BytesIO(), mode="w") as outer_tar:
+        tar_info = tarfile.TarInfo(name=name)
+        tar_info.mtime = 1700000000.5
+        header = _gzip_stream_header(outer_tar, tar_info, 0)
+        final_header = _gzip_stream_header(outer_tar, tar_info, size)
+    assert len(final_header) == len(header)
+
+    with tarfile.open(fileobj=io.BytesIO(final_header), mode="r:") as tar:
+        member = tar.next()
+    assert member is not None
+    assert member.name == name
+    assert member.size == size
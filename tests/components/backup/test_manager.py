@@ -13,42 +13,22 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import async_setup_component
 
-from .common import TEST_BACKUP
+from .common import TEST_BACKUP, TEST_STATS
 
 from tests.common import MockPlatform, mock_platform
 
-
 async def _mock_backup_generation(manager: BackupManager):
     """Mock backup generator."""
 
-    def _mock_iterdir(path: Path) -> list[Path]:
-        if not path.name.endswith("testing_config"):
-            return []
-        return [
-            Path("test.txt"),
-            Path(".DS_Store"),
-            Path(".storage"),
-        ]
-
     with (
         patch(
-            "homeassistant.components.backup.manager.SecureTarFile"
-        ) as mocked_tarfile,
-        patch("pathlib.Path.iterdir", _mock_iterdir),
-        patch("pathlib.Path.stat", MagicMock(st_size=123)),
-        patch("pathlib.Path.is_file", lambda x: x.name != ".storage"),
-        patch(
-            "pathlib.Path.is_dir",
-            lambda x: x.name == ".storage",
-        ),
+            "homeassistant.components.backup.manager.write_backup_archive",
+            return_value=TEST_STATS,
+        ) as mocked_write_backup_archive,
         patch(
             "pathlib.Path.exists",
             lambda x: x != manager.backup_dir,
         ),
-        patch(
-            "pathlib.Path.is_symlink",
-            lambda _: False,
-        ),
         patch(
             "pathlib.Path.mkdir",
             MagicMock(),
@@ -62,15 +42,22 @@ async def _mock_backup_generation(manager: BackupManager):
             "2025.1.0",
         ),
     ):
-        await manager.generate_backup()
+        backup = await manager.generate_backup()
 
         assert mocked_json_bytes.call_count == 1
         backup_json_dict = mocked_json_bytes.call_args[0][0]
         assert isinstance(backup_json_dict, dict)
         assert backup_json_dict["homeassistant"] == {"version": "2025.1.0"}
-        assert manager.backup_dir.as_posix() in str(
-            mocked_tarfile.call_args_list[0][0][0]
+        tar_file_path, backup_json, origin_path, excludes, index_path = (
+            mocked_write_backup_archive.call_args[0]
         )
+        assert tar_file_path.parent == manager.backup_dir
+        assert backup_json == b"{}"
+        assert origin_path == Path(manager.hass.config.path())
+        assert "backups/*.tar" in excludes
+        assert index_path == manager.backup_dir / ".chunk_index.json"
+        assert backup.size == 0.0
+        assert manager.last_backup_stats is TEST_STATS
 
 
 async def _setup_mock_domain(
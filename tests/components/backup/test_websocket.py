@@ -5,10 +5,11 @@ from unittest.mock import patch
 import pytest
 from syrupy import SnapshotAssertion
 
+from homeassistant.components.backup import DOMAIN
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
-from .common import TEST_BACKUP, setup_backup_integration
+from .common import TEST_BACKUP, TEST_STATS, setup_backup_integration
 
 from tests.typing import WebSocketGenerator
 
@@ -52,6 +53,26 @@ async def test_info(
         assert snapshot == await client.receive_json()
 
 
+async def test_info_last_backup_stats(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test getting backup info with the statistics of the last backup."""
+    await setup_backup_integration(hass)
+    hass.data[DOMAIN].last_backup_stats = TEST_STATS
+
+    client = await hass_ws_client(hass)
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.components.backup.websocket.BackupManager.get_backups",
+        return_value={},
+    ):
+        await client.send_json_auto_id({"type": "backup/info"})
+        assert snapshot == await client.receive_json()
+
+
 @pytest.mark.parametrize(
     "with_hassio",
     [
@@ -0,0 +1,244 @@
+"""The tests for the history recent state cache."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from freezegun import freeze_time
+import pytest
+
+from homeassistant.components.history.cache import DATA_HISTORY_CACHE
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.components.recorder.common import async_wait_recording_done
+from tests.typing import WebSocketGenerator
+
+
+async def _async_record_states(hass: HomeAssistant) -> tuple:
+    """Record states for a sensor and a significant domain."""
+    start = dt_util.utcnow()
+    with freeze_time(start) as freezer:
+        await async_setup_component(hass, "history", {"history": {"cache_hours": 1}})
+        hass.states.async_set("sensor.test", "on", {"any": "attr"})
+        hass.states.async_set("climate.test", "heat", {"temperature": 20})
+        for idx, (sensor_state, sensor_attr) in enumerate(
+            (
+                ("off", "attr"),
+                ("off", "changed"),
+                ("off", "again"),
+                ("on", "attr"),
+            )
+        ):
+            freezer.tick(timedelta(seconds=10))
+            hass.states.async_set("sensor.test", sensor_state, {"any": sensor_attr})
+            hass.states.async_set("climate.test", "heat", {"temperature": 20 + idx})
+        freezer.tick(timedelta(seconds=10))
+        hass.states.async_remove("sensor.test")
+        freezer.tick(timedelta(seconds=10))
+        await async_wait_recording_done(hass)
+        return start, dt_util.utcnow()
+
+
+@pytest.mark.parametrize("include_start_time_state", [True, False])
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+async def test_cache_matches_database(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Test the cache returns the same states as the database."""
+    start, end = await _async_record_states(hass)
+    cache = hass.data[DATA_HISTORY_CACHE]
+    entity_ids = ["sensor.test", "climate.test"]
+
+    for start_time, end_time in (
+        (start + timedelta(seconds=5), None),
+        (start + timedelta(seconds=15), start + timedelta(seconds=35)),
+        (start + timedelta(seconds=20), end),
+    ):
+        cached = cache.async_get_history(
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        from_database = await recorder_mock.async_add_executor_job(
+            history.get_significant_states,
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        )
+        assert cached.significant_states() == from_database
+
+
+async def test_cache_falls_back_before_horizon(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test windows the cache does not cover are not answered."""
+    start, _ = await _async_record_states(hass)
+    cache = hass.data[DATA_HISTORY_CACHE]
+
+    assert (
+        cache.async_get_history(
+            start - timedelta(seconds=1),
+            None,
+            ["sensor.test"],
+            True,
+            True,
+            False,
+            False,
+        )
+        is None
+    )
+    assert (
+        cache.async_get_history(
+            start + timedelta(seconds=5),
+            None,
+            ["sensor.unknown"],
+            True,
+            True,
+            False,
+            False,
+        )
+        is None
+    )
+
+
+
+async def test_cache_stops_with_home_assistant(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the cache stops following state changes when Home Assistant stops."""
+    start, _ = await _async_record_states(hass)
+    cache = hass.data[DATA_HISTORY_CACHE]
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.test", "on")
+    assert (
+        cache.async_get_history(
+            start + timedelta(seconds=5),
+            None,
+            ["sensor.test"],
+            True,
+            True,
+            False,
+            False,
+        )
+        is None
+    )
+
+async def test_history_during_period_from_cache(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period is answered from the cache."""
+    start, end = await _async_record_states(hass)
+    client = await hass_ws_client()
+
+    with (
+        freeze_time(end),
+        patch(
+            "homeassistant.components.history.websocket_api._ws_get_significant_states"
+        ) as get_significant_states_mock,
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "history/history_during_period",
+                "start_time": (start + timedelta(seconds=15)).isoformat(),
+                "entity_ids": ["sensor.test"],
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+
+    assert not get_significant_states_mock.called
+    assert response["success"]
+    assert [state["s"] for state in response["result"]["sensor.test"]] == [
+        "off",
+        "on",
+        None,
+    ]
+
+
+async def test_stream_from_cache(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the historical states of a stream are answered from the cache."""
+    start, end = await _async_record_states(hass)
+    client = await hass_ws_client()
+
+    with (
+        freeze_time(end),
+        patch(
+            "homeassistant.components.recorder.history.get_significant_states"
+        ) as get_significant_states_mock,
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "history/stream",
+                "start_time": (start + timedelta(seconds=15)).isoformat(),
+                "end_time": end.isoformat(),
+                "entity_ids": ["sensor.test"],
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+
+    assert not get_significant_states_mock.called
+    assert [state["s"] for state in response["event"]["states"]["sensor.test"]] == [
+        "off",
+        "on",
+        None,
+    ]
+
+
+async def test_cache_drops_oversized_attributes(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test attributes the recorder does not store are not cached."""
+    start = dt_util.utcnow()
+    with freeze_time(start) as freezer:
+        await async_setup_component(hass, "history", {"history": {"cache_hours": 1}})
+        hass.states.async_set("sensor.test", "on", {"large": "a" * 20000})
+        freezer.tick(timedelta(seconds=10))
+        await async_wait_recording_done(hass)
+
+    entity_ids = ["sensor.test"]
+    cached = hass.data[DATA_HISTORY_CACHE].async_get_history(
+        start + timedelta(seconds=5), None, entity_ids, True, False, False, False
+    )
+    from_database = await recorder_mock.async_add_executor_job(
+        history.get_significant_states,
+        hass,
+        start + timedelta(seconds=5),
+        None,
+        entity_ids,
+        None,
+        True,
+        False,
+        False,
+        False,
+        True,
+    )
+    assert cached.significant_states() == from_database
+    assert from_database["sensor.test"][0]["a"] == {}
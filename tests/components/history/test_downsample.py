@@ -0,0 +1,82 @@
+"""Test the downsampling of history series."""
+
+import math
+
+from homeassistant.components.history.downsample import (
+    downsample_history,
+    downsample_states,
+)
+
+
+def _series(count: int) -> list[dict[str, str | float]]:
+    """Return a numeric series with a spike."""
+    states: list[dict[str, str | float]] = [
+        {"s": str(math.sin(idx / 10)), "lu": float(idx)} for idx in range(count)
+    ]
+    states[count // 3]["s"] = "100"
+    return states
+
+
+def test_downsample_states() -> None:
+    """Test a numeric series is reduced and keeps its shape."""
+    states = _series(1000)
+    result = downsample_states(states, 100)
+
+    assert len(result) == 100
+    assert result[0] is states[0]
+    assert result[-1] is states[-1]
+    assert {"s": "100", "lu": 333.0} in result
+    last_updated = [state["lu"] for state in result]
+    assert last_updated == sorted(set(last_updated))
+
+
+def test_downsample_keeps_non_numeric_states() -> None:
+    """Test states that are not numeric are kept."""
+    states = _series(1000)
+    states[500]["s"] = "unavailable"
+    result = downsample_states(states, 100)
+
+    assert len(result) == 100
+    assert states[500] in result
+    # The states next to the gap end the numeric runs and are kept
+    assert states[499] in result
+    assert states[501] in result
+
+    binary = [{"s": "on" if idx % 2 else "off", "lu": float(idx)} for idx in range(50)]
+    assert downsample_states(binary, 10) is binary
+
+
+def test_downsample_gap_heavy_series() -> None:
+    """Test max_points is a hard bound for series with many gaps."""
+    states = _series(1000)
+    for idx in range(0, 1000, 7):
+        states[idx]["s"] = "unavailable"
+
+    result = downsample_states(states, 300)
+    assert len(result) <= 300
+    # Every gap keeps its first state
+    assert all(state in result for state in states[::7])
+    last_updated = [state["lu"] for state in result]
+    assert last_updated == sorted(set(last_updated))
+
+    result = downsample_states(states, 100)
+    assert len(result) <= 100
+    assert result[0] is states[0]
+    last_updated = [state["lu"] for state in result]
+    assert last_updated == sorted(set(last_updated))
+
+    for max_points in (3, 10, 50, 143, 290, 999):
+        assert len(downsample_states(states, max_points)) <= max_points
+
+
+def test_downsample_history() -> None:
+    """Test every series of a history response is reduced."""
+    short = _series(10)
+    history = {"sensor.long": _series(1000), "sensor.short": short}
+
+    assert downsample_history(history, None) is history
+    assert len(history["sensor.long"]) == 1000
+
+    downsample_history(history, 50)
+    assert len(history["sensor.long"]) == 50
+    assert history["sensor.short"] is short
@@ -232,6 +232,230 @@ async def test_history_during_period_impossible_conditions(
     assert response["result"] == {}
 
 
+async def test_history_during_period_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sends the history of every entity separately."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on")
+    hass.states.async_set("sensor.two", "on")
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one", "sensor.missing", "sensor.two"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    assert response["event"]["partial"] is True
+    assert [state["s"] for state in response["event"]["states"]["sensor.one"]] == [
+        "on",
+        "off",
+    ]
+
+    # sensor.missing has no history and is skipped
+    response = await client.receive_json()
+    assert response["type"] == "event"
+    assert "partial" not in response["event"]
+    assert [state["s"] for state in response["event"]["states"]["sensor.two"]] == ["on"]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": (dt_util.utcnow() + timedelta(hours=1)).isoformat(),
+            "entity_ids": ["sensor.one"],
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+    response = await client.receive_json()
+    assert response["id"] == 2
+    assert response["event"] == {"states": {}}
+
+    # The subscriptions end with the last chunk
+    for msg_id, subscription in ((3, 1), (4, 2)):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "unsubscribe_events",
+                "subscription": subscription,
+            }
+        )
+        response = await client.receive_json()
+        assert not response["success"]
+        assert response["error"]["code"] == "not_found"
+
+
+async def test_history_during_period_chunked_long_history(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the chunked history of an entity is split in several messages."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("on", "off", "on"):
+        hass.states.async_set("sensor.one", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "CHUNKED_MAX_STATES", 2):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "minimal_response": True,
+                "no_attributes": True,
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        response = await client.receive_json()
+        assert response["event"]["partial"] is True
+        assert [
+            state["s"] for state in response["event"]["states"]["sensor.one"]
+        ] == ["on", "off"]
+        response = await client.receive_json()
+        assert "partial" not in response["event"]
+        assert [
+            state["s"] for state in response["event"]["states"]["sensor.one"]
+        ] == ["on"]
+
+
+async def test_history_during_period_chunked_error(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test errors in a chunked history are never sent after the result."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on")
+    hass.states.async_set("sensor.two", "on")
+    await async_wait_recording_done(hass)
+
+    get_significant_states = websocket_api.history.get_significant_states
+
+    def _get_significant_states(hass, start_time, end_time, entity_ids, *args):
+        if entity_ids == ["sensor.two"]:
+            raise ValueError("Broken history")
+        return get_significant_states(hass, start_time, end_time, entity_ids, *args)
+
+    client = await hass_ws_client()
+    with patch.object(
+        websocket_api.history, "get_significant_states", _get_significant_states
+    ):
+        # The first entity is fetched before the result is sent
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.two", "sensor.one"],
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert not response["success"]
+
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["id"] == 2
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"]["partial"] is True
+        assert "sensor.one" in response["event"]["states"]
+        # The history ends with an empty last chunk
+        response = await client.receive_json()
+        assert response["id"] == 2
+        assert response["event"] == {"states": {}}
+
+    assert "Error fetching the history of sensor.two" in caplog.text
+
+
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period reduces numeric series to max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for value in (1, 5, 2, 3, 9, 4, 2, 1):
+        hass.states.async_set("sensor.test", str(value))
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "significant_changes_only": False,
+            "max_points": 3,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert [state["s"] for state in response["result"]["sensor.test"]] == [
+        "1",
+        "9",
+        "1",
+    ]
+
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "max_points": 2,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 @pytest.mark.parametrize(
     "time_zone", ["UTC", "Europe/Berlin", "America/Chicago", "US/Hawaii"]
 )
@@ -1,16 +1,21 @@
 """The tests for the InfluxDB component."""
 
-from collections.abc import Generator
+from collections.abc import Awaitable, Callable, Generator
 from dataclasses import dataclass
 import datetime
 from http import HTTPStatus
 import logging
+import os
+from pathlib import Path
 from unittest.mock import ANY, MagicMock, Mock, call, patch
 
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 import pytest
 
 from homeassistant.components import influxdb
 from homeassistant.components.influxdb.const import DEFAULT_BUCKET
+from homeassistant.components.influxdb.spool import InfluxSpool
 from homeassistant.const import PERCENTAGE, STATE_OFF, STATE_ON, STATE_STANDBY
 from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.setup import async_setup_component
@@ -1706,3 +1711,136 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+def test_spool_max_size(tmp_path: Path) -> None:
+    """Test the spool drops the oldest segments when it is full."""
+    spool = InfluxSpool(tmp_path, 100)
+    spool.load()
+    assert not spool
+
+    assert spool.append(b"first value=1 1\n") == 0
+    first = spool.segments[0]
+    assert spool.read(first) == b"first value=1 1\n"
+
+    first_size = first.stat().st_size
+    assert spool.append(os.urandom(200)) == first_size
+    assert not first.exists()
+    assert len(spool.segments) == 1
+
+    reloaded = InfluxSpool(tmp_path, 100)
+    reloaded.load()
+    assert reloaded.segments == spool.segments
+    assert reloaded.size == spool.size
+
+
+
+@pytest.mark.parametrize(
+    ("precision", "timestamp"),
+    [
+        (None, 1700000000123456000),
+        ("ns", 1700000000123456000),
+        ("us", 1700000000123456),
+        ("ms", 1700000000123),
+        ("s", 1700000000),
+    ],
+)
+def test_spool_precision(tmp_path: Path, precision: str | None, timestamp: int) -> None:
+    """Test events are spooled with the timestamp in the configured precision."""
+    spool = InfluxSpool(tmp_path, 1024)
+    spool.load()
+    thread = influxdb.InfluxThread(
+        MagicMock(), MagicMock(), MagicMock(), 0, spool, precision
+    )
+    thread.spool_events(
+        [
+            {
+                "measurement": "temperature",
+                "time": datetime.datetime(
+                    2023, 11, 14, 22, 13, 20, 123456, tzinfo=datetime.UTC
+                ),
+                "fields": {"value": 20.5},
+            }
+        ]
+    )
+
+    assert thread.spooled_events == 1
+    assert spool.read(spool.segments[0]) == (
+        f"temperature value=20.5 {timestamp}\n".encode()
+    )
+
+async def _async_wait_for_write(hass: HomeAssistant) -> None:
+    """Wait for the queue to be processed and the batch to be written.
+
+    The queue is processed before the batch is written, the batch has
+    been written once the thread processes the queue again.
+    """
+    await async_wait_for_queue_to_process(hass)
+    await async_wait_for_queue_to_process(hass)
+
+
+@pytest.fixture
+def aiohttp_server(
+    aiohttp_server: Callable[[web.Application], Awaitable[TestServer]],
+    socket_enabled: None,
+) -> Callable[[web.Application], Awaitable[TestServer]]:
+    """Return aiohttp_server and allow opening sockets."""
+    return aiohttp_server
+
+
+async def test_spool_replay(
+    hass: HomeAssistant,
+    aiohttp_server: Callable[[web.Application], Awaitable[TestServer]],
+    tmp_path: Path,
+) -> None:
+    """Test events are spooled while InfluxDB is down and replayed after."""
+    available = True
+    written: list[bytes] = []
+
+    async def handle_write(request: web.Request) -> web.Response:
+        if not available:
+            return web.Response(status=HTTPStatus.SERVICE_UNAVAILABLE)
+        written.append(await request.read())
+        return web.Response(status=HTTPStatus.NO_CONTENT)
+
+    app = web.Application()
+    app.router.add_post("/write", handle_write)
+    server = await aiohttp_server(app)
+
+    config = {
+        influxdb.DOMAIN: {
+            "host": "127.0.0.1",
+            "port": server.port,
+            "spool_max_size": 1,
+        }
+    }
+    with patch(f"{INFLUX_PATH}.SPOOL_DIRECTORY", str(tmp_path)):
+        assert await async_setup_component(hass, influxdb.DOMAIN, config)
+        await hass.async_block_till_done()
+    written.clear()
+
+    available = False
+    hass.states.async_set("sensor.temperature", "20.5", {"unit_of_measurement": "°C"})
+    await hass.async_block_till_done()
+    await _async_wait_for_write(hass)
+    assert not written
+    assert len(list(tmp_path.glob("*.lp.gz"))) == 1
+
+    # Events are spooled without a write until the retry delay has passed
+    available = True
+    hass.states.async_set("sensor.temperature", "21.5", {"unit_of_measurement": "°C"})
+    await hass.async_block_till_done()
+    await _async_wait_for_write(hass)
+    assert not written
+    assert len(list(tmp_path.glob("*.lp.gz"))) == 2
+
+    hass.data[influxdb.DOMAIN].spool_until = 0
+    hass.states.async_set("sensor.temperature", "22.5", {"unit_of_measurement": "°C"})
+    await hass.async_block_till_done()
+    await _async_wait_for_write(hass)
+
+    assert len(written) == 3
+    assert b"value=22.5" in written[0]
+    assert b"value=20.5" in written[1]
+    assert b"value=21.5" in written[2]
+    assert not list(tmp_path.glob("*.lp.gz"))
@@ -1741,6 +1741,71 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_past_only(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.processor.EVENTS_PAGE_SIZE", 2)
+async def test_logbook_events_in_pages(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test historical events are converted and streamed in pages."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await hass.async_block_till_done()
+    # The first state has no previous state and is not in the logbook
+    for state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON, STATE_OFF, STATE_ON):
+        hass.states.async_set("light.small", state)
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.small"],
+        }
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["success"]
+    events = msg["result"]
+    assert [event["state"] for event in events] == [
+        STATE_ON,
+        STATE_OFF,
+        STATE_ON,
+        STATE_OFF,
+        STATE_ON,
+    ]
+
+    await websocket_client.send_json(
+        {
+            "id": 8,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+            "end_time": (dt_util.utcnow() - timedelta(microseconds=1)).isoformat(),
+            "entity_ids": ["light.small"],
+        }
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 8
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    pages = []
+    for _ in range(3):
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 8
+        assert msg["type"] == "event"
+        pages.append(msg["event"])
+    assert [len(page["events"]) for page in pages] == [2, 2, 1]
+    assert [page.get("partial") for page in pages] == [True, True, None]
+    assert [event for page in pages for event in page["events"]] == events
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_big_query(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -12,7 +12,11 @@ import paho.mqtt.client as paho_mqtt
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    WildcardSubscriptionTrie,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -22,7 +26,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -629,6 +639,88 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+async def test_subscribe_overlapping_wildcards_after_unsubscribe(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test overlapping wildcard subscriptions are matched after unsubscribing."""
+    await mqtt_mock_entry()
+    unsub_level = await mqtt.async_subscribe(hass, "test-topic/+/on", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(hass, "+/bier/+", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 3
+
+    recorded_calls.clear()
+    unsub_level()
+
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 2
+
+
+@pytest.mark.parametrize(
+    ("topic", "expected"),
+    [
+        ("sensor/kitchen/state", {"sensor/+/state", "sensor/#", "#", "+/+/+"}),
+        ("sensor/kitchen", {"sensor/+", "sensor/#", "#"}),
+        ("sensor", {"sensor/#", "#"}),
+        ("sensor/kitchen/state/extra", {"sensor/#", "#"}),
+        ("$SYS/broker/uptime", {"$SYS/#", "$SYS/+/uptime"}),
+        ("/leading/slash", {"#", "+/+/+"}),
+        ("other/topic", {"#"}),
+    ],
+)
+def test_wildcard_subscription_trie_matching(topic: str, expected: set[str]) -> None:
+    """Test the wildcard subscription trie matches topics per the MQTT spec."""
+    trie = WildcardSubscriptionTrie()
+    subscriptions = {
+        filter_topic: Subscription(filter_topic, False, HassJob(lambda msg: None))
+        for filter_topic in (
+            "sensor/+/state",
+            "sensor/+",
+            "sensor/#",
+            "#",
+            "+/+/+",
+            "$SYS/#",
+            "$SYS/+/uptime",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+
+    assert len(trie) == len(subscriptions)
+    assert {sub.topic for sub in trie.iter_match(topic)} == expected
+
+
+def test_wildcard_subscription_trie_remove() -> None:
+    """Test removing subscriptions from the wildcard subscription trie."""
+    trie = WildcardSubscriptionTrie()
+    job = HassJob(lambda msg: None)
+    sub1 = Subscription("test-topic/+/on", False, job)
+    sub2 = Subscription("test-topic/+/on", False, job, qos=1)
+    trie.add(sub1)
+    trie.add(sub2)
+    assert trie.has_topic("test-topic/+/on")
+    assert set(trie.iter_match("test-topic/bier/on")) == {sub1, sub2}
+
+    trie.remove(sub1)
+    assert trie.has_topic("test-topic/+/on")
+    assert list(trie.iter_match("test-topic/bier/on")) == [sub2]
+
+    trie.remove(sub2)
+    assert not trie.has_topic("test-topic/+/on")
+    assert not trie
+    assert list(trie.iter_match("test-topic/bier/on")) == []
+
+    with pytest.raises(KeyError):
+        trie.remove(sub2)
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
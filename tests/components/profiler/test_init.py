@@ -18,8 +18,11 @@ from homeassistant.components.profiler import (
     CONF_ENABLED,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_DUMP_STARTUP_TRACE,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_LOG_ENTITY_SERVICE_CALL_LATENCY,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_LAZY_PLATFORM_IMPORTS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
@@ -34,7 +37,9 @@ from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.service import EntityServiceCallLatency
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import load_json
 
 from tests.common import MockConfigEntry, async_fire_time_changed
 
@@ -244,6 +249,142 @@ async def test_log_current_tasks(
     await hass.async_block_till_done()
 
 
+async def test_dump_startup_trace(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test we can write the startup trace."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_DUMP_STARTUP_TRACE)
+
+    last_filename = None
+
+    def _mock_path(filename: str) -> str:
+        nonlocal last_filename
+        last_filename = str(tmp_path / filename)
+        return last_filename
+
+    with (
+        patch(
+            "homeassistant.components.profiler.async_get_setup_spans",
+            return_value={
+                "http": (10.0, 10.5),
+                "frontend": (10.5, 12.0),
+                "zone": (10.1, 10.2),
+            },
+        ),
+        patch.object(hass.config, "path", _mock_path),
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_DUMP_STARTUP_TRACE, {}, blocking=True
+        )
+
+    assert load_json(last_filename)["traceEvents"] == [
+        {
+            "name": "http",
+            "cat": "setup",
+            "ph": "X",
+            "ts": 0,
+            "dur": 500000,
+            "pid": 1,
+            "tid": 0,
+        },
+        {
+            "name": "zone",
+            "cat": "setup",
+            "ph": "X",
+            "ts": 100000,
+            "dur": 100000,
+            "pid": 1,
+            "tid": 1,
+        },
+        {
+            "name": "frontend",
+            "cat": "setup",
+            "ph": "X",
+            "ts": 500000,
+            "dur": 1500000,
+            "pid": 1,
+            "tid": 0,
+        },
+    ]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_log_lazy_platform_imports(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test we can log the imports of lazy integration platforms."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_LAZY_PLATFORM_IMPORTS)
+
+    with patch(
+        "homeassistant.components.profiler.async_get_lazy_integration_platforms_report",
+        return_value={
+            "diagnostics": {
+                "providers": 3,
+                "imported": 2,
+                "import_time": 0.5,
+                "import_times": {"hue": 0.1, "zha": 0.4},
+            }
+        },
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_LOG_LAZY_PLATFORM_IMPORTS, {}, blocking=True
+        )
+
+    assert (
+        "Imported 2 of 3 diagnostics platforms in 0.500s: zha (0.400s), hue (0.100s)"
+        in caplog.text
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_log_entity_service_call_latency(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test we can log the latency of entity service calls."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_ENTITY_SERVICE_CALL_LATENCY)
+
+    latency = EntityServiceCallLatency()
+    latency.record(0.2)
+    latency.record(3.0)
+    with patch(
+        "homeassistant.components.profiler.async_get_entity_service_call_latency",
+        return_value={("light", "turn_off", "hue"): latency},
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_LOG_ENTITY_SERVICE_CALL_LATENCY, {}, blocking=True
+        )
+
+    assert (
+        "Latency of light.turn_off for hue entities: 2 calls, mean 1.600s, max 3.000s"
+        in caplog.text
+    )
+    assert "'0.25': 1" in caplog.text
+    assert "'5.0': 1" in caplog.text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_log_scheduled(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
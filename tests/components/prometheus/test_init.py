@@ -51,6 +51,7 @@ from homeassistant.components.fan import (
 )
 from homeassistant.components.humidifier import ATTR_AVAILABLE_MODES
 from homeassistant.components.lock import LockState
+from homeassistant.components.prometheus.exposition import MetricsExposition
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import (
     ATTR_BATTERY_LEVEL,
@@ -211,6 +212,73 @@ async def test_view_default_namespace(
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_openmetrics(
+    hass: HomeAssistant,
+    client: ClientSessionGenerator,
+    sensor_entities: dict[str, er.RegistryEntry],
+) -> None:
+    """Test prometheus metrics view in the OpenMetrics format."""
+    resp = await client.get(
+        prometheus.API_ENDPOINT,
+        headers={
+            "Accept": "application/openmetrics-text;version=1.0.0,"
+            "text/plain;version=0.0.4;q=0.5"
+        },
+    )
+    assert resp.status == HTTPStatus.OK
+    assert (
+        resp.headers["content-type"]
+        == "application/openmetrics-text; version=1.0.0; charset=utf-8"
+    )
+    assert resp.headers["content-encoding"] == "gzip"
+    body = (await resp.text()).split("\n")
+
+    assert "# TYPE state_change counter" in body
+    assert (
+        'state_change_total{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0' in body
+    )
+    assert body[-2:] == ["# EOF", ""]
+
+    state = hass.states.get("sensor.radio_energy")
+    assert state is not None
+    hass.states.async_set(state.entity_id, "75.0", state.attributes)
+    await hass.async_block_till_done()
+
+    body = await generate_latest_metrics(client)
+    assert (
+        'state_change_total{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 2.0' in body
+    )
+
+
+def test_exposition_flush_before_write() -> None:
+    """Test a labelset is rendered with a value written after a flush."""
+    exposition = MetricsExposition()
+    labelnames = ["entity", "friendly_name", "domain"]
+    metric = exposition.add_metric(
+        prometheus_client.Gauge("test_value", "Test", labelnames, registry=None),
+        "test_value",
+        "Test",
+        labelnames,
+    )
+    child = metric.labels(entity="sensor.test", friendly_name="Test", domain="sensor")
+    # A scrape may flush between getting the child and writing its value
+    exposition.flush()
+    child.set(5)
+
+    body = exposition.generate(
+        prometheus_client.CollectorRegistry(), False, False
+    ).decode()
+    assert (
+        'test_value{domain="sensor",entity="sensor.test",friendly_name="Test"} 5.0'
+        in body.split("\n")
+    )
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_unit(
     client: ClientSessionGenerator, sensor_entities: dict[str, er.RegistryEntry]
@@ -0,0 +1,70 @@
+"""Test the recorder adaptive commit scheduler."""
+
+from unittest.mock import patch
+
+from homeassistant.components.recorder.commit_scheduler import (
+    COMMIT_BACKLOG_THRESHOLD,
+    MAX_COMMIT_BATCH_SIZE,
+    MIN_COMMIT_BATCH_SIZE,
+    AdaptiveCommitScheduler,
+)
+
+
+def test_no_commit_by_size_without_backlog() -> None:
+    """Test transactions are left to the commit interval without a backlog."""
+    scheduler = AdaptiveCommitScheduler()
+    for _ in range(MIN_COMMIT_BATCH_SIZE * 2):
+        assert not scheduler.event_processed(
+            scheduler.event_started(), COMMIT_BACKLOG_THRESHOLD - 1
+        )
+    assert scheduler.commits_by_size == 0
+
+
+def test_commit_by_size_with_backlog() -> None:
+    """Test transactions are committed by size while there is a backlog."""
+    scheduler = AdaptiveCommitScheduler()
+    for _ in range(MIN_COMMIT_BATCH_SIZE - 1):
+        assert not scheduler.event_processed(
+            scheduler.event_started(), COMMIT_BACKLOG_THRESHOLD
+        )
+    assert scheduler.event_processed(
+        scheduler.event_started(), COMMIT_BACKLOG_THRESHOLD
+    )
+    assert scheduler.commits_by_size == 1
+
+
+def test_batch_size_from_commit_latency() -> None:
+    """Test the batch size amortizes the commit latency."""
+    scheduler = AdaptiveCommitScheduler()
+    # 1024 events that take 1/1024s each to process
+    with patch(
+        "homeassistant.components.recorder.commit_scheduler.time.monotonic",
+        return_value=1 / 1024,
+    ):
+        for _ in range(1024):
+            scheduler.event_processed(0.0, 0)
+
+    # A commit that takes 0.5s after waiting 30s for the commit interval
+    with patch(
+        "homeassistant.components.recorder.commit_scheduler.time.monotonic",
+        return_value=31.5,
+    ):
+        scheduler.commit_finished(31.0, 0)
+
+    assert scheduler.event_cost == 1 / 1024
+    assert scheduler.commit_latency == 0.5
+    assert scheduler.batch_size == 5120
+
+
+def test_batch_size_grows_with_backlog_and_is_bounded() -> None:
+    """Test the batch size follows the backlog within bounds."""
+    scheduler = AdaptiveCommitScheduler()
+    scheduler.commit_finished(scheduler.commit_started(), 0)
+    assert scheduler.batch_size == MIN_COMMIT_BATCH_SIZE
+
+    scheduler.commit_finished(scheduler.commit_started(), 50000)
+    assert scheduler.batch_size == 5000
+    assert scheduler.last_backlog == 50000
+
+    scheduler.commit_finished(scheduler.commit_started(), 10**7)
+    assert scheduler.batch_size == MAX_COMMIT_BATCH_SIZE
@@ -21,6 +21,7 @@ from homeassistant.components.lock import LockState
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
+    CONF_BULK_INSERT,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
@@ -136,6 +137,7 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        bulk_insert=False,
     )
 
 
@@ -1468,6 +1470,124 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_INSERT: True}])
+async def test_saving_states_and_events_with_bulk_insert(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test saving states and events with multi-row inserts."""
+    instance = get_instance(hass)
+    assert instance._bulk_writer is not None
+
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    hass.states.async_set("test.two", "s2", {"attr": 1})
+    hass.states.async_set("test.one", "s3", {"attr": 2})
+    hass.states.async_set("test.one", "s4", {"attr": 2})
+    hass.bus.async_fire("bulk_event", {"data": 1})
+    hass.bus.async_fire("bulk_event", {"data": 1})
+    await async_wait_recording_done(hass)
+    assert not instance.event_session.new
+
+    hass.states.async_set("test.one", "s5", {"attr": 1})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+        )
+        assert len(states) == 5
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.two"
+        assert states_by_state["s5"].entity_id == "test.one"
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s4"].state_id
+
+        assert json_loads(states_by_state["s1"].shared_attrs) == {"attr": 1}
+        assert json_loads(states_by_state["s4"].shared_attrs) == {"attr": 2}
+        assert json_loads(states_by_state["s5"].shared_attrs) == {"attr": 1}
+        assert len({state.shared_attrs for state in states}) == 2
+
+        events = list(
+            session.query(Events.data_id, EventData.shared_data)
+            .outerjoin(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+            .filter(EventTypes.event_type == "bulk_event")
+        )
+        assert len(events) == 2
+        assert events[0].data_id == events[1].data_id
+        assert json_loads(events[0].shared_data) == {"data": 1}
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_INSERT: True}])
+async def test_saving_states_with_bulk_insert_commit_retry(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
+) -> None:
+    """Test a failed commit of multi-row inserts is retried with the rows."""
+    instance = get_instance(hass)
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    await async_wait_recording_done(hass)
+
+    session = instance.event_session
+    commit = session.commit
+    failed = False
+
+    def _fail_first_commit() -> None:
+        nonlocal failed
+        if not failed:
+            failed = True
+            # The transaction is lost when the connection fails
+            session.rollback()
+            raise OperationalError("commit", "fake params", "forced to fail")
+        commit()
+
+    with (
+        patch("time.sleep"),
+        patch.object(session, "commit", side_effect=_fail_first_commit),
+    ):
+        hass.states.async_set("test.one", "s2", {"attr": 2})
+        hass.states.async_set("test.one", "s3", {"attr": 2})
+        await async_wait_recording_done(hass)
+
+    assert failed
+    assert "Error executing query" in caplog.text
+
+    hass.states.async_set("test.one", "s4", {"attr": 2})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            ).outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+        )
+        assert len(states) == 4
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert json_loads(states_by_state["s4"].shared_attrs) == {"attr": 2}
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
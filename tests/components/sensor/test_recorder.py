@@ -35,6 +35,7 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor.recorder import ACCUMULATOR, compile_statistics
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component
@@ -148,6 +149,80 @@ async def assert_validation_result(
     assert response["result"] == expected_result
 
 
+
+async def test_accumulated_statistics_match_database(hass: HomeAssistant) -> None:
+    """Test statistics compiled from accumulated periods match the database."""
+    # The database only has a state at the start of the first period
+    # if it was recorded after the recorder run started
+    zero = get_start_time(dt_util.utcnow()) + timedelta(minutes=10)
+    instance = get_instance(hass)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    with freeze_time(zero - timedelta(minutes=1)) as freezer:
+        hass.states.async_set("sensor.power", "10", POWER_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.energy", "10", ENERGY_SENSOR_ATTRIBUTES)
+        for offset, power, energy in (
+            (30, "20", "12"),
+            (60, STATE_UNAVAILABLE, "15"),
+            (90, "5", "14.5"),
+            (120, "5", "16"),
+            (150, "7", "17"),
+            (180, "7", "20"),
+            (400, "30", "1"),
+            (450, "-5", "-3"),
+            (500, "15", "4"),
+        ):
+            freezer.move_to(zero + timedelta(seconds=offset))
+            hass.states.async_set("sensor.power", power, POWER_SENSOR_ATTRIBUTES)
+            hass.states.async_set("sensor.energy", energy, ENERGY_SENSOR_ATTRIBUTES)
+        # Attribute changes are only significant for sums
+        freezer.move_to(zero + timedelta(seconds=510))
+        hass.states.async_set(
+            "sensor.power", "15", {**POWER_SENSOR_ATTRIBUTES, "any": "attr"}
+        )
+        hass.states.async_set(
+            "sensor.energy", "4", {**ENERGY_SENSOR_ATTRIBUTES, "any": "attr"}
+        )
+        await async_wait_recording_done(hass)
+        # State changes are not accumulated while recording is disabled
+        instance.set_enable(False)
+        freezer.move_to(zero + timedelta(seconds=520))
+        hass.states.async_set("sensor.power", "100", POWER_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.energy", "100", ENERGY_SENSOR_ATTRIBUTES)
+        await async_wait_recording_done(hass)
+        instance.set_enable(True)
+        freezer.move_to(zero + timedelta(seconds=560))
+        hass.states.async_set("sensor.power", "40", POWER_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.energy", "110", ENERGY_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+
+    def _compile(start: datetime) -> list:
+        with session_scope(hass=hass, read_only=True) as session:
+            return compile_statistics(
+                hass, session, start, start + timedelta(minutes=5)
+            ).platform_stats
+
+    accumulator = hass.data.pop(ACCUMULATOR)
+    # The last period has no state changes
+    periods = [zero + timedelta(minutes=5 * idx) for idx in range(3)]
+    from_database = [
+        await instance.async_add_executor_job(_compile, start) for start in periods
+    ]
+    hass.data[ACCUMULATOR] = accumulator
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_full_significant_states_mock:
+        accumulated = [
+            await instance.async_add_executor_job(_compile, start) for start in periods
+        ]
+
+    assert not get_full_significant_states_mock.called
+    assert accumulated == from_database
+    assert [len(stats) for stats in accumulated] == [2, 2, 2]
+
 @pytest.mark.parametrize(
     (
         "device_class",
@@ -247,6 +322,136 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_statistics_from_state_changes(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test statistics are compiled from collected state changes when complete."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    with freeze_time(zero - timedelta(minutes=1)) as freezer:
+        # The state at the start of the period is known for these sensors
+        hass.states.async_set("sensor.test1", "10", POWER_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.energy", "10", ENERGY_SENSOR_ATTRIBUTES)
+        await async_record_states(
+            hass, freezer, zero, "sensor.test1", POWER_SENSOR_ATTRIBUTES
+        )
+        # This sensor is only known from within the period
+        await async_record_states(
+            hass, freezer, zero, "sensor.test2", POWER_SENSOR_ATTRIBUTES
+        )
+        freezer.move_to(zero + timedelta(seconds=270))
+        hass.states.async_set("sensor.energy", "20", ENERGY_SENSOR_ATTRIBUTES)
+        # Attribute changes are not significant for measurements
+        hass.states.async_set(
+            "sensor.test1", "30", {**POWER_SENSOR_ATTRIBUTES, "any": "attr"}
+        )
+        # ..but they are for sensors with a sum
+        hass.states.async_set(
+            "sensor.energy", "20", {**ENERGY_SENSOR_ATTRIBUTES, "any": "attr"}
+        )
+        freezer.move_to(zero + timedelta(seconds=280))
+        hass.states.async_set("sensor.energy", "25", ENERGY_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_full_significant_states_mock:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+
+    get_full_significant_states_mock.assert_called_once()
+    assert get_full_significant_states_mock.call_args.kwargs["entity_ids"] == [
+        "sensor.test2"
+    ]
+    stats = statistics_during_period(hass, zero, period="5minute")
+    measurement_stat = {
+        "start": process_timestamp(zero).timestamp(),
+        "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+        "mean": pytest.approx(13.05084745762712),
+        "min": pytest.approx(-10.0),
+        "max": pytest.approx(30.0),
+        "last_reset": None,
+        "state": None,
+        "sum": None,
+    }
+    assert stats == {
+        "sensor.energy": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": pytest.approx(25.0),
+                "sum": pytest.approx(15.0),
+            }
+        ],
+        "sensor.test1": [
+            {**measurement_stat, "mean": pytest.approx(13.0)},
+        ],
+        "sensor.test2": [measurement_stat],
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
+async def test_compile_statistics_sums_from_state_changes_and_database(
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test sums are compiled from collected state changes and the database."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    with freeze_time(zero - timedelta(minutes=1)) as freezer:
+        # The state at the start of the period is known for this sensor
+        hass.states.async_set("sensor.energy", "10", ENERGY_SENSOR_ATTRIBUTES)
+        freezer.move_to(zero + timedelta(seconds=30))
+        # This sensor is only known from within the period
+        hass.states.async_set("sensor.energy2", "100", ENERGY_SENSOR_ATTRIBUTES)
+        freezer.move_to(zero + timedelta(seconds=270))
+        hass.states.async_set("sensor.energy", "20", ENERGY_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.energy2", "130", ENERGY_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_full_significant_states_mock:
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+
+    get_full_significant_states_mock.assert_called_once()
+    assert get_full_significant_states_mock.call_args.kwargs["entity_ids"] == [
+        "sensor.energy2"
+    ]
+    stats = statistics_during_period(hass, zero, period="5minute")
+    sum_stat = {
+        "start": process_timestamp(zero).timestamp(),
+        "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+        "mean": None,
+        "min": None,
+        "max": None,
+        "last_reset": None,
+    }
+    assert stats == {
+        "sensor.energy": [
+            {**sum_stat, "state": pytest.approx(20.0), "sum": pytest.approx(10.0)}
+        ],
+        "sensor.energy2": [
+            {**sum_stat, "state": pytest.approx(130.0), "sum": pytest.approx(30.0)}
+        ],
+    }
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
@@ -0,0 +1,73 @@
+"""Test the sample window of the statistics sensor."""
+
+from datetime import timedelta
+import math
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.window import SampleWindow
+from homeassistant.util import dt as dt_util
+
+
+@pytest.mark.parametrize("max_size", [None, 1, 2, 20])
+def test_window_matches_recomputation(max_size: int | None) -> None:
+    """Test the incremental aggregates match computing them from the samples."""
+    rng = random.Random(0)
+    window = SampleWindow(max_size, True, True)
+    now = dt_util.utcnow()
+    for _ in range(500):
+        if window and rng.random() < 0.2:
+            window.popleft()
+        else:
+            now += timedelta(seconds=rng.randint(1, 60))
+            window.append(round(rng.uniform(-20, 20), 1), now)
+
+        values = list(window.values)
+        if not values:
+            continue
+        assert window.sum == pytest.approx(sum(values))
+        assert window.median() == statistics.median(values)
+        assert window.sorted_values[0] == min(values)
+        assert window.sorted_values[-1] == max(values)
+        angles = [math.radians(value) for value in values]
+        assert window.sin_sum == pytest.approx(
+            sum(math.sin(angle) for angle in angles), abs=1e-9
+        )
+        if len(values) < 2:
+            continue
+        ages = list(window.ages)
+        elapsed = [
+            (ages[idx] - ages[idx - 1]).total_seconds() for idx in range(1, len(values))
+        ]
+        assert window.variance == pytest.approx(statistics.variance(values))
+        assert window.percentile(5) == pytest.approx(
+            statistics.quantiles(values, n=100, method="exclusive")[4]
+        )
+        assert window.area_step == pytest.approx(
+            sum(values[idx] * elapsed[idx] for idx in range(len(elapsed)))
+        )
+        assert window.area_linear == pytest.approx(
+            sum(
+                0.5 * (values[idx] + values[idx + 1]) * elapsed[idx]
+                for idx in range(len(elapsed))
+            )
+        )
+        assert window.sum_differences == pytest.approx(
+            sum(abs(values[idx + 1] - values[idx]) for idx in range(len(elapsed)))
+        )
+
+
+def test_window_drops_oldest_sample_when_full() -> None:
+    """Test appending to a full window drops the oldest sample."""
+    window = SampleWindow(2, False, False)
+    now = dt_util.utcnow()
+    for value in (1.0, 2.0, 3.0):
+        now += timedelta(seconds=10)
+        window.append(value, now)
+
+    assert list(window.values) == [2.0, 3.0]
+    assert window.sum == 5.0
+    assert window.sorted_values is None
+    assert window.area_step == 20.0
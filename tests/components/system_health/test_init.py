@@ -57,13 +57,13 @@ async def test_info_endpoint_return_info(
     """Test that the info endpoint works."""
     assert await async_setup_component(hass, "homeassistant", {})
 
+    # The platform is imported when the info is requested
     with patch(
         "homeassistant.components.homeassistant.system_health.system_health_info",
         return_value={"hello": True},
     ):
         assert await async_setup_component(hass, "system_health", {})
-
-    data = await gather_system_health_info(hass, hass_ws_client)
+        data = await gather_system_health_info(hass, hass_ws_client)
 
     assert len(data) == 1
     data = data["homeassistant"]
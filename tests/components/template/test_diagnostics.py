@@ -0,0 +1,42 @@
+"""Test template diagnostics."""
+
+from homeassistant.components.template.const import DOMAIN
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry
+from tests.components.diagnostics import get_diagnostics_for_config_entry
+from tests.typing import ClientSessionGenerator
+
+
+async def test_diagnostics(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test diagnostics report the template cache."""
+    hass.states.async_set("sensor.one", "1")
+    config_entry = MockConfigEntry(
+        data={},
+        domain=DOMAIN,
+        options={
+            "name": "My template",
+            "state": "{{ states('sensor.one') | float * 2 }}",
+            "template_type": "sensor",
+        },
+        title="My template",
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.my_template").state == "2.0"
+
+    diagnostics = await get_diagnostics_for_config_entry(
+        hass, hass_client, config_entry
+    )
+
+    assert diagnostics["options"] == {
+        "name": "My template",
+        "state": "{{ states('sensor.one') | float * 2 }}",
+        "template_type": "sensor",
+    }
+    template_cache = diagnostics["template_cache"]
+    assert template_cache["environments"]["default"]["compiled"]["misses"] >= 1
+    assert template_cache["static_entities"]["simple"] >= 1
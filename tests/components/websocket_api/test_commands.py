@@ -1198,6 +1198,80 @@ async def test_subscribe_unsubscribe_entities(
     }
 
 
+async def test_subscribe_entities_merge_pending_changes(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test state changes are merged while messages are pending."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.hallway", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "merge_pending_changes": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.kitchen", "light.hallway"}
+
+    with patch(
+        "homeassistant.components.websocket_api.commands.const.PENDING_MSG_MERGE", 0
+    ):
+        hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+        hass.states.async_set("light.kitchen", "on", {"brightness": 200})
+        hass.states.async_remove("light.hallway")
+        hass.states.async_set("light.bedroom", "on")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.kitchen": {
+                "a": {"brightness": 200},
+                "c": ANY,
+                "lc": ANY,
+                "lu": ANY,
+                "s": "on",
+            },
+            "light.bedroom": {"a": {}, "c": ANY, "lc": ANY, "s": "on"},
+        },
+        "r": ["light.hallway"],
+    }
+    assert hass.data[const.DATA_MERGED_MESSAGES] == 4
+
+    # Changes are sent as diffs again once the client caught up
+    hass.states.async_set("light.kitchen", "off", {"brightness": 200})
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["c"]["light.kitchen"]["+"]["s"] == "off"
+
+
+async def test_subscribe_entities_merge_pending_removals(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test merged changes with only removed entities."""
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.hallway", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "merge_pending_changes": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.kitchen", "light.hallway"}
+
+    with patch(
+        "homeassistant.components.websocket_api.commands.const.PENDING_MSG_MERGE", 0
+    ):
+        hass.states.async_remove("light.kitchen")
+        hass.states.async_remove("light.hallway")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {"r": ["light.kitchen", "light.hallway"]}
+
+
 async def test_subscribe_unsubscribe_entities_specific_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
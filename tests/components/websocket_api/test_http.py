@@ -3,13 +3,14 @@
 import asyncio
 from datetime import timedelta
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from aiohttp import WSMsgType, WSServerHandshakeError, web
 import pytest
 
 from homeassistant.components.websocket_api import (
     async_register_command,
+    async_response,
     const,
     http,
     websocket_command,
@@ -185,6 +186,50 @@ async def test_delayed_response_handler(
     assert "on closed connection" in caplog.text
 
 
+async def test_wait_for_drain(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test waiting until the pending messages have been written."""
+    pending_after_drain: list[int] = []
+
+    @websocket_command({"type": "drain"})
+    @async_response
+    async def async_drain(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        for idx in range(3):
+            connection.send_event(msg["id"], {"idx": idx})
+        assert connection.pending_message_count() == 3
+        await connection.async_wait_for_drain(0)
+        pending_after_drain.append(connection.pending_message_count())
+        connection.send_result(msg["id"])
+
+    async_register_command(hass, async_drain)
+
+    await websocket_client.send_json({"id": 1, "type": "drain"})
+    for idx in range(3):
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {"idx": idx}
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "result"
+    assert pending_after_drain == [0]
+
+
+async def test_wait_for_drain_after_close(hass: HomeAssistant) -> None:
+    """Test waiting for the messages to drain returns once the writer is done."""
+    handler = http.WebSocketHandler(hass, Mock())
+    handler._message_queue.append(b"{}")
+    waiter = hass.async_create_task(handler.async_wait_for_drain(0))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    handler._writer_done = True
+    handler._release_drain_waiters()
+    await waiter
+    # The writer is done, nothing will be written anymore
+    await handler.async_wait_for_drain(0)
+
+
 async def test_ensure_disconnect_invalid_json(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -0,0 +1,118 @@
+"""Test Websocket API states snapshot module."""
+
+from unittest.mock import patch
+
+from homeassistant.components.websocket_api.snapshot import (
+    CompressedStatesSnapshot,
+    async_subscribe_states_snapshot,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.util.json import json_loads
+
+from tests.typing import WebSocketGenerator
+
+
+def _snapshot_states(snapshot: CompressedStatesSnapshot) -> dict:
+    """Return the states in the snapshot."""
+    return json_loads(b"{" + snapshot.async_get_json() + b"}")
+
+
+def _current_states(hass: HomeAssistant) -> dict:
+    """Return the current compressed states."""
+    return json_loads(
+        b"{"
+        + b",".join(state.as_compressed_state_json for state in hass.states.async_all())
+        + b"}"
+    )
+
+
+async def test_states_snapshot_follows_state_changes(hass: HomeAssistant) -> None:
+    """Test the snapshot is kept up to date with the state machine."""
+    snapshot, unsub = async_subscribe_states_snapshot(hass)
+    with patch(
+        "homeassistant.components.websocket_api.snapshot.SNAPSHOT_CHUNK_SIZE", 2
+    ):
+        for idx in range(5):
+            hass.states.async_set(f"light.light_{idx}", "on", {"idx": idx})
+    assert _snapshot_states(snapshot) == _current_states(hass)
+
+    hass.states.async_set("light.light_1", "off", {"idx": 1})
+    hass.states.async_remove("light.light_3")
+    assert _snapshot_states(snapshot) == _current_states(hass)
+    assert "light.light_3" not in _snapshot_states(snapshot)
+
+    hass.states.async_set("light.light_3", "on")
+    assert _snapshot_states(snapshot) == _current_states(hass)
+    unsub()
+
+
+async def test_states_snapshot_is_shared(hass: HomeAssistant) -> None:
+    """Test the snapshot json is only built again after a state change."""
+    hass.states.async_set("light.kitchen", "on")
+    snapshot, unsub = async_subscribe_states_snapshot(hass)
+    other_snapshot, other_unsub = async_subscribe_states_snapshot(hass)
+    assert snapshot is other_snapshot
+    snapshot_json = snapshot.async_get_json()
+    assert snapshot.async_get_json() is snapshot_json
+
+    hass.states.async_set("light.kitchen", "off")
+    assert snapshot.async_get_json() is not snapshot_json
+    unsub()
+    other_unsub()
+
+
+async def test_states_snapshot_init_message_is_shared(hass: HomeAssistant) -> None:
+    """Test the init message is shared by subscriptions with the same id."""
+    hass.states.async_set("light.kitchen", "on")
+    snapshot, unsub = async_subscribe_states_snapshot(hass)
+    init_message = snapshot.async_get_init_message(b"5")
+    assert json_loads(init_message) == {
+        "id": 5,
+        "type": "event",
+        "event": {"a": _current_states(hass)},
+    }
+    assert snapshot.async_get_init_message(b"5") is init_message
+    assert json_loads(snapshot.async_get_init_message(b"6"))["id"] == 6
+
+    hass.states.async_set("light.kitchen", "off")
+    new_init_message = snapshot.async_get_init_message(b"5")
+    assert new_init_message is not init_message
+    assert json_loads(new_init_message)["event"]["a"] == _current_states(hass)
+    unsub()
+
+
+async def test_states_snapshot_released_with_last_subscription(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the snapshot stops following state changes without subscriptions."""
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    hass.states.async_set("light.kitchen", "on")
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": "subscribe_entities"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    subscription = msg["id"]
+    msg = await client.receive_json()
+    assert msg["event"]["a"]["light.kitchen"]["s"] == "on"
+
+    snapshot, unsub = async_subscribe_states_snapshot(hass)
+    await client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": subscription}
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    # The snapshot is still used by the other subscription
+    other_snapshot, other_unsub = async_subscribe_states_snapshot(hass)
+    assert other_snapshot is snapshot
+    hass.states.async_set("light.kitchen", "off")
+    assert _snapshot_states(snapshot)["light.kitchen"]["s"] == "off"
+
+    unsub()
+    other_unsub()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+    new_snapshot, unsub = async_subscribe_states_snapshot(hass)
+    assert new_snapshot is not snapshot
+    assert _snapshot_states(new_snapshot)["light.kitchen"]["s"] == "off"
+    unsub()
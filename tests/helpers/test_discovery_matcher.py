@@ -0,0 +1,48 @@
+"""Test the discovery matcher helpers."""
+
+from homeassistant.helpers.discovery_matcher import MatcherIndex, PatternIndex
+
+
+def test_pattern_index() -> None:
+    """Test matching exact and wildcard patterns."""
+    index: PatternIndex[str] = PatternIndex()
+    index.add("shelly*", "shelly")
+    index.add("connect", "august_exact")
+    index.add("shelly1-*", "shelly1")
+    index.add("*", "any")
+    index.add("shelly*", "shelly_again")
+    index.add("rachio-???", "rachio")
+
+    assert index.match("shelly1-abc") == ["shelly", "shelly_again", "shelly1", "any"]
+    assert index.match("connect") == ["august_exact", "any"]
+    assert index.match("rachio-abc") == ["any", "rachio"]
+    assert index.match("rachio-abcd") == ["any"]
+
+    index = PatternIndex()
+    index.add("connect", "august")
+    index.add("nest-[0-9]*", "nest")
+    assert index.match("nest-1") == ["nest"]
+    assert not index.match("nest-a")
+    assert not index.match("connected")
+
+
+def test_matcher_index() -> None:
+    """Test values only match when all their fields match."""
+    index: MatcherIndex[str, str] = MatcherIndex()
+    index.add({"name": "awair*"}, "awair")
+    index.add({}, "any")
+    index.add({"name": "bosch shc*", "model": "shc"}, "bosch_shc")
+    index.add({"model": "appletv*"}, "apple_tv")
+
+    assert set(index.fields) == {"name", "model"}
+    assert index.match({"name": "awair element"}) == ["awair", "any"]
+    assert index.match({"name": "bosch shc 1", "model": None}) == ["any"]
+    assert index.match({"name": "bosch shc 1", "model": "shc"}) == [
+        "any",
+        "bosch_shc",
+    ]
+    assert index.match({"name": "living room", "model": "appletv6,2"}) == [
+        "any",
+        "apple_tv",
+    ]
+    assert index.match({"name": "printer"}) == ["any"]
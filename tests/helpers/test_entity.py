@@ -21,6 +21,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
@@ -44,6 +45,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
     mock_integration,
     mock_registry,
 )
@@ -679,6 +681,103 @@ async def test_set_context_expired(hass: HomeAssistant) -> None:
     assert ent._context_set is None
 
 
+async def test_batch_state_writes(hass: HomeAssistant) -> None:
+    """Test state writes in a batch are written together at the end."""
+    context = Context()
+    entities = []
+    for idx in range(3):
+        ent = entity.Entity()
+        ent.hass = hass
+        ent.entity_id = f"hello.world_{idx}"
+        entities.append(ent)
+    entities[0].async_set_context(context)
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with entity.async_batch_state_writes(hass):
+        for ent in entities:
+            ent.async_write_ha_state()
+        entities[1]._attr_state = "on"
+        entities[1].async_write_ha_state()
+        with entity.async_batch_state_writes(hass):
+            entities[2].async_write_ha_state()
+        assert hass.states.async_all() == []
+
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in events] == [
+        "hello.world_0",
+        "hello.world_1",
+        "hello.world_2",
+    ]
+    states = [hass.states.get(ent.entity_id) for ent in entities]
+    assert states[1].state == "on"
+    assert len({state.last_updated for state in states}) == 1
+    assert states[0].context == context
+    assert states[1].context is states[2].context
+    assert states[1].context != context
+
+
+async def test_batch_state_writes_collapse(hass: HomeAssistant) -> None:
+    """Test writes in a batch collapse and reads return the state before it."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_state = "off"
+    ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with entity.async_batch_state_writes(hass):
+        ent._attr_state = "on"
+        ent.async_write_ha_state()
+        assert hass.states.get("hello.world").state == "off"
+        ent._attr_state = "idle"
+        ent.async_write_ha_state()
+        assert hass.states.get("hello.world").state == "off"
+
+    await hass.async_block_till_done()
+    assert hass.states.get("hello.world").state == "idle"
+    assert len(events) == 1
+    assert events[0].data["old_state"].state == "off"
+    assert events[0].data["new_state"].state == "idle"
+
+
+async def test_batch_state_writes_invalid_state(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an invalid state in a batch falls back to unknown with its context."""
+    context = Context()
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "test.test"
+    ent._attr_force_update = True
+    ent._attr_state = "x" * 256
+    ent.async_set_context(context)
+    valid = entity.Entity()
+    valid.hass = hass
+    valid.entity_id = "test.valid"
+
+    with entity.async_batch_state_writes(hass):
+        ent.async_write_ha_state()
+        valid.async_write_ha_state()
+
+    state = hass.states.get("test.test")
+    assert state.state == STATE_UNKNOWN
+    assert state.context is context
+    assert hass.states.get("test.valid").state == STATE_UNKNOWN
+    assert (
+        f"Failed to set state for test.test, fall back to {STATE_UNKNOWN}"
+        in caplog.text
+    )
+
+    # The fallback keeps force_update so the unchanged state is written again
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    with entity.async_batch_state_writes(hass):
+        ent.async_write_ha_state()
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    assert events[0].data["new_state"].state == STATE_UNKNOWN
+
+
 async def test_warn_disabled(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -10,6 +10,7 @@ from unittest.mock import ANY, AsyncMock, Mock, patch
 import pytest
 import voluptuous as vol
 
+from homeassistant import loader
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE, EntityCategory
 from homeassistant.core import (
@@ -28,6 +29,7 @@ from homeassistant.helpers import (
     entity_platform,
     entity_registry as er,
     issue_registry as ir,
+    service,
 )
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity, async_generate_entity_id
@@ -561,6 +563,100 @@ async def test_parallel_updates_sync_platform_updates_in_sequence(
     assert peak_update_count == 1
 
 
+async def test_parallel_service_calls(hass: HomeAssistant) -> None:
+    """Test the parallel service calls limits of an integration and platform."""
+    hass.data[loader.DATA_COMPONENTS]["limited_integration"] = Mock(
+        PARALLEL_SERVICE_CALLS=3
+    )
+    platform = MockPlatform()
+    platform.PARALLEL_SERVICE_CALLS = 2
+    limited_platform = MockEntityPlatform(
+        hass, domain="light", platform_name="limited_integration", platform=platform
+    )
+    other_platform = MockEntityPlatform(
+        hass, domain="light", platform_name="limited_integration", platform=None
+    )
+    calling: list[MockEntity] = []
+    peak_calls = {"limited": 0, "all": 0}
+    release = asyncio.Event()
+
+    async def handle_service(entity: MockEntity, call: ServiceCall) -> None:
+        calling.append(entity)
+        peak_calls["all"] = max(peak_calls["all"], len(calling))
+        peak_calls["limited"] = max(
+            peak_calls["limited"],
+            len([entity for entity in calling if entity.platform is limited_platform]),
+        )
+        await release.wait()
+        calling.remove(entity)
+
+    limited_entities = [
+        MockEntity(entity_id=f"light.limited_{idx}") for idx in range(4)
+    ]
+    other_entities = [MockEntity(entity_id=f"light.other_{idx}") for idx in range(4)]
+    await limited_platform.async_add_entities(limited_entities)
+    await other_platform.async_add_entities(other_entities)
+    limited_platform.async_register_entity_service("hello", {}, handle_service)
+
+    call_task = hass.async_create_task(
+        hass.services.async_call(
+            "limited_integration",
+            "hello",
+            target={"entity_id": "all"},
+            blocking=True,
+        )
+    )
+    for _ in range(10):
+        await asyncio.sleep(0)
+    release.set()
+    await call_task
+
+    assert peak_calls == {"limited": 2, "all": 3}
+    assert not calling
+    latency = service.async_get_entity_service_call_latency(hass)
+    assert latency[("limited_integration", "hello", "limited_integration")].count == 8
+
+
+async def test_skip_refresh_after_service_call(hass: HomeAssistant) -> None:
+    """Test a platform pushing its own state skips the refresh of polling entities."""
+    platform = MockPlatform()
+    platform.REFRESH_AFTER_SERVICE_CALL = False
+    entity_platform = MockEntityPlatform(
+        hass, domain="light", platform_name="push_integration", platform=platform
+    )
+    updated: list[str] = []
+
+    class PollingEntity(MockEntity):
+        """Mock entity that is polled."""
+
+        async def async_update(self) -> None:
+            updated.append(self.entity_id)
+
+    entities = [
+        PollingEntity(entity_id=f"light.light_{idx}", should_poll=True)
+        for idx in range(2)
+    ]
+    await entity_platform.async_add_entities(entities)
+    entity_platform.async_register_entity_service("hello", {}, AsyncMock())
+
+    await hass.services.async_call(
+        "push_integration",
+        "hello",
+        target={"entity_id": [entity.entity_id for entity in entities]},
+        blocking=True,
+    )
+    assert not updated
+
+    entity_platform.refresh_after_service_call = True
+    await hass.services.async_call(
+        "push_integration",
+        "hello",
+        target={"entity_id": [entity.entity_id for entity in entities]},
+        blocking=True,
+    )
+    assert sorted(updated) == ["light.light_0", "light.light_1"]
+
+
 async def test_raise_error_on_update(hass: HomeAssistant) -> None:
     """Test the add entity if they raise an error on update."""
     updates = []
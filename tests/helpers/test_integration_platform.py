@@ -12,7 +12,10 @@ from homeassistant.const import EVENT_COMPONENT_LOADED
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.integration_platform import (
+    async_get_lazy_integration_platforms_report,
+    async_load_lazy_integration_platforms,
     async_process_integration_platforms,
+    async_register_lazy_integration_platforms,
 )
 from homeassistant.setup import ATTR_COMPONENT
 
@@ -288,3 +291,45 @@ async def test_process_integration_platforms_no_integrations(
     await hass.async_block_till_done()
 
     assert len(processed) == 0
+
+
+async def test_lazy_integration_platforms(hass: HomeAssistant) -> None:
+    """Test lazy integration platforms are processed on demand."""
+    loaded_platform = Mock()
+    mock_platform(hass, "loaded.platform_to_check", loaded_platform)
+    hass.config.components.add("loaded")
+    hass.config.components.add("no_platform")
+
+    event_platform = Mock()
+    mock_platform(hass, "event.platform_to_check", event_platform)
+
+    processed = []
+
+    @callback
+    def _process_platform(hass: HomeAssistant, domain: str, platform: Any) -> None:
+        """Process platform."""
+        processed.append((domain, platform))
+
+    async_register_lazy_integration_platforms(
+        hass, "platform_to_check", _process_platform
+    )
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event"})
+    hass.bus.async_fire(EVENT_COMPONENT_LOADED, {ATTR_COMPONENT: "event.sensor"})
+    await hass.async_block_till_done()
+    assert processed == []
+
+    await async_load_lazy_integration_platforms(hass, "platform_to_check")
+    assert sorted(processed, key=lambda item: item[0]) == [
+        ("event", event_platform),
+        ("loaded", loaded_platform),
+    ]
+
+    # Already processed platforms are not imported again
+    processed.clear()
+    await async_load_lazy_integration_platforms(hass, "platform_to_check")
+    assert processed == []
+
+    report = async_get_lazy_integration_platforms_report(hass)
+    assert report["platform_to_check"]["providers"] == 2
+    assert report["platform_to_check"]["imported"] == 2
+    assert set(report["platform_to_check"]["import_times"]) == {"event", "loaded"}
@@ -745,6 +745,28 @@ async def test_extract_entity_ids_from_floor(hass: HomeAssistant) -> None:
     )
 
 
+@pytest.mark.usefixtures("floor_area_mock")
+async def test_extract_entity_ids_after_registry_update(hass: HomeAssistant) -> None:
+    """Test resolved targets are updated when the registries change."""
+    entity_registry = er.async_get(hass)
+    call = ServiceCall("light", "turn_on", {"floor_id": "test-floor"})
+
+    assert {
+        "light.in_area",
+        "light.assigned_to_area",
+    } == await service.async_extract_entity_ids(hass, call)
+
+    entity_registry.async_update_entity("light.no_area", area_id="test-area")
+    entity_registry.async_update_entity(
+        "light.in_area", hidden_by=er.RegistryEntryHider.USER
+    )
+
+    assert {
+        "light.no_area",
+        "light.assigned_to_area",
+    } == await service.async_extract_entity_ids(hass, call)
+
+
 @pytest.mark.usefixtures("label_mock")
 async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     """Test extract_entity_ids method with labels."""
@@ -0,0 +1,141 @@
+"""Test the startup cache."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import startup_cache
+from homeassistant.helpers.startup_cache import DATA_STARTUP_CACHE, StartupCache
+
+
+def test_startup_cache(tmp_path: Path) -> None:
+    """Test files and directory listings are served from the cache."""
+    cache_path = str(tmp_path / "core.startup_cache")
+    integration_dir = tmp_path / "integration"
+    integration_dir.mkdir()
+    manifest_path = integration_dir / "manifest.json"
+    manifest_path.write_text('{"domain": "integration"}')
+
+    cache = StartupCache(cache_path)
+    assert cache.load_json(manifest_path) == {"domain": "integration"}
+    assert cache.listdir(integration_dir) == ["manifest.json"]
+    assert cache.misses == 2
+    cache.save()
+
+    cache = StartupCache(cache_path)
+    manifest = cache.load_json(manifest_path)
+    assert manifest == {"domain": "integration"}
+    manifest["domain"] = "changed"
+    assert cache.load_json(manifest_path) == {"domain": "integration"}
+    assert cache.listdir(integration_dir) == ["manifest.json"]
+    assert cache.hits == 3
+    assert cache.misses == 0
+
+    # Changed files and directories are read again
+    manifest_path.write_text('{"domain": "integration", "version": "1"}')
+    (integration_dir / "sensor.py").touch()
+    cache = StartupCache(cache_path)
+    assert cache.load_json(manifest_path) == {"domain": "integration", "version": "1"}
+    assert sorted(cache.listdir(integration_dir)) == ["manifest.json", "sensor.py"]
+    assert cache.misses == 2
+
+    # The cache is discarded when Home Assistant is updated
+    cache.save()
+    with patch.object(startup_cache, "__version__", "0.0.0"):
+        cache = StartupCache(cache_path)
+        cache.load_json(manifest_path)
+    assert cache.misses == 1
+
+
+def test_startup_cache_drops_unused_entries(tmp_path: Path) -> None:
+    """Test entries that were not used are not saved again."""
+    cache_path = str(tmp_path / "core.startup_cache")
+    first = tmp_path / "first.json"
+    first.write_text("{}")
+    second = tmp_path / "second.json"
+    second.write_text("[]")
+
+    cache = StartupCache(cache_path)
+    cache.load_json(first)
+    cache.load_json(second)
+    cache.save()
+
+    cache = StartupCache(cache_path)
+    cache.load_json(second)
+    cache.save()
+
+    cache = StartupCache(cache_path)
+    assert cache.load_json(first) == {}
+    assert cache.load_json(second) == []
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_startup_cache_package_path(tmp_path: Path) -> None:
+    """Test files in the package are not checked for changes."""
+    cache_path = str(tmp_path / "core.startup_cache")
+    package_path = tmp_path / "site-packages" / "homeassistant"
+    integration_dir = package_path / "components" / "integration"
+    integration_dir.mkdir(parents=True)
+    manifest_path = integration_dir / "manifest.json"
+    manifest_path.write_text('{"domain": "integration"}')
+
+    cache = StartupCache(cache_path, str(package_path))
+    cache.load_json(manifest_path)
+    cache.listdir(integration_dir)
+    cache.save()
+
+    manifest_path.write_text('{"domain": "changed"}')
+    cache = StartupCache(cache_path, str(package_path))
+    with patch.object(os, "stat", wraps=os.stat) as mock_stat:
+        assert cache.load_json(manifest_path) == {"domain": "integration"}
+        assert cache.listdir(integration_dir) == ["manifest.json"]
+    stat_paths = {os.fspath(call.args[0]) for call in mock_stat.call_args_list}
+    assert str(manifest_path) not in stat_paths
+    assert str(integration_dir) not in stat_paths
+    assert cache.hits == 2
+
+    # The files of a source checkout are checked
+    (tmp_path / "site-packages" / ".git").mkdir()
+    cache = StartupCache(cache_path, str(package_path))
+    assert cache.load_json(manifest_path) == {"domain": "changed"}
+    assert cache.misses == 1
+
+
+def test_startup_cache_invalid_file(tmp_path: Path) -> None:
+    """Test an invalid cache file is discarded."""
+    cache_path = tmp_path / "core.startup_cache"
+    cache_path.write_text("not json")
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text("{}")
+
+    cache = StartupCache(str(cache_path))
+    assert cache.load_json(manifest_path) == {}
+    assert cache.misses == 1
+
+
+async def test_startup_cache_saved_when_started(hass: HomeAssistant) -> None:
+    """Test the startup cache is saved once Home Assistant has started."""
+    startup_cache.async_setup(hass)
+    cache = hass.data[DATA_STARTUP_CACHE]
+    await hass.async_add_executor_job(cache.listdir, hass.config.config_dir)
+
+    with (
+        patch.object(cache, "save", wraps=cache.save) as mock_save,
+        patch.object(os, "makedirs"),
+        patch.object(startup_cache, "write_utf8_file") as mock_write,
+    ):
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+
+    assert len(mock_save.mock_calls) == 1
+    assert len(mock_write.mock_calls) == 1
+    # The cache is not used or kept after it was saved
+    assert DATA_STARTUP_CACHE not in hass.data
+    assert not cache._files
+    assert not cache._dirs
+    assert cache.path == os.path.join(
+        hass.config.config_dir, ".storage", "core.startup_cache"
+    )
@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+from pathlib import Path
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -1180,3 +1181,56 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journal(tmpdir: py.path.local) -> None:
+    """Test a journaled store appends changes and replays them on load."""
+    loop = asyncio.get_running_loop()
+    tmp_storage = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=tmp_storage.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [{"id": str(idx)} for idx in range(50)]
+        await store.async_save({"items": list(items), "other": 1})
+        journal_path = store.path + storage.JOURNAL_SUFFIX
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+        snapshot = await hass.async_add_executor_job(Path(store.path).read_text)
+
+        # Update an item, remove an item and add an item
+        items[2] = {"id": "2", "name": "updated"}
+        del items[5]
+        items.append({"id": "50"})
+        await store.async_save({"items": list(items), "other": 1})
+        await store.async_save({"items": list(items), "other": 2})
+
+        assert await hass.async_add_executor_job(Path(store.path).read_text) == snapshot
+        journal = await hass.async_add_executor_job(Path(journal_path).read_bytes)
+        assert len(journal.splitlines()) == 2
+        # An interrupted append is ignored
+        await hass.async_add_executor_job(
+            Path(journal_path).write_bytes, journal + b'{"generation":'
+        )
+
+        expected = {"items": items, "other": 2}
+        assert (
+            await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+            == expected
+        )
+
+        # The final write compacts the journal into a snapshot
+        store.async_delay_save(lambda: {"items": list(items), "other": 2}, 10)
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+        data = json.loads(await hass.async_add_executor_job(Path(store.path).read_text))
+        assert data["data"] == expected
+        assert data["journal_generation"] == 2
+
+        # Records from before the last snapshot are not replayed
+        await hass.async_add_executor_job(Path(journal_path).write_bytes, journal)
+        assert (
+            await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+            == expected
+        )
+
+        await hass.async_stop(force=True)
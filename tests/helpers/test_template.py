@@ -5170,6 +5170,124 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test compiled templates are shared and kept after the templates are gone."""
+    template_string = "{{ 'compiled' ~ ' template' }}"
+    tpl = template.Template(template_string, hass)
+    assert tpl.async_render() == "compiled template"
+    tpl2 = template.Template(template_string, hass)
+    assert tpl2.async_render() == "compiled template"
+    assert tpl2._compiled is tpl._compiled
+
+    del tpl, tpl2
+    tpl3 = template.Template(template_string, hass)
+    assert tpl3.async_render() == "compiled template"
+
+    stats = template.async_get_template_cache_stats(hass)["environments"]["default"]
+    assert stats["compiled"]["misses"] == 1
+    assert stats["compiled"]["hits"] == 2
+    assert stats["bound"]["misses"] == 1
+    assert stats["bound"]["hits"] == 2
+
+
+@pytest.mark.parametrize(
+    ("template_string", "entities"),
+    [
+        ("{{ states('sensor.a') }}", {"sensor.a"}),
+        (
+            "{{ states('sensor.a') | float(0) + states.sensor.b.state | float(0) }}",
+            {"sensor.a", "sensor.b"},
+        ),
+        (
+            "{{ is_state('light.a', 'on') }} {{ state_attr('light.a', 'brightness') }}",
+            {"light.a"},
+        ),
+        ("static {{ 1 + 2 }}", set()),
+        ("{{ states('sensor.a') if is_state('sensor.b', 'on') }}", None),
+        ("{{ is_state('sensor.a', 'on') and is_state('sensor.b', 'on') }}", None),
+        ("{{ states(entity_id) }}", None),
+        ("{{ states.sensor | count }}", None),
+        ("{{ expand('group.a') }}", None),
+        ("{{ now() }}", None),
+        ("{% for state in states %}{{ state }}{% endfor %}", None),
+    ],
+)
+async def test_static_entities(
+    hass: HomeAssistant, template_string: str, entities: set[str] | None
+) -> None:
+    """Test extracting the entities of simple templates."""
+    tpl = template.Template(template_string, hass)
+    static_entities = tpl._async_get_static_entities()
+    assert static_entities == (None if entities is None else frozenset(entities))
+
+
+async def test_render_to_info_static_entities(hass: HomeAssistant) -> None:
+    """Test render info of simple templates matches a collecting render."""
+    hass.states.async_set("sensor.a", "1")
+    template_string = (
+        "{{ states('sensor.a') | float + states('sensor.missing') | float(0) }}"
+    )
+    info = render_to_info(hass, template_string)
+    assert info.result() == 1.0
+    assert info.entities == {"sensor.a", "sensor.missing"}
+    assert info.filter("sensor.a")
+    assert not info.filter("sensor.b")
+    assert info.rate_limit is None
+
+
+async def test_states_view(hass: HomeAssistant) -> None:
+    """Test filters over iterated states only filter the changed states."""
+    template.async_setup(hass)
+    hass.states.async_set("sensor.a", "1.5")
+    hass.states.async_set("sensor.b", "2")
+    hass.states.async_set("light.c", "on")
+    hass.states.async_set("light.d", "off")
+    tmps = [
+        template.Template(source, hass)
+        for source in (
+            "{{ states | selectattr('state', 'eq', 'on') | count }}",
+            "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}",
+            "{{ states.sensor | map(attribute='state') | map('float') | sum }}",
+            "{{ states.sensor | rejectattr('state', 'eq', '2')"
+            " | map(attribute='entity_id') | join(',') }}",
+            "{{ states.sensor | selectattr('state', 'in', ['2']) | list | count }}",
+        )
+    ]
+
+    def _render() -> list[Any]:
+        results = [tmp.async_render() for tmp in tmps]
+        states_view = hass.data.pop(template._STATES_VIEW)
+        assert [tmp.async_render() for tmp in tmps] == results
+        hass.data[template._STATES_VIEW] = states_view
+        return results
+
+    assert _render() == [1, 1, 3.5, "sensor.a", 1]
+
+    with patch.object(
+        template,
+        "_apply_states_filters",
+        wraps=template._apply_states_filters,
+    ) as apply_filters:
+        hass.states.async_set("light.d", "on")
+        assert tmps[1].async_render() == 2
+    assert apply_filters.call_count == 1
+
+    hass.states.async_set("sensor.b", "4.5")
+    assert _render() == [2, 2, 6.0, "sensor.a,sensor.b", 0]
+
+    hass.states.async_remove("sensor.a")
+    hass.states.async_set("sensor.a", "2")
+    assert _render() == [2, 2, 6.5, "sensor.b", 1]
+
+    info = tmps[1].async_render_to_info()
+    assert info.domains == {"light"}
+    assert info.rate_limit == template.DOMAIN_STATES_RATE_LIMIT
+
+    hass.states.async_set("sensor.b", "unknown")
+    with pytest.raises(TemplateError):
+        tmps[2].async_render()
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
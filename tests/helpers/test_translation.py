@@ -11,6 +11,7 @@ from homeassistant import loader
 from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import translation
+from homeassistant.helpers.startup_cache import StartupCache
 from homeassistant.setup import async_setup_component
 
 
@@ -289,7 +290,7 @@ async def test_get_translations_while_loading_components(hass: HomeAssistant) ->
     load_count = 0
 
     def mock_load_translation_files(
-        files: dict[str, dict[str, Any]],
+        files: dict[str, dict[str, Any]], startup_cache: StartupCache | None = None
     ) -> dict[str, dict[str, Any]]:
         """Mock load translation files."""
         nonlocal load_count
@@ -10,6 +10,7 @@ import sys
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import bootstrap, loader, runner
@@ -31,6 +32,7 @@ from .common import (
     MockConfigEntry,
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     get_test_config_dir,
     mock_config_flow,
     mock_integration,
@@ -1174,6 +1176,62 @@ async def test_bootstrap_is_cancellation_safe(
     assert "Error setting up integration cancel_integration" in caplog.text
 
 
+def test_setup_priorities() -> None:
+    """Test domains on the longest dependency chains get the highest priority."""
+    integrations = {
+        "root": Mock(dependencies=[], after_dependencies=[]),
+        "slow_chain": Mock(dependencies=["root"], after_dependencies=[]),
+        "fast": Mock(dependencies=[], after_dependencies=["root", "not_loaded"]),
+        "cycle_a": Mock(dependencies=[], after_dependencies=["cycle_b"]),
+        "cycle_b": Mock(dependencies=[], after_dependencies=["cycle_a"]),
+    }
+    priorities = bootstrap._setup_priorities(
+        {*integrations, "no_integration"},
+        integrations,
+        {"root": 1.0, "slow_chain": 5.0, "fast": 0.5, "cycle_a": 2.0},
+    )
+    assert priorities["root"] == 6.0
+    assert priorities["slow_chain"] == 5.0
+    assert priorities["fast"] == 0.5
+    assert priorities["no_integration"] == 0.0
+    assert priorities["cycle_a"] == 2.0
+
+
+async def test_setup_timings_are_stored(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the setup times are stored for the next startup."""
+    hass_storage[bootstrap.SETUP_TIMINGS_STORAGE_KEY] = {
+        "version": bootstrap.SETUP_TIMINGS_STORAGE_VERSION,
+        "data": {"root": 1.0, "removed": 2.0},
+    }
+    mock_integration(hass, MockModule(domain="root"))
+    mock_integration(hass, MockModule(domain="new"))
+
+    with (
+        patch(
+            "homeassistant.bootstrap.async_get_setup_timings",
+            return_value={"root": 3.0, "new": 0.5},
+        ),
+        patch(
+            "homeassistant.bootstrap.async_setup_multi_components"
+        ) as mock_setup_multi_components,
+    ):
+        await bootstrap._async_set_up_integrations(hass, {"root": {}, "new": {}})
+
+    assert mock_setup_multi_components.mock_calls[-1][1][3]["root"] == 1.0
+    freezer.tick(bootstrap.SETUP_TIMINGS_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass_storage[bootstrap.SETUP_TIMINGS_STORAGE_KEY]["data"] == {
+        "root": 2.0,
+        "removed": 2.0,
+        "new": 0.5,
+    }
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_bootstrap_empty_integrations(hass: HomeAssistant) -> None:
     """Test setting up an empty integrations does not raise."""
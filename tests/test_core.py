@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import array
 import asyncio
+from collections.abc import Callable
 from datetime import datetime, timedelta
 import functools
 import gc
@@ -1169,6 +1170,119 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_indexed_listener(hass: HomeAssistant) -> None:
+    """Test listening to events indexed by entity_id and domain."""
+    old_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    entity_calls = []
+    domain_calls = []
+    entity_ids = {"light.kitchen"}
+    domains = {"switch"}
+
+    @ha.callback
+    def entity_listener(event):
+        """Mock listener."""
+        entity_calls.append(event)
+
+    @ha.callback
+    def domain_listener(event):
+        """Mock listener."""
+        domain_calls.append(event)
+
+    unsub_entity = hass.bus.async_listen_indexed(
+        EVENT_STATE_CHANGED, entity_ids, entity_listener
+    )
+    unsub_domain = hass.bus.async_listen_indexed(
+        EVENT_STATE_CHANGED, domains, domain_listener, by_domain=True
+    )
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == old_count + 2
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.hallway", "on")
+    hass.states.async_set("switch.kitchen", "on")
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in entity_calls] == ["light.kitchen"]
+    assert [event.data["entity_id"] for event in domain_calls] == ["switch.kitchen"]
+
+    # The index is owned by the listener and can change while listening
+    entity_ids.add("light.hallway")
+    domains.add(MATCH_ALL)
+    hass.states.async_set("light.hallway", "off")
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in entity_calls] == [
+        "light.kitchen",
+        "light.hallway",
+    ]
+    assert [event.data["entity_id"] for event in domain_calls] == [
+        "switch.kitchen",
+        "light.hallway",
+    ]
+
+    unsub_entity()
+    unsub_domain()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == old_count
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert len(entity_calls) == 2
+    assert len(domain_calls) == 2
+
+
+async def test_eventbus_indexed_listener_order_and_filter(
+    hass: HomeAssistant,
+) -> None:
+    """Test indexed listeners run in order with the other listeners."""
+    calls = []
+
+    def _listener(name: str) -> Callable[[ha.Event], None]:
+        """Return a listener recording its name."""
+
+        @ha.callback
+        def listener(event: ha.Event) -> None:
+            calls.append(name)
+
+        return listener
+
+    @ha.callback
+    def added_filter(event_data: ha.EventStateChangedData) -> bool:
+        """Filter added entities."""
+        return event_data["old_state"] is None
+
+    unsubs = [
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _listener("first")),
+        hass.bus.async_listen_indexed(
+            EVENT_STATE_CHANGED, {"light.kitchen"}, _listener("entity")
+        ),
+        hass.bus.async_listen(MATCH_ALL, _listener("match_all")),
+        hass.bus.async_listen_indexed(
+            EVENT_STATE_CHANGED,
+            {"light"},
+            _listener("added"),
+            by_domain=True,
+            event_filter=added_filter,
+        ),
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _listener("last")),
+    ]
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+    assert calls == ["first", "entity", "added", "last", "match_all"]
+
+    calls.clear()
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+    assert calls == ["first", "entity", "last", "match_all"]
+
+    for unsub in unsubs:
+        unsub()
+
+
+async def test_eventbus_indexed_listener_unsupported_event(
+    hass: HomeAssistant,
+) -> None:
+    """Test only events with an entity_id can be listened to indexed."""
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_indexed("test", {"light.kitchen"}, lambda event: None)
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1544,6 +1658,40 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting many states in one pass."""
+    hass.states.async_set("light.bowl", "on", {})
+    context = ha.Context()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    failed = hass.states.async_set_many_internal(
+        [
+            ("light.bowl", "off", {}, False, None, None),
+            ("light.kitchen", "on", {"brightness": 255}, False, context, None),
+            ("light.invalid", "x" * 256, {}, False, None, None),
+            ("light.hallway", "off", {}, False, None, None),
+        ],
+        1000.0,
+    )
+    await hass.async_block_till_done()
+
+    assert [entity_id for entity_id, _ in failed] == ["light.invalid"]
+    assert isinstance(failed[0][1], InvalidStateError)
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.kitchen",
+        "light.hallway",
+    ]
+    bowl = hass.states.get("light.bowl")
+    kitchen = hass.states.get("light.kitchen")
+    hallway = hass.states.get("light.hallway")
+    assert bowl.last_updated_timestamp == 1000.0
+    assert kitchen.last_updated_timestamp == 1000.0
+    assert kitchen.context is context
+    assert bowl.context is hallway.context
+    assert hass.states.get("light.invalid") is None
+
+
 async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> None:
     """Test async_set avoids recreating ReadOnly dicts when possible."""
     attrs = {"some_attr": "attr_value"}